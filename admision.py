@@ -0,0 +1,260 @@
+# =====================================================
+# ADMISIÓN DE PDFs (límite de concurrencia + fila acotada + turnos por sesión)
+# En una promoción muchas sesiones desbloquean a la vez: en vez de armar cada
+# PDF en el hilo del script, los PDFs se arman en PDF_CONCURRENTES hilos de baja
+# prioridad (nice, ver prioridad.py). Eso acota cuántos PDFs compiten a la vez, pero
+# no aísla: la lectura gratis corre en el mismo proceso y espera el GIL detrás de
+# ReportLab; para separarlos de verdad, los PDFs van en procesos (trabajadores.py).
+# - Fila acotada (PDF_COLA_MAX): si se llena, el pedido se rechaza al instante.
+# - Equidad: las sesiones se atienden por turnos (round-robin), no por orden de
+#   llegada; cada sesión puede tener como mucho PDF_POR_SESION pedidos en la fila.
+# - Mismo (sesión, clave) dos veces = el mismo trabajo (los reruns no duplican), y
+#   una sesión que pide una clave que otra ya tiene en fila o armándose se suma a
+#   ese trabajo (en una promoción el mismo informe se arma una sola vez).
+# - El trabajo corre con el contexto (contextvars) de quien lo pidió: su span
+#   queda dentro de la traza de esa ejecución del script (ver trazas.py).
+# - coordinar(): trabajos que reparten PDFs en la fila y los esperan (el paquete
+#   ZIP) corren en un hilo propio; en un lugar de la fila esperarían PDFs que
+#   necesitan ese mismo lugar.
+# Simulación: python admision.py [--sesiones 6] [--pedidos 3]
+# =====================================================
+import contextvars
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+from metricas import PROFUNDIDAD_COLA, contador, gauge
+from prioridad import bajar_prioridad
+from trazas import span
+
+PDF_CONCURRENTES = int(os.getenv("PDF_CONCURRENTES", "2"))
+PDF_COLA_MAX = int(os.getenv("PDF_COLA_MAX", "30"))
+PDF_POR_SESION = int(os.getenv("PDF_POR_SESION", "2"))
+PRIORIDAD_PDF = 5  # nice de los hilos de PDFs: la lectura gratis (nice 0) pasa primero
+RETENCION = 15 * 60  # segundos que un PDF terminado espera a que su sesión lo recoja
+
+EN_COLA, EN_CURSO, LISTO, ERROR, RECHAZADO = "en_cola", "en_curso", "listo", "error", "rechazado"
+
+_LOCK = threading.Lock()
+_HAY_TRABAJO = threading.Condition(_LOCK)
+_FILAS = OrderedDict()  # sesión -> deque de trabajos en espera (el orden de las claves es el turno)
+_TRABAJOS = {}  # (sesión, clave) -> Trabajo
+_POR_CLAVE = {}  # clave -> último Trabajo de esa clave (lo comparten las sesiones que la piden)
+_HILOS = []
+_EN_CURSO = 0
+
+RECHAZOS = contador("pdf_admision_rechazos_total", "Pedidos de PDF rechazados por fila llena", ("motivo",))
+ARMANDO = gauge("pdf_admision_en_curso", "PDFs armándose en este momento")
+PROFUNDIDAD_COLA.medir(lambda: sum(len(f) for f in _FILAS.values()), cola="pdfs")
+ARMANDO.medir(lambda: _EN_CURSO)
+
+
+class Trabajo:
+    __slots__ = (
+        "sesion", "clave", "funcion", "args", "contexto", "estado", "resultado", "error", "creado", "fin", "_listo",
+    )
+
+    def __init__(self, sesion: str, clave, funcion, args: tuple):
+        self.sesion = sesion
+        self.clave = clave
+        self.funcion = funcion
+        self.args = args
+        self.contexto = contextvars.copy_context()  # el de quien lo pidió (span padre, etc.)
+        self.estado = EN_COLA
+        self.resultado = None
+        self.error = None
+        self.creado = time.monotonic()
+        self.fin = None
+        self._listo = threading.Event()
+
+    def esperar(self, segundos: float) -> bool:
+        """True si terminó (bien o mal) dentro del plazo."""
+        return self._listo.wait(segundos)
+
+    def terminado(self) -> bool:
+        return self._listo.is_set()
+
+    def posicion(self) -> int:
+        """Cuántos trabajos se atienden antes que este (0 = es el próximo o ya está en curso)."""
+        with _LOCK:
+            fila = _FILAS.get(self.sesion)
+            if self.estado != EN_COLA or fila is None or self not in fila:
+                return 0
+            k = fila.index(self)
+            # en cada vuelta cada sesión con pendientes despacha uno, en el orden de _FILAS
+            antes = sum(min(len(f), k) for f in _FILAS.values())
+            for sesion, f in _FILAS.items():
+                if sesion == self.sesion:
+                    break
+                if len(f) > k:
+                    antes += 1
+            return antes
+
+    def _terminar(self, estado: str, resultado=None, error: str = None) -> None:
+        self.estado, self.resultado, self.error = estado, resultado, error
+        self.fin = time.monotonic()
+        self.funcion = self.args = self.contexto = None  # no retener nombres / fechas más de lo necesario
+        self._listo.set()
+
+
+def _purgar(ahora: float) -> None:
+    for trabajos in (_TRABAJOS, _POR_CLAVE):
+        for k, t in list(trabajos.items()):
+            if t.fin is not None and ahora - t.fin > RETENCION:
+                del trabajos[k]
+
+
+def _siguiente():
+    """Saca el próximo trabajo por turnos (llamar con _LOCK tomado)."""
+    sesion, fila = next(iter(_FILAS.items()))
+    trabajo = fila.popleft()
+    if fila:
+        _FILAS.move_to_end(sesion)  # la sesión vuelve al final de la ronda
+    else:
+        del _FILAS[sesion]
+    return trabajo
+
+
+def _atender() -> None:
+    global _EN_CURSO
+    bajar_prioridad(hilo=True, nivel=PRIORIDAD_PDF)
+    while True:
+        with _HAY_TRABAJO:
+            while not _FILAS:
+                _HAY_TRABAJO.wait()
+            trabajo = _siguiente()
+            trabajo.estado = EN_CURSO
+            _EN_CURSO += 1
+        espera_ms = round((time.monotonic() - trabajo.creado) * 1000, 1)
+        try:
+            resultado = trabajo.contexto.run(_ejecutar, trabajo, espera_ms)
+            trabajo._terminar(LISTO, resultado)
+        except Exception as e:
+            trabajo._terminar(ERROR, error=f"{type(e).__name__}: {e}")
+        finally:
+            with _LOCK:
+                _EN_CURSO -= 1
+
+
+def _ejecutar(trabajo: Trabajo, espera_ms: float):
+    with span("trabajo_pdf", espera_ms=espera_ms, en_curso=_EN_CURSO):
+        return trabajo.funcion(*trabajo.args)
+
+
+def _iniciar_hilos() -> None:
+    # llamar con _LOCK tomado
+    while len(_HILOS) < PDF_CONCURRENTES:
+        hilo = threading.Thread(target=_atender, name=f"pdf-{len(_HILOS) + 1}", daemon=True)
+        hilo.start()
+        _HILOS.append(hilo)
+
+
+def pedir(sesion: str, clave, funcion, *args) -> Trabajo:
+    """
+    Encola funcion(*args) para la sesión y retorna el Trabajo (nunca bloquea).
+    Si la sesión (u otra) ya pidió esa clave, retorna el mismo trabajo (en fila, en curso o
+    listo): sumarse a un trabajo ajeno no ocupa lugar en la fila ni cuenta para el límite por sesión.
+    Un Trabajo en estado RECHAZADO no ocupa lugar: se puede volver a pedir más tarde.
+    """
+    ahora = time.monotonic()
+    with _HAY_TRABAJO:
+        _purgar(ahora)
+        previo = _TRABAJOS.get((sesion, clave))
+        if previo is not None and previo.estado in (EN_COLA, EN_CURSO, LISTO):
+            return previo
+        previo = _POR_CLAVE.get(clave)
+        if previo is not None and previo.estado in (EN_COLA, EN_CURSO, LISTO):
+            _TRABAJOS[(sesion, clave)] = previo
+            return previo
+
+        trabajo = Trabajo(sesion, clave, funcion, args)
+        fila = _FILAS.get(sesion)
+        motivo = None
+        if fila is not None and len(fila) >= PDF_POR_SESION:
+            motivo = "sesion"
+        elif sum(len(f) for f in _FILAS.values()) >= PDF_COLA_MAX:
+            motivo = "cola_llena"
+        if motivo:
+            RECHAZOS.inc(motivo=motivo)
+            trabajo._terminar(RECHAZADO, error=motivo)
+            return trabajo
+
+        _TRABAJOS[(sesion, clave)] = _POR_CLAVE[clave] = trabajo
+        if fila is None:
+            fila = _FILAS[sesion] = deque()
+        fila.append(trabajo)
+        _iniciar_hilos()
+        _HAY_TRABAJO.notify()
+        return trabajo
+
+
+def _coordinar(trabajo: Trabajo) -> None:
+    try:
+        trabajo._terminar(LISTO, trabajo.contexto.run(trabajo.funcion, *trabajo.args))
+    except Exception as e:
+        trabajo._terminar(ERROR, error=f"{type(e).__name__}: {e}")
+
+
+def coordinar(sesion: str, clave, funcion, *args) -> Trabajo:
+    """
+    Como pedir(), pero funcion(*args) corre en un hilo aparte, fuera de los PDF_CONCURRENTES
+    y sin fila: para trabajos que solo piden PDFs con pedir() y juntan los resultados.
+    """
+    with _LOCK:
+        _purgar(time.monotonic())
+        previo = _TRABAJOS.get((sesion, clave))
+        if previo is not None and previo.estado in (EN_COLA, EN_CURSO, LISTO):
+            return previo
+        trabajo = _TRABAJOS[(sesion, clave)] = Trabajo(sesion, clave, funcion, args)
+        trabajo.estado = EN_CURSO
+    threading.Thread(target=_coordinar, args=(trabajo,), name="pdf-coordinador", daemon=True).start()
+    return trabajo
+
+
+def estado_admision() -> dict:
+    with _LOCK:
+        return {
+            "en_curso": _EN_CURSO,
+            "en_cola": sum(len(f) for f in _FILAS.values()),
+            "sesiones_en_cola": len(_FILAS),
+            "hilos": len(_HILOS),
+            "rechazados": int(RECHAZOS.valor(motivo="sesion") + RECHAZOS.valor(motivo="cola_llena")),
+        }
+
+
+def resumen_admision() -> str:
+    e = estado_admision()
+    return (
+        f"🧵 PDFs: {e['en_curso']}/{PDF_CONCURRENTES} armándose · {e['en_cola']} en fila "
+        f"({e['sesiones_en_cola']} sesiones, máx. {PDF_COLA_MAX}) · {e['rechazados']} rechazados"
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simula sesiones pidiendo PDFs a la vez (orden de atención y rechazos).")
+    parser.add_argument("--sesiones", type=int, default=6)
+    parser.add_argument("--pedidos", type=int, default=3, help="pedidos por sesión")
+    parser.add_argument("--segundos", type=float, default=0.05, help="duración de cada 'PDF'")
+    args = parser.parse_args()
+
+    orden = []
+
+    def _pdf_falso(sesion, n):
+        time.sleep(args.segundos)
+        orden.append(f"{sesion}#{n}")
+        return b"%PDF"
+
+    # la primera sesión pide todo de golpe antes que las demás: igual no acapara los hilos
+    trabajos = [pedir(f"s{s}", (s, n), _pdf_falso, f"s{s}", n) for s in range(args.sesiones) for n in range(args.pedidos)]
+    # y todas piden además el mismo informe: se arma una sola vez
+    compartidos = [pedir(f"s{s}", "promo", _pdf_falso, f"s{s}", "promo") for s in range(args.sesiones)]
+    print(resumen_admision())
+    for t in trabajos + compartidos:
+        t.esperar(60)
+    print("Orden de atención:", " ".join(orden))
+    print(f"Informe compartido: {len(compartidos)} sesiones, {len({id(t) for t in compartidos})} trabajo(s)")
+    rechazados = [f"{t.sesion}#{t.clave[1]}({t.error})" for t in trabajos if t.estado == RECHAZADO]
+    print("Rechazados:", " ".join(rechazados) or "ninguno")
@@ -0,0 +1,469 @@
+# =====================================================
+# ALMACÉN COMPARTIDO ENTRE RÉPLICAS (lecturas, PDFs, contadores)
+# Varias réplicas de la app (procesos) sobre el mismo disco ven las mismas
+# entradas y los mismos contadores. Cada entrada puede tener TTL propio.
+# - AlmacenSQLite: un archivo .sqlite3 en modo WAL (escritores concurrentes seguros).
+# - AlmacenArchivos: un archivo por entrada (escritura atómica) y contadores con flock.
+# - AlmacenMemoria: solo este proceso (respaldo si el disco es de solo lectura);
+#   ahí no se guardan PDFs: ya están en cache/pdfs (ver cache_pdf.guardar_pdf).
+# Un backend de red (Redis, HTTP...) solo tiene que implementar la clase Almacen.
+# Se elige con ALMACEN_URL: "sqlite://<ruta.sqlite3>" | "archivos://<directorio>" | "memoria://".
+# Prueba con varios procesos: python almacen.py --procesos 4
+# =====================================================
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ALMACEN_URL_DEFAULT = "sqlite://" + os.path.join(BASE_DIR, "cache", "almacen.sqlite3")
+
+
+class Almacen:
+    """
+    Interfaz común. Valores en bytes; espacio = tipo de dato ("pdf", "lectura"...).
+    ttl en segundos (None = no vence).
+    """
+
+    compartido = True  # False: lo ve solo este proceso (no tiene sentido guardar ahí lo que ya está en disco)
+
+    def get(self, espacio: str, clave: str):
+        raise NotImplementedError
+
+    def put(self, espacio: str, clave: str, valor: bytes, ttl: float = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, espacio: str, clave: str) -> None:
+        raise NotImplementedError
+
+    def incrementar(self, nombre: str, n: int = 1) -> int:
+        """Suma atómica (entre procesos); retorna el valor nuevo."""
+        raise NotImplementedError
+
+    def contador(self, nombre: str) -> int:
+        raise NotImplementedError
+
+    def inicializar_contador(self, nombre: str, valor: int) -> None:
+        """Fija el valor solo si el contador todavía no existe (migraciones)."""
+        raise NotImplementedError
+
+    def limpiar_vencidos(self) -> int:
+        raise NotImplementedError
+
+    def valores(self, espacio: str) -> list:
+        """Todos los valores vigentes de un espacio (para listas chicas, p. ej. los clientes)."""
+        raise NotImplementedError
+
+    # -------------------------
+    # JSON (lecturas calculadas)
+    # -------------------------
+    def get_json(self, espacio: str, clave: str):
+        data = self.get(espacio, clave)
+        return None if data is None else json.loads(data.decode("utf-8"))
+
+    def put_json(self, espacio: str, clave: str, valor, ttl: float = None) -> None:
+        self.put(espacio, clave, json.dumps(valor, ensure_ascii=False).encode("utf-8"), ttl)
+
+    def valores_json(self, espacio: str) -> list:
+        return [json.loads(v.decode("utf-8")) for v in self.valores(espacio)]
+
+
+def _vence(ttl):
+    return None if ttl is None else time.time() + ttl
+
+
+# =====================================================
+# SQLITE
+# =====================================================
+class AlmacenSQLite(Almacen):
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()  # una conexión por hilo (y por proceso)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entradas ("
+                " espacio TEXT NOT NULL, clave TEXT NOT NULL, valor BLOB NOT NULL, vence REAL,"
+                " PRIMARY KEY (espacio, clave))"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS contadores (nombre TEXT PRIMARY KEY, valor INTEGER NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, espacio, clave):
+        row = self._conn().execute(
+            "SELECT valor, vence FROM entradas WHERE espacio = ? AND clave = ?", (espacio, clave)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] < time.time():
+            self.delete(espacio, clave)
+            return None
+        return bytes(row[0])
+
+    def put(self, espacio, clave, valor, ttl=None):
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO entradas (espacio, clave, valor, vence) VALUES (?, ?, ?, ?)",
+                (espacio, clave, sqlite3.Binary(valor), _vence(ttl)),
+            )
+        except sqlite3.OperationalError:
+            # En Streamlit Cloud a veces el FS es de solo lectura
+            pass
+
+    def delete(self, espacio, clave):
+        try:
+            self._conn().execute("DELETE FROM entradas WHERE espacio = ? AND clave = ?", (espacio, clave))
+        except sqlite3.OperationalError:
+            pass
+
+    def incrementar(self, nombre, n=1):
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")  # toma el lock de escritura antes de leer
+            try:
+                conn.execute(
+                    "INSERT INTO contadores (nombre, valor) VALUES (?, ?)"
+                    " ON CONFLICT(nombre) DO UPDATE SET valor = valor + excluded.valor",
+                    (nombre, n),
+                )
+                valor = conn.execute("SELECT valor FROM contadores WHERE nombre = ?", (nombre,)).fetchone()[0]
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.OperationalError:
+            return self.contador(nombre)
+        return valor
+
+    def contador(self, nombre):
+        row = self._conn().execute("SELECT valor FROM contadores WHERE nombre = ?", (nombre,)).fetchone()
+        return row[0] if row else 0
+
+    def inicializar_contador(self, nombre, valor):
+        try:
+            self._conn().execute("INSERT OR IGNORE INTO contadores (nombre, valor) VALUES (?, ?)", (nombre, valor))
+        except sqlite3.OperationalError:
+            pass
+
+    def limpiar_vencidos(self):
+        try:
+            cur = self._conn().execute("DELETE FROM entradas WHERE vence IS NOT NULL AND vence < ?", (time.time(),))
+            return cur.rowcount
+        except sqlite3.OperationalError:
+            return 0
+
+    def valores(self, espacio):
+        try:
+            rows = self._conn().execute(
+                "SELECT valor FROM entradas WHERE espacio = ? AND (vence IS NULL OR vence >= ?) ORDER BY clave",
+                (espacio, time.time()),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [bytes(r[0]) for r in rows]
+
+
+# =====================================================
+# SISTEMA DE ARCHIVOS
+# =====================================================
+class AlmacenArchivos(Almacen):
+    """
+    directorio/<espacio>/<sha>.bin con una primera línea "vence\\n" (vacía = no vence).
+    Escritura: archivo temporal + os.replace (atómico); el último escritor gana.
+    Contadores con flock (en Windows no hay flock: usar un solo proceso o SQLite).
+    """
+
+    def __init__(self, directorio: str):
+        self.directorio = directorio
+        os.makedirs(os.path.join(directorio, "_contadores"), exist_ok=True)
+
+    def _ruta(self, espacio: str, clave: str) -> str:
+        h = hashlib.sha256(clave.encode("utf-8")).hexdigest()[:40]
+        return os.path.join(self.directorio, espacio, f"{h}.bin")
+
+    def get(self, espacio, clave):
+        ruta = self._ruta(espacio, clave)
+        try:
+            with open(ruta, "rb") as f:
+                vence = f.readline().strip()
+                if vence and float(vence) < time.time():
+                    self.delete(espacio, clave)
+                    return None
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, espacio, clave, valor, ttl=None):
+        ruta = self._ruta(espacio, clave)
+        tmp = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        vence = _vence(ttl)
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(b"" if vence is None else repr(vence).encode("ascii"))
+                f.write(b"\n")
+                f.write(valor)
+            os.replace(tmp, ruta)
+        except:
+            # En Streamlit Cloud a veces el FS es de solo lectura
+            pass
+
+    def delete(self, espacio, clave):
+        try:
+            os.remove(self._ruta(espacio, clave))
+        except OSError:
+            pass
+
+    def _ruta_contador(self, nombre: str) -> str:
+        h = hashlib.sha256(nombre.encode("utf-8")).hexdigest()[:40]
+        return os.path.join(self.directorio, "_contadores", h)
+
+    def _modificar_contador(self, nombre: str, fn) -> int:
+        ruta = self._ruta_contador(nombre)
+        try:
+            fd = os.open(ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            return self.contador(nombre)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            with os.fdopen(os.dup(fd), "r+") as f:
+                txt = f.read().strip()
+                actual = int(txt) if txt else None
+                nuevo = fn(actual)
+                if nuevo != actual:
+                    f.seek(0)
+                    f.write(str(nuevo))
+                    f.truncate()
+                    f.flush()
+            return nuevo
+        finally:
+            os.close(fd)  # libera el flock
+
+    def incrementar(self, nombre, n=1):
+        return self._modificar_contador(nombre, lambda v: (v or 0) + n)
+
+    def contador(self, nombre):
+        try:
+            with open(self._ruta_contador(nombre), encoding="utf-8") as f:
+                txt = f.read().strip()
+            return int(txt) if txt else 0
+        except (OSError, ValueError):
+            return 0
+
+    def inicializar_contador(self, nombre, valor):
+        self._modificar_contador(nombre, lambda v: valor if v is None else v)
+
+    def limpiar_vencidos(self):
+        borrados = 0
+        ahora = time.time()
+        for raiz, _, archivos in os.walk(self.directorio):
+            for a in archivos:
+                if not a.endswith(".bin"):
+                    continue
+                ruta = os.path.join(raiz, a)
+                try:
+                    with open(ruta, "rb") as f:
+                        vence = f.readline().strip()
+                    if vence and float(vence) < ahora:
+                        os.remove(ruta)
+                        borrados += 1
+                except (OSError, ValueError):
+                    continue
+        return borrados
+
+    def valores(self, espacio):
+        directorio = os.path.join(self.directorio, espacio)
+        try:
+            nombres = sorted(os.listdir(directorio))
+        except OSError:
+            return []
+        valores = []
+        ahora = time.time()
+        for a in nombres:
+            if not a.endswith(".bin"):
+                continue
+            try:
+                with open(os.path.join(directorio, a), "rb") as f:
+                    vence = f.readline().strip()
+                    if not vence or float(vence) >= ahora:
+                        valores.append(f.read())
+            except (OSError, ValueError):
+                continue
+        return valores
+
+
+# =====================================================
+# MEMORIA (un solo proceso)
+# =====================================================
+class AlmacenMemoria(Almacen):
+    compartido = False
+
+    def __init__(self):
+        self._entradas = {}
+        self._contadores = {}
+        self._lock = threading.Lock()
+
+    def get(self, espacio, clave):
+        with self._lock:
+            par = self._entradas.get((espacio, clave))
+            if par is None:
+                return None
+            if par[1] is not None and par[1] < time.time():
+                del self._entradas[(espacio, clave)]
+                return None
+            return par[0]
+
+    def put(self, espacio, clave, valor, ttl=None):
+        with self._lock:
+            self._entradas[(espacio, clave)] = (bytes(valor), _vence(ttl))
+
+    def delete(self, espacio, clave):
+        with self._lock:
+            self._entradas.pop((espacio, clave), None)
+
+    def incrementar(self, nombre, n=1):
+        with self._lock:
+            self._contadores[nombre] = self._contadores.get(nombre, 0) + n
+            return self._contadores[nombre]
+
+    def contador(self, nombre):
+        return self._contadores.get(nombre, 0)
+
+    def inicializar_contador(self, nombre, valor):
+        with self._lock:
+            self._contadores.setdefault(nombre, valor)
+
+    def limpiar_vencidos(self):
+        ahora = time.time()
+        with self._lock:
+            vencidas = [k for k, (_, v) in self._entradas.items() if v is not None and v < ahora]
+            for k in vencidas:
+                del self._entradas[k]
+        return len(vencidas)
+
+    def valores(self, espacio):
+        ahora = time.time()
+        with self._lock:
+            return [
+                valor for (e, _), (valor, vence) in sorted(self._entradas.items())
+                if e == espacio and (vence is None or vence >= ahora)
+            ]
+
+
+# =====================================================
+# ALMACÉN DEL PROCESO
+# =====================================================
+def crear_almacen(url: str) -> Almacen:
+    esquema, _, ruta = url.partition("://")
+    if esquema == "sqlite":
+        return AlmacenSQLite(ruta)
+    if esquema == "archivos":
+        return AlmacenArchivos(ruta)
+    if esquema == "memoria":
+        return AlmacenMemoria()
+    raise ValueError(f"Backend de almacén no soportado: {esquema!r} (usa sqlite://, archivos:// o memoria://)")
+
+
+_ALMACEN = None
+_LOCK = threading.Lock()
+
+
+def almacen() -> Almacen:
+    """Instancia única por proceso, según ALMACEN_URL (por defecto SQLite en cache/)."""
+    global _ALMACEN
+    if _ALMACEN is None:
+        with _LOCK:
+            if _ALMACEN is None:
+                try:
+                    _ALMACEN = crear_almacen(os.getenv("ALMACEN_URL", ALMACEN_URL_DEFAULT))
+                except (OSError, sqlite3.Error):
+                    # En Streamlit Cloud a veces el FS es de solo lectura
+                    _ALMACEN = AlmacenMemoria()
+    return _ALMACEN
+
+
+# =====================================================
+# PRUEBA CON VARIOS PROCESOS
+# =====================================================
+def _trabajador(url: str, idx: int, vueltas: int) -> None:
+    a = crear_almacen(url)
+    for i in range(vueltas):
+        a.incrementar("prueba")
+        a.put("prueba", f"{idx}-{i}", f"{idx}:{i};".encode() * 100)
+        a.put("prueba", "compartida", f"{idx}:{i};".encode() * 100)  # todos pisan la misma clave
+        v = a.get("prueba", "compartida")
+        # nunca una mezcla de dos escritores
+        assert v is not None and len(set(v.split(b";")[:-1])) == 1
+
+
+def probar_procesos(url: str, procesos: int = 4, vueltas: int = 200) -> dict:
+    """N procesos escriben y cuentan a la vez; verifica que no se pierda nada."""
+    import multiprocessing
+
+    ps = [multiprocessing.Process(target=_trabajador, args=(url, i, vueltas)) for i in range(procesos)]
+    t = time.perf_counter()
+    for p in ps:
+        p.start()
+    for p in ps:
+        p.join()
+    seg = time.perf_counter() - t
+
+    a = crear_almacen(url)
+    fallas = [p.exitcode for p in ps if p.exitcode != 0]
+    total = a.contador("prueba")
+    faltantes = sum(
+        a.get("prueba", f"{i}-{j}") != f"{i}:{j};".encode() * 100
+        for i in range(procesos) for j in range(vueltas)
+    )
+    a.put("prueba", "efimera", b"x", ttl=0.05)
+    time.sleep(0.1)
+    return {
+        "url": url,
+        "segundos": round(seg, 2),
+        "contador": total,
+        "esperado": procesos * vueltas,
+        "entradas_faltantes": faltantes,
+        "procesos_con_error": fallas,
+        "ttl_ok": a.get("prueba", "efimera") is None,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Prueba el almacén compartido con varios procesos.")
+    parser.add_argument("--procesos", type=int, default=4)
+    parser.add_argument("--vueltas", type=int, default=200)
+    args = parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as d:
+        for url in (f"sqlite://{os.path.join(d, 'prueba.sqlite3')}", f"archivos://{os.path.join(d, 'archivos')}"):
+            r = probar_procesos(url, args.procesos, args.vueltas)
+            bien = (
+                r["contador"] == r["esperado"] and not r["entradas_faltantes"]
+                and not r["procesos_con_error"] and r["ttl_ok"]
+            )
+            ok &= bien
+            print(("✅ " if bien else "❌ ") + json.dumps(r, ensure_ascii=False))
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,183 @@
+# =====================================================
+# ANALÍTICA DE COHORTES SOBRE EL HISTORIAL DE LECTURAS
+# (el historial lo escribe historial.registrar_lectura, en el almacén compartido:
+#  la analítica ve las lecturas de todas las réplicas)
+# - AnaliticaCohortes: distribuciones de cada concepto de calcular_todo
+#   (total, por década de nacimiento, por año personal), con np.bincount
+#   y actualización incremental (solo procesa las filas nuevas del historial).
+# - Una sola instancia por proceso, compartida por las sesiones: actualizar() va con lock.
+# - Los conceptos del año (año personal, meses...) se calculan con el año en que
+#   se hizo cada lectura (timestamp de la fila), no con el año en curso.
+# =====================================================
+import threading
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from contenido_diario import al_cambiar_dia, hoy
+from historial import LectorHistorial
+from indice import CONCEPTOS_FECHA
+from motor import POSICION, calcular_lectura, calcular_todo
+
+MAX_VALOR = 256  # los valores del motor son < 256 (años importantes: hasta 40 letras x 5)
+DECADA_MIN = 1900
+N_DECADAS = 15  # 1900..2040
+N_ANO_PERSONAL = 34  # 1..33
+
+
+def _conceptos_numericos():
+    muestra = calcular_todo("Eugenia Mystikos", date(1990, 1, 1))
+    return [
+        (concepto, etiqueta)
+        for (concepto, etiqueta, valor, _) in muestra["items"]
+        if not isinstance(valor, str)
+    ]
+
+
+def _anio_de(timestamp: str):
+    """Año de la lectura según el timestamp del historial (None si no se puede leer)."""
+    try:
+        return datetime.fromisoformat(timestamp).year
+    except (TypeError, ValueError):
+        return None
+
+
+class AnaliticaCohortes:
+    def __init__(self):
+        self.conceptos = _conceptos_numericos()
+        self.col = {c: j for j, (c, _) in enumerate(self.conceptos)}
+        self.posiciones = [POSICION[c] for c, _ in self.conceptos]  # columna j -> lugar en Lectura.valores
+        self.depende_nombre = np.array([c not in CONCEPTOS_FECHA for c, _ in self.conceptos])
+        self.j_ano_personal = self.col["año personal"]
+        self.anio = hoy().year  # año en curso al crearla (ver _nuevo_dia)
+        self._lock = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        n = len(self.conceptos)
+        self.lector = LectorHistorial()
+        self.lecturas = 0
+        self.por_tipo = {}
+        self.total = np.zeros((n, MAX_VALOR), dtype=np.int64)
+        self.sin_valor = np.zeros(n, dtype=np.int64)
+        self.por_decada = np.zeros((n, N_DECADAS, MAX_VALOR), dtype=np.int64)
+        self.por_ano_personal = np.zeros((n, N_ANO_PERSONAL, MAX_VALOR), dtype=np.int64)
+
+    # -------------------------
+    # CARGA INCREMENTAL
+    # -------------------------
+    def actualizar(self) -> int:
+        """Lee solo lo agregado al historial desde la última vez. Retorna cuántas filas nuevas procesó."""
+        with self._lock:  # varias sesiones de Streamlit a la vez sobre los mismos contadores
+            filas = self.lector.nuevas()
+            if filas is None:
+                # el historial se vació o se reemplazó: recalcular desde cero
+                self.reiniciar()
+                filas = self.lector.nuevas() or []
+
+            registros = []
+            for row in filas:
+                if len(row) < 4:
+                    continue
+                try:
+                    fecha = date.fromisoformat(row[3])
+                except (TypeError, ValueError):
+                    continue
+                registros.append((row[1], row[2], fecha, _anio_de(row[0])))
+
+            self.agregar(registros)
+            return len(registros)
+
+    def agregar(self, registros) -> None:
+        """registros: lista de (tipo, nombre, fecha_nac, año de la lectura o None = el actual)."""
+        if not registros:
+            return
+        n_conc = len(self.conceptos)
+        valores = np.full((len(registros), n_conc), -1, dtype=np.int32)
+        decadas = np.empty(len(registros), dtype=np.int32)
+
+        for i, (tipo, nombre, fecha, anio) in enumerate(registros):
+            self.por_tipo[tipo] = self.por_tipo.get(tipo, 0) + 1
+            fila = valores[i]
+            lectura = calcular_lectura(nombre, fecha, anio).valores
+            for j, p in enumerate(self.posiciones):
+                if lectura[p] is not None:
+                    fila[j] = lectura[p]
+            if not nombre.strip():
+                # lectura sin nombre: los conceptos del nombre no aplican
+                fila[self.depende_nombre] = -1
+            decadas[i] = fecha.year // 10 * 10
+
+        decadas = np.clip((decadas - DECADA_MIN) // 10, 0, N_DECADAS - 1)
+        ap = np.clip(valores[:, self.j_ano_personal], 0, N_ANO_PERSONAL - 1)
+        self.lecturas += len(registros)
+
+        for j in range(n_conc):
+            col = valores[:, j]
+            ok = (col >= 0) & (col < MAX_VALOR)
+            self.sin_valor[j] += int((~ok).sum())
+            v = col[ok]
+            self.total[j] += np.bincount(v, minlength=MAX_VALOR)
+            self.por_decada[j] += np.bincount(
+                decadas[ok] * MAX_VALOR + v, minlength=N_DECADAS * MAX_VALOR
+            ).reshape(N_DECADAS, MAX_VALOR)
+            self.por_ano_personal[j] += np.bincount(
+                ap[ok] * MAX_VALOR + v, minlength=N_ANO_PERSONAL * MAX_VALOR
+            ).reshape(N_ANO_PERSONAL, MAX_VALOR)
+
+    # -------------------------
+    # TABLAS (pandas, para mostrar en el panel)
+    # -------------------------
+    def _numeros_usados(self, j: int) -> np.ndarray:
+        return np.flatnonzero(self.total[j])
+
+    def tabla_total(self, concepto: str):
+        j = self.col[concepto]
+        nums = self._numeros_usados(j)
+        return pd.DataFrame({"Número": nums, "Lecturas": self.total[j, nums]}).set_index("Número")
+
+    def tabla_por_decada(self, concepto: str):
+        j = self.col[concepto]
+        nums = self._numeros_usados(j)
+        filas = np.flatnonzero(self.por_decada[j].sum(axis=1))
+        return pd.DataFrame(
+            self.por_decada[j][np.ix_(filas, nums)],
+            index=[f"{DECADA_MIN + 10 * d}s" for d in filas],
+            columns=nums,
+        )
+
+    def tabla_por_ano_personal(self, concepto: str):
+        j = self.col[concepto]
+        nums = self._numeros_usados(j)
+        filas = np.flatnonzero(self.por_ano_personal[j].sum(axis=1))
+        return pd.DataFrame(
+            self.por_ano_personal[j][np.ix_(filas, nums)],
+            index=[f"Año personal {a}" for a in filas],
+            columns=nums,
+        )
+
+
+_ANALITICA = None
+_LOCK = threading.Lock()
+
+
+def _nuevo_dia(fecha: date) -> None:
+    # las lecturas con timestamp ilegible usan el año en curso: al cambiar el año se recalcula todo
+    global _ANALITICA
+    if _ANALITICA is not None and _ANALITICA.anio != fecha.year:
+        _ANALITICA = None
+
+
+al_cambiar_dia(_nuevo_dia)
+
+
+def analitica_actualizada() -> AnaliticaCohortes:
+    """Instancia única por proceso; cada llamada solo suma las lecturas nuevas."""
+    global _ANALITICA
+    with _LOCK:
+        if _ANALITICA is None:
+            _ANALITICA = AnaliticaCohortes()
+        analitica = _ANALITICA
+    analitica.actualizar()
+    return analitica
@@ -0,0 +1,187 @@
+# =====================================================
+# CACHÉ DE LECTURAS Y PDFs PREMIUM (en el almacén compartido)
+# Una entrada por (nombre, fecha de nacimiento, año): el mismo cliente que vuelve
+# a desbloquear (o el programador que pre-genera el año siguiente) no rearma el PDF,
+# aunque la petición caiga en otra réplica (ver almacen.py).
+# La clave incluye la versión del Diccionario.xlsx: si se editan los textos, se regenera.
+# Entrega: cada réplica tiene además una copia en archivo (cache/pdfs/<clave>.pdf);
+# el PDF se arma directo a ese archivo y la app lo sirve desde ahí al hacer clic,
+# sin tener el documento en memoria por cada sesión premium.
+# =====================================================
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+from datetime import date
+
+from almacen import almacen
+from contenido_diario import por_dia
+from diccionario import version_diccionario
+from metricas import contador
+from motor import _norm_txt, calcular_todo
+from trazas import span
+
+CACHE_PDF_VERSION = 1  # subir si cambia el armado del PDF premium
+TTL_PDF = 400 * 24 * 3600  # un año y algo: cubre la pre-generación de diciembre
+TTL_LECTURA = 400 * 24 * 3600
+TTL_TEMPORALES = 3600  # .tmp de armados interrumpidos
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_PDFS = os.getenv("PDFS_DIR", os.path.join(BASE_DIR, "cache", "pdfs"))
+_DIRECTORIO = None
+
+CONSULTAS_CACHE = contador("cache_pdf_consultas_total", "Pedidos de PDF premium según si estaban en caché", ("resultado",))
+
+
+def clave_pdf(nombre: str, fecha_nac: date, anio: int, tipo: str = "premium") -> str:
+    # calcular_todo da lo mismo con el nombre normalizado (acentos, espacios)
+    partes = [str(CACHE_PDF_VERSION), version_diccionario(), tipo, _norm_txt(nombre), fecha_nac.isoformat(), str(anio)]
+    return hashlib.sha256("|".join(partes).encode("utf-8")).hexdigest()[:32]
+
+
+def leer_pdf(clave: str):
+    return almacen().get("pdf", clave)
+
+
+def guardar_pdf(clave: str, data: bytes) -> None:
+    # en memoria (sin disco compartido) no: el PDF ya está en cache/pdfs, y ahí no ocupa RAM
+    if almacen().compartido:
+        almacen().put("pdf", clave, data, ttl=TTL_PDF)
+
+
+def lectura_cacheada(nombre: str, fecha_nac: date, anio: int) -> dict:
+    """calcular_todo desde el almacén (las tuplas de items vuelven como tuplas)."""
+    clave = f"{_norm_txt(nombre)}|{fecha_nac.isoformat()}|{anio}"
+    with span("calcular_todo", anio=anio) as traza:
+        resultado = almacen().get_json("lectura", clave)
+        if resultado is not None:
+            resultado["items"] = [tuple(it) for it in resultado["items"]]
+            traza.set(cache="hit", conceptos=len(resultado["items"]))
+            return resultado
+        resultado = calcular_todo(nombre, fecha_nac, anio)
+        almacen().put_json("lectura", clave, resultado, ttl=TTL_LECTURA)
+        traza.set(cache="miss", conceptos=len(resultado["items"]))
+    return resultado
+
+
+def directorio_pdfs() -> str:
+    """DIRECTORIO_PDFS, o uno temporal si no se puede escribir ahí (FS de solo lectura)."""
+    global _DIRECTORIO
+    if _DIRECTORIO is None:
+        for d in (DIRECTORIO_PDFS, os.path.join(tempfile.gettempdir(), "numerologia_pdfs")):
+            try:
+                os.makedirs(d, exist_ok=True)
+                if os.access(d, os.W_OK):
+                    _DIRECTORIO = d
+                    break
+            except OSError:
+                continue
+        else:
+            raise OSError("No hay directorio con permiso de escritura para los PDFs")
+    return _DIRECTORIO
+
+
+def ruta_pdf(clave: str) -> str:
+    return os.path.join(directorio_pdfs(), f"{clave}.pdf")
+
+
+@por_dia
+def limpiar_archivos() -> int:
+    """Borra PDFs vencidos y temporales huérfanos (corre solo una vez por día). Retorna cuántos."""
+    borrados = 0
+    ahora = time.time()
+    try:
+        nombres = os.listdir(directorio_pdfs())
+    except OSError:
+        return 0
+    for nombre in nombres:
+        ruta = os.path.join(directorio_pdfs(), nombre)
+        ttl = TTL_PDF if nombre.endswith(".pdf") else TTL_TEMPORALES
+        try:
+            if ahora - os.path.getmtime(ruta) > ttl:
+                os.remove(ruta)
+                borrados += 1
+        except OSError:
+            continue
+    return borrados
+
+
+@por_dia
+def limpiar_almacen() -> int:
+    """Borra del almacén compartido los PDFs y lecturas vencidos (una vez por día). Retorna cuántos."""
+    return almacen().limpiar_vencidos()
+
+
+def archivo_pdf(clave: str):
+    """Ruta del PDF si ya existe (en este disco o en el almacén compartido); si no, None."""
+    limpiar_archivos()
+    limpiar_almacen()
+    ruta = ruta_pdf(clave)
+    try:
+        if time.time() - os.path.getmtime(ruta) < TTL_PDF:
+            return ruta
+    except OSError:
+        pass
+    data = leer_pdf(clave)  # quizá lo armó otra réplica
+    if data is None:
+        return None
+    tmp = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, ruta)
+    return ruta
+
+
+def _armar(clave: str, armar) -> str:
+    """armar(destino) escribe el PDF en destino; se comparte con las demás réplicas vía almacén."""
+    ruta = ruta_pdf(clave)
+    armar(ruta)
+    with span("guardar_pdf", bytes=os.path.getsize(ruta)):
+        with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            guardar_pdf(clave, datos)
+    return ruta
+
+
+def archivo_pdf_premium(nombre: str, fecha_nac: date, anio: int) -> str:
+    """Ruta del PDF premium del año pedido: el archivo existente o uno recién armado."""
+    with span("archivo_pdf_premium", anio=anio) as traza:
+        clave = clave_pdf(nombre, fecha_nac, anio)
+        ruta = archivo_pdf(clave)
+        if ruta is not None:
+            traza.set(cache="hit", bytes=os.path.getsize(ruta))
+            CONSULTAS_CACHE.inc(resultado="hit")
+            return ruta
+
+        from pdf import build_pdf_premium
+
+        resultado = lectura_cacheada(nombre, fecha_nac, anio)
+        ruta = _armar(clave, lambda destino: build_pdf_premium(resultado, destino=destino))
+        traza.set(cache="miss", bytes=os.path.getsize(ruta))
+        CONSULTAS_CACHE.inc(resultado="miss")
+    return ruta
+
+
+def archivo_pdf_multianual(nombre: str, fecha_nac: date, anios: list) -> str:
+    """Ruta del pronóstico de varios años consecutivos (anios[0]..anios[-1])."""
+    clave = clave_pdf(nombre, fecha_nac, anios[0], tipo=f"multianual{len(anios)}")
+    ruta = archivo_pdf(clave)
+    if ruta is not None:
+        return ruta
+
+    from motor import calcular_varios_anos
+    from pdf import build_pdf_premium_multianual
+
+    resultado = calcular_varios_anos(nombre, fecha_nac, anios)
+    return _armar(clave, lambda destino: build_pdf_premium_multianual(resultado, destino=destino))
+
+
+def leer_archivo(ruta: str) -> bytes:
+    with open(ruta, "rb") as f:
+        return f.read()
+
+
+def pdf_premium_cacheado(nombre: str, fecha_nac: date, anio: int) -> bytes:
+    """PDF premium del año pedido en bytes (para quien lo necesite en memoria)."""
+    return leer_archivo(archivo_pdf_premium(nombre, fecha_nac, anio))
@@ -0,0 +1,187 @@
+# =====================================================
+# CALENDARIO PERSONAL ANUAL (día / semana / mes personal + arcano semanal)
+# Un solo cálculo vectorizado por año; salida en streaming como .ics o CSV.
+# Uso: python calendario.py 1990-01-01 --nombre "Ana Pérez" --anio 2027 --formato ics --salida mi_anio.ics
+# =====================================================
+import argparse
+import csv
+import hashlib
+import io
+import sys
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from contenido_diario import hoy
+from motor import _norm_txt
+from numerologia import (
+    ano_personal, arcano_de_semana, arcano_micro, lectura_resumida, reducir_numero,
+)
+
+FORMATOS = ("ics", "csv")
+
+# reducir_numero precalculado: en el calendario la suma mayor es 33 + 53 (mes personal + semana ISO)
+REDUCCION = np.array([reducir_numero(n) for n in range(128)], dtype=np.int16)
+
+
+def calendario_anual(fecha_nac: date, anio: int) -> dict:
+    """
+    Retorna arrays (uno por día del año) con fecha, mes/semana/día personal y arcano.
+    Misma lógica que mes_personal / semana_personal / dia_personal / arcano_semanal.
+    """
+    dias = np.arange(f"{anio}-01-01", f"{anio + 1}-01-01", dtype="datetime64[D]")
+    inicio_mes = dias.astype("datetime64[M]")
+    mes = inicio_mes.astype(np.int64) % 12 + 1
+    dia = (dias - inicio_mes.astype("datetime64[D]")).astype(np.int64) + 1
+
+    # Semana ISO: la semana pertenece al año de su jueves (1970-01-01 fue jueves)
+    dow = (dias.astype(np.int64) + 3) % 7  # lunes = 0
+    jueves = dias - dow + 3
+    semana = (jueves - jueves.astype("datetime64[Y]").astype("datetime64[D]")).astype(np.int64) // 7 + 1
+
+    ap = ano_personal(fecha_nac, anio)
+    mp = REDUCCION[ap + mes]
+    return {
+        "fecha": dias,
+        "ano_personal": ap,
+        "mes_personal": mp,
+        "semana_personal": REDUCCION[mp + semana],
+        "dia_personal": REDUCCION[mp + dia],
+        "arcano": arcano_de_semana(semana),
+    }
+
+
+def _filas(cal: dict):
+    # tolist() una vez: convierte a int/date de Python en bloque, no celda por celda
+    fechas = cal["fecha"].astype(object).tolist()
+    return zip(
+        fechas,
+        cal["mes_personal"].tolist(),
+        cal["semana_personal"].tolist(),
+        cal["dia_personal"].tolist(),
+        cal["arcano"].tolist(),
+    )
+
+
+# =========================
+# SALIDA CSV
+# =========================
+def lineas_csv(cal: dict):
+    tmp = io.StringIO()
+    writer = csv.writer(tmp, lineterminator="\n")
+
+    def _linea(valores) -> str:
+        tmp.seek(0)
+        tmp.truncate()
+        writer.writerow(valores)
+        return tmp.getvalue()
+
+    yield _linea(["fecha", "ano_personal", "mes_personal", "semana_personal", "dia_personal", "arcano", "lectura"])
+    ap = cal["ano_personal"]
+    for f, mp, sp, dp, arc in _filas(cal):
+        yield _linea([f.isoformat(), ap, mp, sp, dp, arc, lectura_resumida(dp)])
+
+
+# =========================
+# SALIDA ICS (RFC 5545)
+# =========================
+def _ics_escape(txt: str) -> str:
+    return (
+        txt.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+    )
+
+
+def _ics_fold(linea: str) -> str:
+    # Líneas de máx. 75 octetos; las continuaciones empiezan con un espacio
+    data = linea.encode("utf-8")
+    if len(data) <= 75:
+        return linea + "\r\n"
+    partes = []
+    actual = ""
+    limite = 75
+    for ch in linea:
+        if len((actual + ch).encode("utf-8")) > limite:
+            partes.append(actual)
+            actual = ""
+            limite = 74
+        actual += ch
+    partes.append(actual)
+    return "\r\n ".join(partes) + "\r\n"
+
+
+def uid_calendario(fecha_nac: date, nombre: str = "") -> str:
+    # con solo la fecha, dos clientes nacidos el mismo día pisarían sus eventos al importar
+    huella = hashlib.sha256(_norm_txt(nombre).lower().encode("utf-8")).hexdigest()[:10]
+    return f"{fecha_nac:%Y%m%d}-{huella}"
+
+
+def lineas_ics(cal: dict, uid_base: str = "eugenia-mystikos"):
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield "PRODID:-//Eugenia.Mystikos//Calendario Numerologico//ES\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+
+    # La descripción depende solo de (día personal, arcano): se escapa y pliega una vez por par
+    descripciones = {}
+    for f, mp, sp, dp, arc in _filas(cal):
+        desc = descripciones.get((dp, arc))
+        if desc is None:
+            texto = f"{lectura_resumida(dp)}\n\nArcano semanal {arc}: {arcano_micro(arc)}"
+            desc = descripciones[(dp, arc)] = _ics_fold("DESCRIPTION:" + _ics_escape(texto))
+        d = f.strftime("%Y%m%d")
+        fin = date.fromordinal(f.toordinal() + 1).strftime("%Y%m%d")
+        yield (
+            "BEGIN:VEVENT\r\n"
+            f"UID:{d}-{uid_base}@eugenia-mystikos\r\n"
+            f"DTSTAMP:{stamp}\r\n"
+            f"DTSTART;VALUE=DATE:{d}\r\n"
+            f"DTEND;VALUE=DATE:{fin}\r\n"
+            + _ics_fold(f"SUMMARY:Día personal {dp} · Semana {sp} · Mes {mp}")
+            + desc
+            + "TRANSP:TRANSPARENT\r\n"
+            "END:VEVENT\r\n"
+        )
+    yield "END:VCALENDAR\r\n"
+
+
+def calendario_texto(fecha_nac: date, anio: int, formato: str = "ics", uid_base: str = "eugenia-mystikos") -> str:
+    """Calendario completo como texto (para st.download_button)."""
+    cal = calendario_anual(fecha_nac, anio)
+    lineas = lineas_ics(cal, uid_base) if formato == "ics" else lineas_csv(cal)
+    return "".join(lineas)
+
+
+def escribir_calendario(fecha_nac: date, anio: int, salida, formato: str = "ics", uid_base: str = "eugenia-mystikos") -> int:
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+    cal = calendario_anual(fecha_nac, anio)
+    lineas = lineas_ics(cal, uid_base) if formato == "ics" else lineas_csv(cal)
+    for ln in lineas:
+        salida.write(ln)
+    salida.flush()
+    return len(cal["fecha"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Calendario numerológico personal de un año completo.")
+    parser.add_argument("fecha_nac", help="fecha de nacimiento (AAAA-MM-DD)")
+    parser.add_argument("--nombre", default="", help="nombre completo (entra en el UID de cada evento)")
+    parser.add_argument("--anio", type=int, default=hoy().year)
+    parser.add_argument("--formato", choices=FORMATOS, default="ics")
+    parser.add_argument("--salida", default="-", help="archivo de salida ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    fecha_nac = datetime.strptime(args.fecha_nac, "%Y-%m-%d").date()
+    uid_base = uid_calendario(fecha_nac, args.nombre)
+    if args.salida == "-":
+        escribir_calendario(fecha_nac, args.anio, sys.stdout, args.formato, uid_base)
+    else:
+        # ICS ya trae CRLF propio: newline="" evita que se duplique
+        with open(args.salida, "w", encoding="utf-8", newline="") as f:
+            escribir_calendario(fecha_nac, args.anio, f, args.formato, uid_base)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
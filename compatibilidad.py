@@ -0,0 +1,245 @@
+# =====================================================
+# COMPATIBILIDAD UNO-CONTRA-MUCHOS (RANKING TOP-K)
+# compatibilidad_numero(a, b) = reducir_numero(suma(a) + suma(b)),
+# con suma(f) = día + mes + año. Por eso basta precalcular la suma de cada fecha.
+# =====================================================
+import heapq
+import os
+from array import array
+from datetime import date
+
+import numpy as np
+
+from numerologia import compatibilidad_express_texto, compatibilidad_numero, reducir_numero
+
+# Orden de preferencia por defecto (primero = mejor): maestros y luego 1..9
+PREFERENCIA_DEFAULT = (33, 22, 11, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+
+def suma_fecha(fecha: date) -> int:
+    return fecha.day + fecha.month + fecha.year
+
+
+def puntajes_preferencia(preferencia) -> dict:
+    """
+    Convierte la preferencia en {numero_compatibilidad: puntaje} (mayor = mejor).
+    - Secuencia: el primero es el preferido; los números que no aparecen se excluyen.
+    - Dict: se usa tal cual como puntaje.
+    """
+    if isinstance(preferencia, dict):
+        return {int(k): v for k, v in preferencia.items()}
+    orden = list(preferencia)
+    return {int(n): len(orden) - i for i, n in enumerate(orden)}
+
+
+class PoolCompatibilidad:
+    """
+    Lista de candidatos con la suma de cada fecha precalculada una sola vez,
+    para rankear muchas fechas de referencia contra el mismo grupo.
+    """
+
+    def __init__(self, fechas):
+        self.fechas = list(fechas)
+        self.sumas = array("l", (suma_fecha(f) for f in self.fechas))
+
+    def __len__(self):
+        return len(self.fechas)
+
+    def numeros(self, fecha_ref: date) -> list[int]:
+        """Número de compatibilidad de fecha_ref contra cada candidato (en orden)."""
+        s_ref = suma_fecha(fecha_ref)
+        cache = {}
+        out = []
+        for s in self.sumas:
+            n = cache.get(s)
+            if n is None:
+                n = cache[s] = reducir_numero(s_ref + s)
+            out.append(n)
+        return out
+
+    def top_k(self, fecha_ref: date, k: int = 10, preferencia=PREFERENCIA_DEFAULT) -> list[tuple[int, date, int]]:
+        """
+        Retorna hasta k tuplas (indice, fecha, numero) ordenadas por preferencia.
+        Empates: gana el candidato que aparece antes en la lista.
+        """
+        if k <= 0:
+            return []
+        puntajes = puntajes_preferencia(preferencia)
+        s_ref = suma_fecha(fecha_ref)
+
+        # Las sumas distintas son pocas (una por combinación día+mes+año): se reduce cada una una vez
+        cache = {}
+
+        def _candidatos():
+            for i, s in enumerate(self.sumas):
+                par = cache.get(s)
+                if par is None:
+                    n = reducir_numero(s_ref + s)
+                    par = cache[s] = (puntajes.get(n), n)
+                if par[0] is not None:
+                    yield (par[0], -i, i, par[1])
+
+        mejores = heapq.nlargest(k, _candidatos())
+        return [(i, self.fechas[i], n) for (_, _, i, n) in mejores]
+
+
+def ranking_compatibilidad(fecha_ref: date, candidatos, k: int = 10, preferencia=PREFERENCIA_DEFAULT):
+    """Atajo para una consulta única (sin reutilizar el pool)."""
+    return PoolCompatibilidad(candidatos).top_k(fecha_ref, k, preferencia)
+
+
+def ranking_con_texto(fecha_ref: date, candidatos, k: int = 10, preferencia=PREFERENCIA_DEFAULT):
+    """Igual que ranking_compatibilidad, agregando el texto express de cada número."""
+    return [
+        (i, f, n, compatibilidad_express_texto(n))
+        for (i, f, n) in ranking_compatibilidad(fecha_ref, candidatos, k, preferencia)
+    ]
+
+
+# =====================================================
+# TABLA PRECALCULADA DE CLASES (rango de entrada 1936–2040)
+# fecha -> suma, y suma_a + suma_b -> número de compatibilidad.
+# Se construye una vez, se verifica contra compatibilidad_numero y se guarda en disco.
+# =====================================================
+FECHA_MIN = date(1936, 1, 1)
+FECHA_MAX = date(2040, 12, 31)
+ORD_MIN = FECHA_MIN.toordinal()
+ORD_MAX = FECHA_MAX.toordinal()
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLA_PATH = os.path.join(BASE_DIR, "cache", "compatibilidad_tabla.npz")
+TABLA_VERSION = 1
+
+_TABLA = None
+
+
+def construir_tabla() -> dict:
+    fechas = [date.fromordinal(o) for o in range(ORD_MIN, ORD_MAX + 1)]
+    suma_por_fecha = np.fromiter((suma_fecha(f) for f in fechas), dtype=np.int16, count=len(fechas))
+    suma_min = int(suma_por_fecha.min())
+    suma_max = int(suma_por_fecha.max())
+    par_min = 2 * suma_min
+    numero_por_par = np.array(
+        [reducir_numero(p) for p in range(par_min, 2 * suma_max + 1)], dtype=np.uint8
+    )
+    return {
+        "version": np.array([TABLA_VERSION]),
+        "suma_por_fecha": suma_por_fecha,
+        "par_min": np.array([par_min]),
+        "numero_por_par": numero_por_par,
+    }
+
+
+def verificar_tabla(tabla: dict) -> None:
+    """
+    Equivalencia contra la función original: revisa la suma de cada fecha del rango
+    y, para cada par de clases (sumas), un par de fechas representativas.
+    Lanza ValueError en la primera diferencia.
+    """
+    suma_por_fecha = tabla["suma_por_fecha"]
+    representante = {}
+    for o in range(ORD_MIN, ORD_MAX + 1):
+        f = date.fromordinal(o)
+        s = int(suma_por_fecha[o - ORD_MIN])
+        if s != suma_fecha(f):
+            raise ValueError(f"Suma distinta para {f}: tabla={s} real={suma_fecha(f)}")
+        representante.setdefault(s, f)
+
+    par_min = int(tabla["par_min"][0])
+    numero_por_par = tabla["numero_por_par"]
+    for sa, fa in representante.items():
+        for sb, fb in representante.items():
+            esperado = compatibilidad_numero(fa, fb)
+            obtenido = int(numero_por_par[sa + sb - par_min])
+            if obtenido != esperado:
+                raise ValueError(f"Compatibilidad distinta para {fa} / {fb}: tabla={obtenido} real={esperado}")
+
+
+def cargar_tabla(path: str = TABLA_PATH) -> dict:
+    """Carga la tabla desde disco; si no existe (o es de otra versión) la construye, verifica y guarda."""
+    global _TABLA
+    if _TABLA is not None:
+        return _TABLA
+
+    tabla = None
+    try:
+        with np.load(path) as data:
+            if int(data["version"][0]) == TABLA_VERSION:
+                tabla = {k: data[k] for k in data.files}
+    except (OSError, KeyError, ValueError):
+        tabla = None
+
+    if tabla is None:
+        tabla = construir_tabla()
+        verificar_tabla(tabla)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.savez(path, **tabla)
+        except OSError:
+            # En Streamlit Cloud a veces el FS es de solo lectura
+            pass
+
+    _TABLA = tabla
+    return _TABLA
+
+
+def _indices_fechas(fechas) -> np.ndarray:
+    ords = np.fromiter((f.toordinal() for f in fechas), dtype=np.int64)
+    if ords.size and (ords.min() < ORD_MIN or ords.max() > ORD_MAX):
+        raise ValueError(f"Fechas fuera del rango soportado ({FECHA_MIN} – {FECHA_MAX})")
+    return ords - ORD_MIN
+
+
+def sumas_tabla(fechas) -> np.ndarray:
+    return cargar_tabla()["suma_por_fecha"][_indices_fechas(fechas)].astype(np.int32)
+
+
+def numero_tabla(fecha_a: date, fecha_b: date) -> int:
+    """Mismo resultado que compatibilidad_numero, por indexación en la tabla."""
+    tabla = cargar_tabla()
+    sa, sb = sumas_tabla([fecha_a, fecha_b])
+    return int(tabla["numero_por_par"][sa + sb - int(tabla["par_min"][0])])
+
+
+def texto_tabla(fecha_a: date, fecha_b: date) -> str:
+    return compatibilidad_express_texto(numero_tabla(fecha_a, fecha_b))
+
+
+def matriz_compatibilidad(fechas_a, fechas_b=None) -> np.ndarray:
+    """
+    Matriz (len(a) x len(b)) de números de compatibilidad, uint8.
+    Sin fechas_b: matriz del grupo contra sí mismo (eventos grupales).
+    """
+    tabla = cargar_tabla()
+    sa = sumas_tabla(fechas_a)
+    sb = sa if fechas_b is None else sumas_tabla(fechas_b)
+    return tabla["numero_por_par"][sa[:, None] + sb[None, :] - int(tabla["par_min"][0])]
+
+
+if __name__ == "__main__":
+    # Reconstruye y verifica la tabla en disco: python compatibilidad.py
+    # Solo verificar, sin guardar (CI; sale con 1 si difiere): python compatibilidad.py --verificar
+    # (la tabla en disco si existe; si no, una recién construida)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tabla precalculada de compatibilidad.")
+    parser.add_argument("--verificar", action="store_true", help="verificar sin guardar (la tabla en disco, si existe)")
+    args = parser.parse_args()
+    try:
+        if args.verificar and os.path.exists(TABLA_PATH):
+            with np.load(TABLA_PATH) as data:
+                t = {k: data[k] for k in data.files}
+            if int(t["version"][0]) != TABLA_VERSION:
+                raise ValueError(f"Versión {int(t['version'][0])} en disco, se espera {TABLA_VERSION}")
+        else:
+            t = construir_tabla()
+        verificar_tabla(t)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Tabla {TABLA_PATH}: {e}")
+        raise SystemExit(1)
+    if args.verificar:
+        print(f"Tabla verificada: {TABLA_PATH}")
+    else:
+        os.makedirs(os.path.dirname(TABLA_PATH), exist_ok=True)
+        np.savez(TABLA_PATH, **t)
+        print(f"Tabla verificada y guardada en {TABLA_PATH}")
@@ -0,0 +1,130 @@
+# =====================================================
+# CONTENIDO DEL DÍA (se calcula una vez por día calendario)
+# "Hoy" sale de un solo lugar, en la zona horaria ZONA_HORARIA (IANA, p. ej.
+# America/Argentina/Buenos_Aires; vacío = hora local del servidor).
+# - contenido_del_dia(): mensaje universal, arcano semanal y la tabla del día
+#   (mes / semana / día personal para cada año personal posible).
+# - @por_dia: memoriza cualquier función que dependa de "hoy". Todo lo cacheado
+#   vive en un único dict por fecha: al pasar la medianoche se descarta junto.
+# - al_cambiar_dia(funcion): avisos para cachés que viven en otro lado.
+# =====================================================
+import os
+import threading
+from datetime import date, datetime, timedelta
+from functools import wraps
+
+from numerologia import (
+    arcano_de_semana, dia_personal, mensaje_energia_dia, mes_personal, reducir_numero, semana_personal,
+)
+
+ZONA_HORARIA = os.getenv("ZONA_HORARIA", "")
+MENSAJE_POR_DEFECTO = "Hoy es un día para observar, integrar y no forzar."
+
+_LOCK = threading.Lock()
+_DIA = {"fecha": None, "valores": {}}  # se reemplaza entero al cambiar la fecha
+_AVISOS = []
+
+
+def _zona():
+    if not ZONA_HORARIA:
+        return None
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(ZONA_HORARIA)
+    except Exception:
+        return None  # zona mal escrita o sin tzdata: hora local antes que caerse
+
+
+_TZ = _zona()
+
+
+def ahora() -> datetime:
+    return datetime.now(_TZ)
+
+
+def hoy() -> date:
+    return ahora().date()
+
+
+def segundos_hasta_medianoche() -> float:
+    t = ahora()
+    manana = datetime.combine(t.date() + timedelta(days=1), datetime.min.time(), tzinfo=t.tzinfo)
+    return (manana - t).total_seconds()
+
+
+def al_cambiar_dia(funcion) -> None:
+    """funcion(fecha_nueva) se llama una vez cuando cambia el día (antes de recalcular nada)."""
+    _AVISOS.append(funcion)
+
+
+def _valores_de(fecha: date) -> dict:
+    if _DIA["fecha"] == fecha:
+        return _DIA["valores"]
+    with _LOCK:
+        if _DIA["fecha"] != fecha:
+            anterior = _DIA["fecha"]
+            _DIA["valores"] = {}
+            _DIA["fecha"] = fecha
+            if anterior is not None:
+                for funcion in _AVISOS:
+                    try:
+                        funcion(fecha)
+                    except Exception:
+                        pass
+        return _DIA["valores"]
+
+
+def por_dia(funcion):
+    """Memoriza funcion(*args) hasta la medianoche (los args deben ser hasheables)."""
+
+    @wraps(funcion)
+    def envoltura(*args):
+        valores = _valores_de(hoy())
+        clave = (funcion.__qualname__,) + args
+        try:
+            return valores[clave]
+        except KeyError:
+            valor = valores[clave] = funcion(*args)
+            return valor
+
+    return envoltura
+
+
+def tabla_personal(fecha: date) -> dict:
+    """{año personal: (mes personal, semana personal, día personal)} para esa fecha."""
+    semana = fecha.isocalendar()[1]
+    tabla = {}
+    for ap in sorted({reducir_numero(n) for n in range(1, 100)}):
+        mp = mes_personal(ap, fecha.month)
+        tabla[ap] = (mp, semana_personal(mp, semana), dia_personal(mp, fecha.day))
+    return tabla
+
+
+def calcular_contenido(fecha: date) -> dict:
+    dia_del_ano = fecha.timetuple().tm_yday  # 1..366
+    semana = fecha.isocalendar()[1]
+    return {
+        "fecha": fecha,
+        "dia_del_ano": dia_del_ano,
+        "mensaje_universal": mensaje_energia_dia(dia_del_ano, MENSAJE_POR_DEFECTO),
+        "semana": semana,
+        "arcano_semanal": arcano_de_semana(semana),
+        "personal": tabla_personal(fecha),
+    }
+
+
+@por_dia
+def contenido_del_dia() -> dict:
+    return calcular_contenido(hoy())
+
+
+def personales_de_hoy(ano_p: int) -> tuple:
+    """(mes, semana, día) personal de hoy para un año personal."""
+    contenido = contenido_del_dia()
+    personal = contenido["personal"].get(ano_p)
+    if personal is None:
+        f = contenido["fecha"]
+        mp = mes_personal(ano_p, f.month)
+        personal = (mp, semana_personal(mp, contenido["semana"]), dia_personal(mp, f.day))
+    return personal
@@ -0,0 +1,176 @@
+# =========================
+# DICCIONARIO DESDE EXCEL
+# (cada hoja = concepto; columnas: Numero | Titulo | Texto)
+# Carga perezosa: el índice de hojas se lee de xl/workbook.xml sin abrir el libro,
+# y cada hoja se materializa recién cuando se pide, leyendo en modo read-only
+# (filas en streaming, sin un objeto por celda) y cerrando el archivo al terminar.
+# Por defecto dicc_get lee de los textos compilados (textos.py, un mmap compartido
+# entre procesos); DICC_COMPILADO=0 vuelve a leer el Excel en cada proceso.
+# =========================
+import hashlib
+import os
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DICC_PATH = os.path.join(BASE_DIR, "Diccionario.xlsx")
+DICC_COMPILADO = os.getenv("DICC_COMPILADO", "1") != "0"
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _leer_tabla(ws) -> dict:
+    # asumimos encabezado en fila 1 y datos desde fila 2:
+    tabla = {}
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if not row:
+            continue
+        num = row[0]
+        if num in (None, "", "None"):
+            continue
+        try:
+            num_int = int(num)
+        except:
+            continue
+        titulo = (row[1] if len(row) > 1 else "") or ""
+        texto  = (row[2] if len(row) > 2 else "") or ""
+        tabla[num_int] = {
+            "titulo": str(titulo).strip(),
+            "texto": str(texto).strip()
+        }
+    return tabla
+
+
+class DiccionarioExcel:
+    def __init__(self, path: str):
+        self.path = path
+        self.indice = self._leer_indice()  # nombre de hoja (minúscula) -> posición en el libro
+        self._hojas = {}
+        self._lock = threading.Lock()
+
+    def _leer_indice(self) -> dict:
+        with zipfile.ZipFile(self.path) as z:
+            root = ET.fromstring(z.read("xl/workbook.xml"))
+        nombres = [sh.get("name") for sh in root.iter(f"{_NS_MAIN}sheet")]
+        return {n.strip().lower(): pos for pos, n in enumerate(nombres)}
+
+    def precargar(self, conceptos) -> None:
+        """
+        Materializa de una sola vez (una apertura del libro) las hojas pedidas que falten.
+        Útil antes de armar un PDF que va a consultar muchos conceptos.
+        """
+        claves = {(c or "").strip().lower() for c in conceptos}
+        if all(k in self._hojas or k not in self.indice for k in claves):
+            return
+        with self._lock:
+            pendientes = sorted(
+                (self.indice[k], k) for k in claves if k in self.indice and k not in self._hojas
+            )
+            if not pendientes:
+                return
+            # openpyxl se importa recién aquí: el índice de hojas no lo necesita
+            from openpyxl import load_workbook
+
+            wb = load_workbook(self.path, read_only=True, data_only=True)
+            try:
+                for pos, k in pendientes:
+                    self._hojas[k] = _leer_tabla(wb.worksheets[pos])
+            finally:
+                wb.close()
+
+    def hoja(self, concepto: str) -> dict:
+        key = (concepto or "").strip().lower()
+        tabla = self._hojas.get(key)
+        if tabla is None:
+            if key not in self.indice:
+                return {}
+            self.precargar([key])
+            tabla = self._hojas[key]
+        return tabla
+
+    def materializadas(self) -> int:
+        return len(self._hojas)
+
+
+_VERSIONES = {}  # path -> ((tamaño, mtime), versión)
+
+
+def version_diccionario(path: str = DICC_PATH) -> str:
+    """
+    Cambia cuando se edita el Excel (para invalidar lo que se armó con los textos viejos).
+    Sale del contenido, no de la fecha del archivo: el mismo Excel da la misma versión
+    en cada réplica y después de cada deploy. El hash se recalcula solo si cambia el stat.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "sin-diccionario"
+    firma = (st.st_size, st.st_mtime_ns)
+    guardada = _VERSIONES.get(path)
+    if guardada is not None and guardada[0] == firma:
+        return guardada[1]
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for bloque in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloque)
+    except OSError:
+        return "sin-diccionario"
+    version = h.hexdigest()[:16]
+    _VERSIONES[path] = (firma, version)
+    return version
+
+
+def cargar_diccionario_excel(path: str) -> DiccionarioExcel:
+    return DiccionarioExcel(path)
+
+DICC = cargar_diccionario_excel(DICC_PATH)
+
+
+# =========================
+# BUSCAR TEXTO EN DICCIONARIO
+# =========================
+_COMPILADOS = {"fallo": not DICC_COMPILADO, "textos": None}
+
+
+def textos_compilados(abrir: bool = True):
+    """
+    Los textos compilados de la versión actual del Excel, o None si están desactivados o
+    no se pudieron armar (se usa el Excel). Se guarda el objeto mapeado: textos.textos()
+    se vuelve a llamar solo si cambió la versión del Excel.
+    abrir=False: None si este proceso todavía no los abrió (no compila ni mapea por eso).
+    """
+    if _COMPILADOS["fallo"]:
+        return None
+    t = _COMPILADOS["textos"]
+    if t is not None and t.excel == version_diccionario():
+        return t
+    if t is None and not abrir:
+        return None
+    try:
+        from textos import textos
+
+        t = _COMPILADOS["textos"] = textos()
+        return t
+    except Exception:
+        _COMPILADOS["fallo"] = True
+        return None
+
+
+def precargar_hojas(conceptos) -> None:
+    """Antes de un PDF: con los textos compilados no hay nada que cargar; si no, una lectura del Excel."""
+    if textos_compilados() is None:
+        DICC.precargar(conceptos)
+
+
+def dicc_get(concepto: str, numero: int):
+    """
+    Retorna dict {titulo,texto} o vacío.
+    'concepto' debe coincidir con el nombre de la hoja (en minúscula).
+    """
+    textos = textos_compilados()
+    if textos is not None:
+        return textos.dicc(concepto, numero)
+    tabla = DICC.hoja(concepto)
+    return tabla.get(int(numero), {"titulo": "", "texto": ""})
@@ -0,0 +1,417 @@
+# =====================================================
+# EQUIVALENCIA DEL MOTOR (golden outputs)
+# Antes de reemplazar reducir_*, las funciones del nombre, calcular_todo o
+# personalizar_texto por una versión más rápida: mismas entradas, mismas salidas.
+# Casos: todas las fechas 1940–2040, un corpus de nombres con acentos / ñ / ü /
+# formas NFD / espacios raros, todos los textos del Diccionario.xlsx y el texto
+# extraído de informes premium de una muestra de clientes.
+# - Contra un candidato en vivo: python equivalencia.py --candidato motor_rapido
+#   (módulo con cualquiera de las funciones de OBJETIVOS; las que no tenga no se comparan)
+# - Contra una foto tomada antes del cambio:
+#   python equivalencia.py --guardar golden.pkl.gz     (con el código de referencia)
+#   python equivalencia.py --contra golden.pkl.gz      (después del cambio)
+# Sale con código 1 si hay alguna diferencia (para usar en CI / antes del deploy).
+# =====================================================
+import argparse
+import gzip
+import importlib
+import importlib.util
+import pickle
+import random
+import sys
+import time
+import unicodedata
+from datetime import date, timedelta
+
+import motor
+import numerologia
+
+DESDE = 1940
+HASTA = 2040
+N_NOMBRES = 3000
+N_PDFS = 12
+SEMILLA = 1940
+
+# -------------------------
+# CORPUS DE NOMBRES
+# -------------------------
+NOMBRES = [
+    "José", "María", "Ángel", "Inés", "Raúl", "Óscar", "Begoña", "Iñaki", "Jesús", "Lucía",
+    "Sofía", "Martín", "Nicolás", "Úrsula", "Íñigo", "Zoé", "Noé", "Héctor", "Mónica", "Ramón",
+    "Verónica", "Joaquín", "Andrés", "Ana", "Eugenia", "Juan", "Luis", "Carmen", "Pilar", "Rocío",
+    "Álvaro", "Sebastián", "Dolores", "Concepción", "Agustín", "Belén", "Ximena", "Yolanda", "Wenceslao", "Kevin",
+]
+SEGUNDOS = ["", "", "María", "José", "Luis", "del Carmen", "de los Ángeles", "Antonio", "Inés", "Ignacio"]
+APELLIDOS = [
+    "Pérez", "Núñez", "Muñoz", "Güemes", "Argüello", "Ibáñez", "Peña", "Castañeda", "Gómez", "Fernández",
+    "López", "Martínez", "Sánchez", "Díaz", "Álvarez", "Ortiz", "Rodríguez", "Jiménez", "Ruiz", "Hernández",
+    "de la Fuente", "del Río", "Mac-Kay", "O'Higgins", "Zúñiga", "Echeverría", "Iturriagagoitia", "Vázquez", "Quiñones", "Xirau",
+]
+
+
+def _variante(nombre: str, rnd: random.Random) -> str:
+    # Formas en que llega el mismo nombre desde el formulario
+    r = rnd.random()
+    if r < 0.15:
+        return unicodedata.normalize("NFD", nombre)  # acentos combinados (teclados de Mac / iOS)
+    if r < 0.25:
+        return nombre.upper()
+    if r < 0.32:
+        return nombre.lower()
+    if r < 0.40:
+        return "  " + nombre.replace(" ", "   ") + " "
+    if r < 0.44:
+        return nombre.replace(" ", "\t", 1)
+    return nombre
+
+
+def corpus_nombres(n: int = N_NOMBRES, semilla: int = SEMILLA) -> list:
+    """Nombres completos deterministas (misma semilla, mismo corpus) más casos borde."""
+    rnd = random.Random(semilla)
+    nombres = ["", " ", "Ñ", "Ü", "A", "Y", "Bcdfg", "Aeiou", "María", "José Pérez", "ÁÉÍÓÚ ÑÜ", "Jean-Luc D'Arcy", "Ana2 Gómez!"]
+    while len(nombres) < n:
+        partes = [rnd.choice(NOMBRES), rnd.choice(SEGUNDOS), rnd.choice(APELLIDOS)]
+        if rnd.random() < 0.8:
+            partes.append(rnd.choice(APELLIDOS))
+        nombres.append(_variante(" ".join(p for p in partes if p), rnd))
+    return nombres[:n]
+
+
+def fechas(desde: int = DESDE, hasta: int = HASTA) -> list:
+    d, fin = date(desde, 1, 1), date(hasta, 12, 31)
+    dias = []
+    while d <= fin:
+        dias.append(d)
+        d += timedelta(days=1)
+    return dias
+
+
+# -------------------------
+# CASOS POR FUNCIÓN
+# -------------------------
+def _enteros(params: dict) -> list:
+    # sumas de fecha y de nombre quedan muy por debajo de 20000; más algunos extremos
+    return [(n,) for n in list(range(20000)) + [-1, -11, -78, 99999, 10 ** 12 + 7]]
+
+
+def _anios(params: dict) -> list:
+    return [(y,) for y in range(1, 3001)]
+
+
+def _letras(params: dict) -> list:
+    letras = {ch for nombre in corpus_nombres(params["nombres"]) for ch in nombre}
+    letras.update(chr(c) for c in range(32, 0x250))
+    return [(ch,) for ch in sorted(letras)]
+
+
+def _nombres(params: dict) -> list:
+    return [(nombre,) for nombre in corpus_nombres(params["nombres"])]
+
+
+def _calcular_todo(params: dict) -> list:
+    nombres = corpus_nombres(params["nombres"])
+    anios = range(1990, 2051)
+    return [
+        (nombres[i % len(nombres)], d, anios[i % len(anios)])
+        for i, d in enumerate(fechas(params["desde"], params["hasta"]))
+    ]
+
+
+def textos_diccionario() -> list:
+    from diccionario import DICC
+
+    DICC.precargar(DICC.indice)
+    textos = []
+    for hoja in sorted(DICC.indice):
+        for numero, fila in sorted(DICC.hoja(hoja).items()):
+            for campo in ("titulo", "texto"):
+                if fila.get(campo):
+                    textos.append(fila[campo])
+    return textos
+
+
+def _personalizar(params: dict) -> list:
+    nombres = corpus_nombres(params["nombres"])
+    return [(texto, nombres[i % len(nombres)]) for i, texto in enumerate(textos_diccionario())]
+
+
+# nombre -> (módulo de referencia, generador de casos)
+OBJETIVOS = {
+    "suma_digitos": (motor, _enteros),
+    "reducir_con_maestros": (motor, _enteros),
+    "reducir_estricto_1a9": (motor, _enteros),
+    "reducir_excepcion_10_11": (motor, _enteros),
+    "reducir_a_dos_digitos": (motor, _enteros),
+    "reducir_solo_11_22": (motor, _enteros),
+    "regla_tarot_78": (motor, _enteros),
+    "suma_ano_en_digitos": (motor, _anios),
+    "reducir_numero": (numerologia, _enteros),
+    "valor_letra": (motor, _letras),
+    "_norm_txt": (motor, _nombres),
+    "separar_nombre_apellido": (motor, _nombres),
+    "suma_nombre": (motor, _nombres),
+    "suma_vocales": (motor, _nombres),
+    "suma_consonantes": (motor, _nombres),
+    "contar_letras": (motor, _nombres),
+    "primera_vocal_valor": (motor, _nombres),
+    "primera_consonante_valor": (motor, _nombres),
+    "moda_numeros": (motor, _nombres),
+    "normalizar_texto": (numerologia, _nombres),
+    "numero_nombre": (numerologia, _nombres),
+    "calcular_todo": (motor, _calcular_todo),
+    "personalizar_texto": (motor, _personalizar),
+}
+
+
+def ejecutar(funcion, casos: list) -> list:
+    salidas = []
+    for args in casos:
+        try:
+            salidas.append(funcion(*args))
+        except Exception as e:
+            # una excepción también es una salida: el candidato debe fallar igual
+            salidas.append(("<error>", type(e).__name__))
+    return salidas
+
+
+# -------------------------
+# COMPARACIÓN
+# -------------------------
+def _conceptos(salida) -> dict:
+    """calcular_todo -> {concepto: (etiqueta, valor, nota)} + los campos del nombre."""
+    if not isinstance(salida, dict):
+        return {"<salida>": salida}
+    conceptos = {f"<{k}>": v for k, v in salida.items() if k != "items"}
+    for pos, item in enumerate(salida.get("items", [])):
+        conceptos[item[0] if isinstance(item, tuple) and item else f"<item {pos}>"] = item
+    return conceptos
+
+
+def comparar(nombre: str, casos: list, referencia: list, candidata: list) -> dict:
+    """
+    {"casos", "diferencias", "primeras": {concepto: (args, ref, cand)}}
+    calcular_todo se compara concepto por concepto (primera diferencia de cada uno).
+    """
+    informe = {"casos": len(casos), "diferencias": 0, "primeras": {}}
+    if len(referencia) != len(candidata):
+        informe["diferencias"] = abs(len(referencia) - len(candidata)) or 1
+        informe["primeras"]["<cantidad de casos>"] = (None, len(referencia), len(candidata))
+    for args, ref, cand in zip(casos, referencia, candidata):
+        if ref == cand and type(ref) is type(cand):
+            continue
+        informe["diferencias"] += 1
+        if nombre != "calcular_todo":
+            informe["primeras"].setdefault(nombre, (args, ref, cand))
+            continue
+        c_ref, c_cand = _conceptos(ref), _conceptos(cand)
+        for concepto in list(c_ref) + [c for c in c_cand if c not in c_ref]:
+            a, b = c_ref.get(concepto, "<falta>"), c_cand.get(concepto, "<falta>")
+            if a != b or type(a) is not type(b):
+                informe["primeras"].setdefault(concepto, (args, a, b))
+    return informe
+
+
+# -------------------------
+# TEXTO DE LOS PDFs PREMIUM
+# -------------------------
+def muestra_clientes(n: int = N_PDFS, params: dict = None) -> list:
+    params = params or {"nombres": N_NOMBRES, "desde": DESDE, "hasta": HASTA}
+    rnd = random.Random(SEMILLA + 1)
+    nombres = [x for x in corpus_nombres(params["nombres"]) if motor._solo_letras(x).strip()]
+    dias = fechas(params["desde"], params["hasta"])
+    return [(rnd.choice(nombres), rnd.choice(dias), rnd.choice(range(1990, 2051))) for _ in range(n)]
+
+
+def texto_por_concepto(data: bytes, items: list) -> dict:
+    """Texto extraído del PDF, repartido por sección (el título de cada sección es su etiqueta)."""
+    from io import BytesIO
+
+    from pypdf import PdfReader
+
+    lineas = []
+    for pagina in PdfReader(BytesIO(data)).pages:
+        lineas.extend(ln.strip() for ln in (pagina.extract_text() or "").splitlines() if ln.strip())
+    secciones = {"<portada>": []}
+    actual = "<portada>"
+    pendientes = [(hoja, etiqueta) for (hoja, etiqueta, _, _) in items]
+    for ln in lineas:
+        if pendientes and ln == pendientes[0][1].strip():
+            actual = pendientes.pop(0)[0]
+            secciones[actual] = []
+        secciones[actual].append(ln)
+    return secciones
+
+
+def texto_pdfs(clientes: list, calcular, personalizar) -> list:
+    """Un dict {concepto: líneas} por cliente, armando el PDF con las funciones dadas."""
+    import pdf
+
+    original = pdf.personalizar_texto
+    pdf.personalizar_texto = personalizar
+    try:
+        textos = []
+        for nombre, fecha_nac, anio in clientes:
+            resultado = calcular(nombre, fecha_nac, anio)
+            textos.append(texto_por_concepto(pdf.build_pdf_premium(resultado), resultado["items"]))
+        return textos
+    finally:
+        pdf.personalizar_texto = original
+
+
+def comparar_pdfs(clientes: list, referencia: list, candidata: list) -> dict:
+    informe = {"casos": len(clientes), "diferencias": 0, "primeras": {}}
+    for cliente, ref, cand in zip(clientes, referencia, candidata):
+        if ref == cand:
+            continue
+        informe["diferencias"] += 1
+        for concepto in list(ref) + [c for c in cand if c not in ref]:
+            a, b = ref.get(concepto, []), cand.get(concepto, [])
+            if a == b:
+                continue
+            i = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+            linea_a = a[i] if i < len(a) else "<fin>"
+            linea_b = b[i] if i < len(b) else "<fin>"
+            informe["primeras"].setdefault(concepto, (cliente + (f"línea {i + 1}",), linea_a, linea_b))
+    return informe
+
+
+# -------------------------
+# EJECUCIÓN
+# -------------------------
+def _pypdf_disponible() -> bool:
+    if importlib.util.find_spec("pypdf") is None:
+        print("⚠️ pypdf no está instalado: se omite la comparación del texto de los PDFs (pip install pypdf)")
+        return False
+    return True
+
+
+def salidas_referencia(params: dict, objetivos=OBJETIVOS, pdfs: int = N_PDFS) -> dict:
+    salidas = {}
+    for nombre in objetivos:
+        modulo, generador = OBJETIVOS[nombre]
+        salidas[nombre] = ejecutar(getattr(modulo, nombre), generador(params))
+    if pdfs and _pypdf_disponible():
+        salidas["<pdf>"] = texto_pdfs(muestra_clientes(pdfs, params), motor.calcular_todo, motor.personalizar_texto)
+    return salidas
+
+
+def guardar_golden(path: str, params: dict, pdfs: int = N_PDFS) -> None:
+    foto = {"params": params, "pdfs": pdfs, "salidas": salidas_referencia(params, pdfs=pdfs)}
+    with gzip.open(path, "wb") as f:
+        pickle.dump(foto, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def verificar(candidato, referencia: dict, params: dict, objetivos, pdfs: int) -> dict:
+    """
+    candidato: módulo (o cualquier objeto) con las funciones a probar; las que no tenga
+    se toman de la referencia en vivo. referencia: salidas guardadas, o None para calcularlas ahora.
+    Retorna {objetivo: informe de comparar()}.
+    """
+    informes = {}
+    for nombre in objetivos:
+        funcion = getattr(candidato, nombre, None)
+        if funcion is None:
+            continue
+        modulo, generador = OBJETIVOS[nombre]
+        casos = generador(params)
+        t = time.perf_counter()
+        cand = ejecutar(funcion, casos)
+        t_cand = time.perf_counter() - t
+        if referencia is not None:
+            ref, t_ref = referencia["salidas"][nombre], None
+        else:
+            t = time.perf_counter()
+            ref = ejecutar(getattr(modulo, nombre), casos)
+            t_ref = time.perf_counter() - t
+        informes[nombre] = comparar(nombre, casos, ref, cand)
+        informes[nombre]["segundos"] = (t_ref, t_cand)
+
+    if pdfs and _pypdf_disponible():
+        clientes = muestra_clientes(pdfs, params)
+        calcular = getattr(candidato, "calcular_todo", motor.calcular_todo)
+        personalizar = getattr(candidato, "personalizar_texto", motor.personalizar_texto)
+        if referencia is not None and "<pdf>" in referencia["salidas"]:
+            ref = referencia["salidas"]["<pdf>"][:pdfs]
+        else:
+            ref = texto_pdfs(clientes, motor.calcular_todo, motor.personalizar_texto)
+        informes["<pdf>"] = comparar_pdfs(clientes, ref, texto_pdfs(clientes, calcular, personalizar))
+    return informes
+
+
+def _corto(v, largo: int = 160) -> str:
+    txt = repr(v)
+    return txt if len(txt) <= largo else txt[:largo] + "…"
+
+
+def imprimir(informes: dict) -> int:
+    fallas = 0
+    for nombre, inf in informes.items():
+        tiempos = ""
+        t_ref, t_cand = inf.get("segundos", (None, None))
+        if t_cand is not None:
+            tiempos = f"  ({t_cand:.2f}s" + (f" vs {t_ref:.2f}s referencia)" if t_ref is not None else ")")
+        if not inf["diferencias"]:
+            print(f"✅ {nombre:<26} {inf['casos']:>7} casos{tiempos}")
+            continue
+        fallas += 1
+        print(f"❌ {nombre:<26} {inf['casos']:>7} casos, {inf['diferencias']} con diferencias{tiempos}")
+        for concepto, (args, ref, cand) in inf["primeras"].items():
+            print(f"     {concepto}: entrada {_corto(args)}")
+            print(f"       referencia: {_corto(ref)}")
+            print(f"       candidata:  {_corto(cand)}")
+    return fallas
+
+
+class _CodigoActual:
+    """El código del árbol tal como está (para --contra sin --candidato)."""
+
+    def __getattr__(self, nombre):
+        if nombre in OBJETIVOS:
+            return getattr(OBJETIVOS[nombre][0], nombre)
+        raise AttributeError(nombre)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara las salidas del motor contra una versión candidata.")
+    parser.add_argument("--candidato", help="módulo con las funciones nuevas (p. ej. motor_rapido)")
+    parser.add_argument("--guardar", metavar="ARCHIVO", help="guardar las salidas de referencia (.pkl.gz)")
+    parser.add_argument("--contra", metavar="ARCHIVO", help="comparar contra salidas guardadas con --guardar")
+    parser.add_argument("--solo", help="objetivos separados por coma (por defecto todos)")
+    parser.add_argument("--desde", type=int, default=DESDE)
+    parser.add_argument("--hasta", type=int, default=HASTA)
+    parser.add_argument("--nombres", type=int, default=N_NOMBRES, help="tamaño del corpus de nombres")
+    parser.add_argument("--pdfs", type=int, default=N_PDFS, help="clientes de muestra para comparar el PDF (0 = no)")
+    args = parser.parse_args(argv)
+
+    objetivos = list(OBJETIVOS)
+    if args.solo:
+        objetivos = [o.strip() for o in args.solo.split(",")]
+        desconocidos = [o for o in objetivos if o not in OBJETIVOS]
+        if desconocidos:
+            parser.error(f"objetivos desconocidos: {', '.join(desconocidos)}")
+    params = {"desde": args.desde, "hasta": args.hasta, "nombres": args.nombres}
+
+    if args.guardar:
+        guardar_golden(args.guardar, params, args.pdfs)
+        print(f"Salidas de referencia guardadas en {args.guardar}")
+        return 0
+
+    referencia = None
+    if args.contra:
+        with gzip.open(args.contra, "rb") as f:
+            referencia = pickle.load(f)
+        params = referencia["params"]  # los casos se regeneran igual que al guardar
+        args.pdfs = min(args.pdfs, referencia["pdfs"])
+        candidato = importlib.import_module(args.candidato) if args.candidato else _CodigoActual()
+    elif args.candidato:
+        candidato = importlib.import_module(args.candidato)
+    else:
+        parser.error("indica --candidato, --contra o --guardar")
+
+    fallas = imprimir(verificar(candidato, referencia, params, objetivos, args.pdfs))
+    print("✅ Salidas equivalentes" if not fallas else f"❌ {fallas} objetivo(s) con diferencias")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# =====================================================
+# EXPORTADOR STREAMING (NDJSON / CSV) DE calcular_todo
+# Uso: python exportar.py leads.csv --formato csv --salida resultados.csv
+# =====================================================
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+
+from motor import ESQUEMA, Lectura, calcular_lectura
+
+FORMATOS = ("ndjson", "csv")
+TAMANO_LOTE = 1000  # líneas acumuladas antes de cada escritura en bloque
+FORMATOS_FECHA = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+ETIQUETAS = [etiqueta for (_, etiqueta, _) in ESQUEMA]
+
+
+def columnas_export() -> list[str]:
+    """Encabezado fijo: nombre, fecha y las 60 etiquetas de 'items' en su orden."""
+    return ["nombre_full", "fecha_nac"] + ETIQUETAS
+
+
+def fila_export(lectura: Lectura) -> dict:
+    fila = {
+        "nombre_full": lectura.nombre_full,
+        "fecha_nac": lectura.fecha_nac.strftime("%d/%m/%Y"),
+    }
+    fila.update(zip(ETIQUETAS, lectura.valores))
+    return fila
+
+
+def iter_resultados(registros):
+    # formato compacto: sin armar 60 tuplas (etiqueta, nota...) por persona
+    for nombre_full, fecha_nac in registros:
+        yield fila_export(calcular_lectura(nombre_full, fecha_nac))
+
+
+def lineas_ndjson(registros):
+    for fila in iter_resultados(registros):
+        yield json.dumps(fila, ensure_ascii=False) + "\n"
+
+
+def lineas_csv(registros):
+    # Un único StringIO reutilizado: memoria constante sin importar cuántas filas haya
+    tmp = io.StringIO()
+    writer = csv.writer(tmp, lineterminator="\n")
+
+    def _linea(valores) -> str:
+        tmp.seek(0)
+        tmp.truncate()
+        writer.writerow(["" if v is None else v for v in valores])
+        return tmp.getvalue()
+
+    columnas = columnas_export()
+    yield _linea(columnas)
+    for fila in iter_resultados(registros):
+        yield _linea(fila[c] for c in columnas)
+
+
+def escribir_export(registros, salida, formato: str = "ndjson", tamano_lote: int = TAMANO_LOTE) -> int:
+    """
+    Escribe una línea por registro en 'salida' (archivo de texto abierto).
+    Acumula 'tamano_lote' líneas y las escribe de una vez. Retorna cuántas personas se exportaron.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+
+    lineas = lineas_ndjson(registros) if formato == "ndjson" else lineas_csv(registros)
+    lote = []
+    total = 0
+    for ln in lineas:
+        lote.append(ln)
+        total += 1
+        if len(lote) >= tamano_lote:
+            salida.write("".join(lote))
+            lote.clear()
+    if lote:
+        salida.write("".join(lote))
+    salida.flush()
+
+    # en CSV la primera línea es el encabezado
+    return total - 1 if formato == "csv" and total else total
+
+
+# =========================
+# ENTRADA (CSV: nombre, fecha)
+# =========================
+def parse_fecha(txt: str) -> date:
+    txt = (txt or "").strip()
+    for fmt in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(txt, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Fecha inválida: {txt!r}")
+
+
+def leer_registros(f, errores: list | None = None):
+    """
+    Lee filas 'nombre,fecha' de un CSV (con o sin encabezado).
+    Las filas con fecha inválida se saltan y se anotan en 'errores' (nro de línea).
+    """
+    for nro, row in enumerate(csv.reader(f), start=1):
+        if len(row) < 2:
+            continue
+        if nro == 1 and row[0].strip().lower() in ("nombre", "nombre_full", "name"):
+            continue
+        try:
+            fecha = parse_fecha(row[1])
+        except ValueError:
+            if errores is not None:
+                errores.append(nro)
+            continue
+        yield row[0], fecha
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta calcular_todo por persona en NDJSON o CSV.")
+    parser.add_argument("entrada", nargs="?", default="-", help="CSV con columnas nombre,fecha ('-' = stdin)")
+    parser.add_argument("--formato", choices=FORMATOS, default="ndjson")
+    parser.add_argument("--salida", default="-", help="archivo de salida ('-' = stdout)")
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE, help="líneas por escritura en bloque")
+    args = parser.parse_args(argv)
+
+    errores = []
+    fin = sys.stdin if args.entrada == "-" else open(args.entrada, "r", encoding="utf-8", newline="")
+    fout = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8", newline="")
+    try:
+        total = escribir_export(leer_registros(fin, errores), fout, args.formato, args.lote)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+
+    print(f"Exportados: {total}", file=sys.stderr)
+    if errores:
+        print(f"Filas con fecha inválida (saltadas): {len(errores)} · primeras: {errores[:10]}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# =====================================================
+# FUENTES TTF (DejaVu) PARA LOS PDFs
+# - Se registran una sola vez por proceso (el parseo del .ttf es lo caro); el
+#   objeto de fuente ya parseado lo comparten todos los informes.
+# - En cada PDF ReportLab incrusta un subset con solo los glifos que ese documento usa.
+# - Si DejaVu no está instalada (packages.txt: fonts-dejavu), se usa Helvetica como antes.
+# =====================================================
+import os
+import threading
+
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FUENTE_NORMAL = "EM-DejaVuSans"
+FUENTE_NEGRITA = "EM-DejaVuSans-Bold"
+ARCHIVOS_TTF = {
+    FUENTE_NORMAL: "DejaVuSans.ttf",
+    FUENTE_NEGRITA: "DejaVuSans-Bold.ttf",
+}
+RESPALDO = {
+    FUENTE_NORMAL: "Helvetica",
+    FUENTE_NEGRITA: "Helvetica-Bold",
+}
+DIRECTORIOS_FUENTES = [
+    os.getenv("FUENTES_DIR", ""),
+    os.path.join(BASE_DIR, "fonts"),
+    "/usr/share/fonts/truetype/dejavu",
+    "/usr/share/fonts/dejavu",
+    "/usr/share/fonts/TTF",
+]
+
+_LOCK = threading.Lock()
+_NOMBRES = None  # {FUENTE_NORMAL: nombre efectivo, FUENTE_NEGRITA: nombre efectivo}
+_SOPORTADOS = {}  # nombre efectivo -> frozenset de code points con glifo
+
+
+def _buscar_ttf(archivo: str):
+    for d in DIRECTORIOS_FUENTES:
+        if d:
+            ruta = os.path.join(d, archivo)
+            if os.path.isfile(ruta):
+                return ruta
+    return None
+
+
+def registrar_fuentes() -> dict:
+    """Registra DejaVu (normal + negrita) una vez; retorna el nombre a usar por rol."""
+    global _NOMBRES
+    if _NOMBRES is not None:
+        return _NOMBRES
+    with _LOCK:
+        if _NOMBRES is not None:
+            return _NOMBRES
+        nombres = {}
+        for rol, archivo in ARCHIVOS_TTF.items():
+            ruta = _buscar_ttf(archivo)
+            if ruta is None:
+                nombres[rol] = RESPALDO[rol]
+                continue
+            font = TTFont(rol, ruta)
+            pdfmetrics.registerFont(font)
+            _SOPORTADOS[rol] = frozenset(font.face.charToGlyph)
+            nombres[rol] = rol
+
+        if nombres[FUENTE_NORMAL] == FUENTE_NORMAL and nombres[FUENTE_NEGRITA] == FUENTE_NEGRITA:
+            # <b> dentro de Paragraph -> DejaVu negrita
+            addMapping(FUENTE_NORMAL, 0, 0, FUENTE_NORMAL)
+            addMapping(FUENTE_NORMAL, 1, 0, FUENTE_NEGRITA)
+            addMapping(FUENTE_NORMAL, 0, 1, FUENTE_NORMAL)
+            addMapping(FUENTE_NORMAL, 1, 1, FUENTE_NEGRITA)
+        _NOMBRES = nombres
+    return _NOMBRES
+
+
+def fuente(negrita: bool = False) -> str:
+    nombres = registrar_fuentes()
+    return nombres[FUENTE_NEGRITA if negrita else FUENTE_NORMAL]
+
+
+def texto_pdf(txt: str, negrita: bool = False) -> str:
+    """
+    Quita los caracteres que la fuente no puede dibujar (p. ej. emojis) para que
+    no aparezcan cuadrados vacíos. Con Helvetica de respaldo, lo que no está en cp1252.
+    """
+    txt = str(txt)
+    if txt.isascii():
+        return txt
+    nombre = fuente(negrita)
+    soportados = _SOPORTADOS.get(nombre)
+    if soportados is None:
+        return txt.encode("cp1252", "ignore").decode("cp1252")
+    return "".join(c for c in txt if ord(c) in soportados or c in "\n\r\t")
@@ -0,0 +1,97 @@
+# =====================================================
+# HISTORIAL DE LECTURAS (append-only, en el almacén compartido)
+# Una fila por lectura gratis / desbloqueo premium; lo consumen analitica.py y programador.py.
+# - Tiene nombres y fechas de nacimiento: vive en el almacén (almacen.py, dentro de
+#   cache/, fuera de git), no en un CSV suelto, y lo ven todas las réplicas.
+# - Cada fila toma un número de un contador compartido (orden de llegada) y se guarda
+#   con ese número como clave: LectorHistorial sigue desde la última fila que vio.
+# Para subir un historial_lecturas.csv viejo: python historial.py --importar historial_lecturas.csv
+# =====================================================
+import csv
+import time
+from datetime import date, datetime
+
+from almacen import almacen
+
+ESPACIO_HISTORIAL = "historial"
+CONTADOR_HISTORIAL = "historial:filas"
+COLUMNAS_HISTORIAL = ["timestamp", "tipo", "nombre", "fecha_nac"]
+ESPERA_FILA_PERDIDA = 60.0  # segundos: una fila numerada que no aparece en ese tiempo se da por perdida
+
+
+def _clave(n: int) -> str:
+    return f"{n:012d}"
+
+
+def _guardar(fila: list) -> None:
+    a = almacen()
+    a.put_json(ESPACIO_HISTORIAL, _clave(a.incrementar(CONTADOR_HISTORIAL)), fila)
+
+
+def registrar_lectura(tipo: str, nombre: str, fecha_nac: date) -> None:
+    try:
+        _guardar([datetime.now().isoformat(timespec="seconds"), tipo, (nombre or "").strip(), fecha_nac.isoformat()])
+    except:
+        # En Streamlit Cloud a veces el FS es de solo lectura
+        pass
+
+
+class LectorHistorial:
+    """Lee el historial en orden de llegada, cada vez solo las filas nuevas (cargas incrementales)."""
+
+    def __init__(self):
+        self.siguiente = 1
+        self._faltante = None  # (número, desde cuándo falta)
+
+    def nuevas(self):
+        """
+        Filas [timestamp, tipo, nombre, fecha_nac] agregadas desde la llamada anterior,
+        o None si el historial quedó más corto que lo ya leído (hay que empezar de cero).
+        """
+        a = almacen()
+        ultimo = a.contador(CONTADOR_HISTORIAL)
+        if ultimo < self.siguiente - 1:
+            return None
+        filas = []
+        while self.siguiente <= ultimo:
+            fila = a.get_json(ESPACIO_HISTORIAL, _clave(self.siguiente))
+            if fila is None:
+                # numerada pero sin guardar todavía (otra réplica a mitad de camino), o perdida
+                ahora = time.monotonic()
+                if self._faltante is None or self._faltante[0] != self.siguiente:
+                    self._faltante = (self.siguiente, ahora)
+                if ahora - self._faltante[1] < ESPERA_FILA_PERDIDA:
+                    break
+            else:
+                filas.append(fila)
+            self.siguiente += 1
+        return filas
+
+
+def leer_historial() -> list:
+    """Todas las filas del historial, en orden de llegada."""
+    return LectorHistorial().nuevas() or []
+
+
+def importar_csv(path: str) -> int:
+    """Sube al almacén las filas de un historial_lecturas.csv (el formato anterior). Retorna cuántas."""
+    n = 0
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if len(row) < 4 or row[0] == "timestamp":
+                continue
+            _guardar(row[:4])
+            n += 1
+    return n
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Historial de lecturas en el almacén compartido.")
+    parser.add_argument("--importar", metavar="CSV", help="subir un historial_lecturas.csv (hacerlo una sola vez)")
+    args = parser.parse_args()
+
+    if args.importar:
+        print(f"Importadas {importar_csv(args.importar)} filas de {args.importar}")
+    print(f"Filas en el historial: {almacen().contador(CONTADOR_HISTORIAL)}")
@@ -0,0 +1,213 @@
+# =====================================================
+# ÍNDICE INVERTIDO: (concepto, número) -> fechas de nacimiento
+# Responde "¿qué fechas entre 1970 y 1995 tienen sendero 7 y misión 11?"
+# sin recalcular el motor fecha por fecha.
+# Uso: python indice.py "sendero natal=7" "mision=11" --desde 1970-01-01 --hasta 1995-12-31
+# =====================================================
+import argparse
+import os
+import sys
+from datetime import date, datetime
+
+import numpy as np
+
+from contenido_diario import al_cambiar_dia, hoy
+from motor import POSICION, _norm_txt, calcular_lectura
+
+FECHA_MIN = date(1940, 1, 1)
+FECHA_MAX = date(2040, 12, 31)
+ORD_MIN = FECHA_MIN.toordinal()
+ORD_MAX = FECHA_MAX.toordinal()
+SIN_VALOR = -1  # "no posee" (valor None en items)
+
+# Conceptos de calcular_todo que dependen solo de la fecha (no del nombre).
+# Los de año en curso (año personal, meses, cuatrimestres...) se calculan con el año de
+# hoy() al armar el índice; al cambiar el año se descarta y se arma (o carga) el del año nuevo.
+CONCEPTOS_FECHA = (
+    "mision", "sendero natal", "animal espiritual 1", "animal espiritual 2",
+    "dia de nacimiento", "primer tarot", "segundo tarot", "salud y espiritu 1",
+    "salud y espiritu 2", "arquetipo de amante", "vincular", "leccion de vida",
+    "primer desafio", "segundo desafio", "don divino", "nro de raiz",
+    "primera etapa", "segunda etapa", "tercera etapa", "cuarta etapa",
+    "año personal", "digito de la edad", "armonico",
+    "tarot 1er cuat", "tarot 2do cuat", "tarot 3er cuat",
+    "enero", "febrero", "marzo", "abril", "mayo", "junio",
+    "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre",
+)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_INDICE = None
+
+
+def ruta_indice(anio: int) -> str:
+    return os.path.join(BASE_DIR, "cache", f"indice_fechas_{anio}.npz")
+
+
+def _nuevo_dia(fecha: date) -> None:
+    global _INDICE
+    if _INDICE is not None and _INDICE.anio != fecha.year:
+        _INDICE = None
+
+
+al_cambiar_dia(_nuevo_dia)
+
+
+def _clave_concepto(txt: str) -> str:
+    return _norm_txt(txt).lower()
+
+
+# Acepta "misión", "Mision", "ano personal"... y devuelve el nombre real del concepto
+ALIAS_CONCEPTOS = {_clave_concepto(c): c for c in CONCEPTOS_FECHA}
+
+
+class IndiceFechas:
+    """
+    Por concepto: fechas (como índice de día desde FECHA_MIN) ordenadas por valor,
+    más los cortes de cada valor. Cada (concepto, número) es un slice ordenado de fechas.
+    """
+
+    def __init__(self, valores: dict, anio: int = None):
+        self.anio = anio  # año de los conceptos del año en curso
+        self.valores = valores  # concepto -> array int16 (un valor por día del rango)
+        self.orden = {}
+        self.cortes = {}
+        for concepto, col in valores.items():
+            orden = np.argsort(col, kind="stable").astype(np.int32)
+            nums, inicios = np.unique(col[orden], return_index=True)
+            fines = np.append(inicios[1:], len(orden))
+            self.orden[concepto] = orden
+            self.cortes[concepto] = {int(n): (int(a), int(b)) for n, a, b in zip(nums, inicios, fines)}
+
+    def fechas_de(self, concepto: str, numero: int) -> np.ndarray:
+        """Índices de día (ordenados) con ese valor; vacío si el número no aparece."""
+        a, b = self.cortes[concepto].get(int(numero), (0, 0))
+        return self.orden[concepto][a:b]
+
+    def numeros_de(self, concepto: str) -> list[int]:
+        return [n for n in self.cortes[concepto] if n != SIN_VALOR]
+
+    def consultar(self, condiciones: dict, desde: date = FECHA_MIN, hasta: date = FECHA_MAX) -> list[date]:
+        """
+        condiciones: {concepto: numero}. Intersección de todas, dentro de [desde, hasta].
+        Empieza por la lista más corta para que cada intersección sea lo más barata posible.
+        """
+        lo = max(desde.toordinal(), ORD_MIN) - ORD_MIN
+        hi = min(hasta.toordinal(), ORD_MAX) - ORD_MIN
+        if lo > hi:
+            return []
+
+        listas = []
+        for concepto, numero in condiciones.items():
+            fechas = self.fechas_de(resolver_concepto(concepto), numero)
+            i, j = np.searchsorted(fechas, [lo, hi + 1])
+            listas.append(fechas[i:j])
+
+        if not listas:
+            res = np.arange(lo, hi + 1, dtype=np.int32)
+        else:
+            listas.sort(key=len)
+            res = listas[0]
+            for otra in listas[1:]:
+                if not len(res):
+                    break
+                res = np.intersect1d(res, otra, assume_unique=True)
+
+        return [date.fromordinal(int(o) + ORD_MIN) for o in res]
+
+    def contar(self, condiciones: dict, desde: date = FECHA_MIN, hasta: date = FECHA_MAX) -> int:
+        return len(self.consultar(condiciones, desde, hasta))
+
+
+def resolver_concepto(txt: str) -> str:
+    concepto = ALIAS_CONCEPTOS.get(_clave_concepto(txt))
+    if concepto is None:
+        raise ValueError(f"Concepto no indexado: {txt!r}")
+    return concepto
+
+
+def construir_valores(anio: int) -> dict:
+    """Un valor por día del rango y concepto (recorre el motor una sola vez)."""
+    n_dias = ORD_MAX - ORD_MIN + 1
+    valores = {c: np.full(n_dias, SIN_VALOR, dtype=np.int16) for c in CONCEPTOS_FECHA}
+    columnas = [(valores[c], POSICION[c]) for c in CONCEPTOS_FECHA]
+    for i in range(n_dias):
+        lectura = calcular_lectura("", date.fromordinal(ORD_MIN + i), anio).valores
+        for col, p in columnas:
+            if lectura[p] is not None:
+                col[i] = lectura[p]
+    return valores
+
+
+def cargar_indice(path: str = None) -> IndiceFechas:
+    """Carga los valores del año de hoy desde disco (o los construye y guarda la primera vez) y arma el índice."""
+    global _INDICE
+    indice = _INDICE
+    if indice is not None:
+        return indice
+
+    anio = hoy().year
+    path = path or ruta_indice(anio)
+
+    valores = None
+    try:
+        with np.load(path) as data:
+            if all(c in data.files for c in CONCEPTOS_FECHA):
+                valores = {c: data[c] for c in CONCEPTOS_FECHA}
+    except (OSError, ValueError):
+        valores = None
+
+    if valores is None:
+        valores = construir_valores(anio)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.savez_compressed(path, **valores)
+        except OSError:
+            # En Streamlit Cloud a veces el FS es de solo lectura
+            pass
+
+    _INDICE = IndiceFechas(valores, anio)
+    return _INDICE
+
+
+def parse_condiciones(textos) -> dict:
+    """['sendero natal=7', 'mision=11'] -> {'sendero natal': 7, 'mision': 11}"""
+    condiciones = {}
+    for t in textos:
+        for parte in str(t).split(","):
+            if not parte.strip():
+                continue
+            if "=" not in parte:
+                raise ValueError(f"Condición inválida (use concepto=numero): {parte.strip()!r}")
+            concepto, numero = parte.split("=", 1)
+            condiciones[resolver_concepto(concepto)] = int(numero.strip())
+    return condiciones
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fechas de nacimiento que cumplen varios números a la vez.")
+    parser.add_argument("condiciones", nargs="*", help='p. ej. "sendero natal=7" "mision=11"')
+    parser.add_argument("--desde", default=FECHA_MIN.isoformat())
+    parser.add_argument("--hasta", default=FECHA_MAX.isoformat())
+    parser.add_argument("--contar", action="store_true", help="solo mostrar la cantidad")
+    parser.add_argument("--conceptos", action="store_true", help="listar conceptos indexados")
+    args = parser.parse_args(argv)
+
+    if args.conceptos:
+        print("\n".join(CONCEPTOS_FECHA))
+        return 0
+
+    condiciones = parse_condiciones(args.condiciones)
+    desde = datetime.strptime(args.desde, "%Y-%m-%d").date()
+    hasta = datetime.strptime(args.hasta, "%Y-%m-%d").date()
+    fechas = cargar_indice().consultar(condiciones, desde, hasta)
+
+    if args.contar:
+        print(len(fechas))
+    else:
+        sys.stdout.write("".join(f"{f.isoformat()}\n" for f in fechas))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
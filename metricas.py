@@ -0,0 +1,371 @@
+# =====================================================
+# MÉTRICAS (formato de texto de Prometheus)
+# Contadores, histogramas y gauges en memoria del proceso (un dict + un lock:
+# sumar cuesta menos de un microsegundo). Se exponen:
+# - en un archivo por proceso (cache/metricas/metricas_<host>-<pid>.prom, reescrito
+#   cada METRICAS_INTERVALO s), con la etiqueta instancia="<host>-<pid>" en cada
+#   muestra: con varias réplicas ninguna pisa a otra y el textfile collector de
+#   node_exporter las junta sin choques. Al salir el proceso borra su archivo; los de
+#   procesos que murieron sin borrarlo se limpian solos;
+# - y, si se define METRICAS_PUERTO, en http://127.0.0.1:<puerto>/metrics.
+# METRICAS=0 desactiva el exportador (las métricas se siguen sumando).
+# Uso: from metricas import contador; LECTURAS = contador("lecturas_total", "...")
+#      LECTURAS.inc()
+# =====================================================
+import atexit
+import bisect
+import math
+import os
+import socket
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICAS_DIR = os.getenv("METRICAS_DIR", os.path.join(BASE_DIR, "cache", "metricas"))
+METRICAS_INTERVALO = float(os.getenv("METRICAS_INTERVALO", "15"))
+METRICAS_PUERTO = int(os.getenv("METRICAS_PUERTO", "0"))  # 0 = sin endpoint HTTP
+METRICAS_HOST = os.getenv("METRICAS_HOST", "127.0.0.1")
+PREFIJO = "numerologia_"
+
+_REGISTRO = {}  # nombre -> métrica (en orden de registro)
+_LOCK = threading.Lock()
+_HILO = None
+
+# segundos / bytes
+BUCKETS_SEGUNDOS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_BYTES = (10_000, 25_000, 50_000, 75_000, 100_000, 150_000, 250_000, 500_000, 1_000_000)
+
+
+def _etiquetas_txt(nombres: tuple, valores: tuple, *extra: str) -> str:
+    partes = [f'{n}="{_escapar(v)}"' for n, v in zip(nombres, valores)]
+    partes.extend(e for e in extra if e)
+    return "{" + ",".join(partes) + "}" if partes else ""
+
+
+def _escapar(v) -> str:
+    return str(v).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _numero(v: float) -> str:
+    if v == math.inf:
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) and not v.is_integer() else str(int(v))
+
+
+class Metrica:
+    tipo = "untyped"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: tuple = ()):
+        self.nombre = PREFIJO + nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._lock = threading.Lock()
+
+    def _clave(self, etiquetas: dict) -> tuple:
+        if set(etiquetas) != set(self.etiquetas):
+            raise ValueError(f"{self.nombre}: se esperan las etiquetas {self.etiquetas}, llegaron {tuple(etiquetas)}")
+        return tuple(str(etiquetas[n]) for n in self.etiquetas)
+
+    def lineas(self, extra: str = "") -> list:
+        raise NotImplementedError
+
+    def texto(self, extra: str = "") -> str:
+        cabecera = [f"# HELP {self.nombre} {_escapar(self.ayuda)}", f"# TYPE {self.nombre} {self.tipo}"]
+        return "\n".join(cabecera + self.lineas(extra))
+
+
+class Contador(Metrica):
+    tipo = "counter"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: tuple = ()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores = {}
+
+    def inc(self, valor: float = 1, **etiquetas) -> None:
+        if valor < 0:
+            raise ValueError("Un contador no puede bajar")
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + valor
+
+    def valor(self, **etiquetas) -> float:
+        return self._valores.get(self._clave(etiquetas), 0)
+
+    def lineas(self, extra: str = "") -> list:
+        with self._lock:
+            valores = sorted(self._valores.items())
+        if not valores and not self.etiquetas:
+            valores = [((), 0)]
+        return [f"{self.nombre}{_etiquetas_txt(self.etiquetas, k, extra)} {_numero(v)}" for k, v in valores]
+
+
+class Gauge(Metrica):
+    """Valor que sube y baja. Con medir(funcion) se calcula recién al exponer (tamaños de caché, colas)."""
+
+    tipo = "gauge"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: tuple = ()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores = {}
+        self._funciones = {}
+
+    def set(self, valor: float, **etiquetas) -> None:
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = valor
+
+    def inc(self, valor: float = 1, **etiquetas) -> None:
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + valor
+
+    def dec(self, valor: float = 1, **etiquetas) -> None:
+        self.inc(-valor, **etiquetas)
+
+    def medir(self, funcion, **etiquetas) -> None:
+        self._funciones[self._clave(etiquetas)] = funcion
+
+    def olvidar(self, **etiquetas) -> None:
+        """Saca la serie (valor o función de medir): p. ej. la cola de un pool ya cerrado."""
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores.pop(clave, None)
+        self._funciones.pop(clave, None)
+
+    def lineas(self, extra: str = "") -> list:
+        with self._lock:
+            valores = dict(self._valores)
+        for clave, funcion in list(self._funciones.items()):
+            try:
+                valores[clave] = funcion()
+            except Exception:
+                continue  # una medición rota no tumba la exposición entera
+        return [f"{self.nombre}{_etiquetas_txt(self.etiquetas, k, extra)} {_numero(v)}" for k, v in sorted(valores.items())]
+
+
+class Histograma(Metrica):
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: tuple = (), buckets: tuple = BUCKETS_SEGUNDOS):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # clave -> [conteos por bucket (no acumulados) + inf, suma]
+
+    def observar(self, valor: float, **etiquetas) -> None:
+        clave = self._clave(etiquetas)
+        i = bisect.bisect_left(self.buckets, valor)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = [[0] * (len(self.buckets) + 1), 0.0]
+            serie[0][i] += 1
+            serie[1] += valor
+
+    def lineas(self, extra: str = "") -> list:
+        with self._lock:
+            series = sorted((k, (list(c), s)) for k, (c, s) in self._series.items())
+        lineas = []
+        for clave, (conteos, suma) in series:
+            acumulado = 0
+            for limite, n in zip(self.buckets + (math.inf,), conteos):
+                acumulado += n
+                le = f'le="{_numero(limite)}"'
+                lineas.append(f"{self.nombre}_bucket{_etiquetas_txt(self.etiquetas, clave, extra, le)} {acumulado}")
+            lineas.append(f"{self.nombre}_sum{_etiquetas_txt(self.etiquetas, clave, extra)} {_numero(suma)}")
+            lineas.append(f"{self.nombre}_count{_etiquetas_txt(self.etiquetas, clave, extra)} {acumulado}")
+        return lineas
+
+
+def _registrar(clase, nombre: str, ayuda: str, **kwargs):
+    # app.py se re-ejecuta en cada interacción: registrar dos veces devuelve la misma métrica
+    with _LOCK:
+        m = _REGISTRO.get(PREFIJO + nombre)
+        if m is None:
+            m = _REGISTRO[PREFIJO + nombre] = clase(nombre, ayuda, **kwargs)
+        elif not isinstance(m, clase):
+            raise ValueError(f"La métrica {nombre} ya existe con otro tipo")
+        return m
+
+
+def contador(nombre: str, ayuda: str, etiquetas: tuple = ()) -> Contador:
+    return _registrar(Contador, nombre, ayuda, etiquetas=etiquetas)
+
+
+def gauge(nombre: str, ayuda: str, etiquetas: tuple = ()) -> Gauge:
+    return _registrar(Gauge, nombre, ayuda, etiquetas=etiquetas)
+
+
+def histograma(nombre: str, ayuda: str, etiquetas: tuple = (), buckets: tuple = BUCKETS_SEGUNDOS) -> Histograma:
+    return _registrar(Histograma, nombre, ayuda, etiquetas=etiquetas, buckets=buckets)
+
+
+def _tras_fork() -> None:
+    # un lock tomado por otro hilo al momento del fork quedaría tomado para siempre en el hijo
+    global _LOCK
+    _LOCK = threading.Lock()
+    for m in _REGISTRO.values():
+        m._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_tras_fork)
+
+# Compartidas entre módulos
+TAMANO_CACHE = gauge("cache_entradas", "Entradas en las cachés en memoria del proceso", ("cache",))
+PROFUNDIDAD_COLA = gauge("cola_profundidad", "Elementos esperando en colas internas", ("cola",))
+
+
+# -------------------------
+# EXPOSICIÓN
+# -------------------------
+def texto_prometheus(instancia: str = None) -> str:
+    """Todas las métricas; con instancia, cada muestra lleva la etiqueta instancia="..."."""
+    extra = f'instancia="{_escapar(instancia)}"' if instancia else ""
+    with _LOCK:
+        metricas = list(_REGISTRO.values())
+    return "\n".join(m.texto(extra) for m in metricas) + "\n"
+
+
+def instancia() -> str:
+    # se calcula cada vez: tras un fork el pid cambia
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def ruta_archivo(directorio: str = METRICAS_DIR) -> str:
+    return os.path.join(directorio, f"metricas_{instancia()}.prom")
+
+
+def escribir_archivo(path: str = None) -> None:
+    try:
+        path = path or ruta_archivo()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"  # sin .prom: el textfile collector no lo lee a medias
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(texto_prometheus(instancia()))
+        os.replace(tmp, path)  # el lector nunca ve un archivo a medias
+    except:
+        # En Streamlit Cloud a veces el FS es de solo lectura
+        pass
+
+
+def _borrar_archivo() -> None:
+    try:
+        os.remove(ruta_archivo())
+    except OSError:
+        pass
+
+
+def limpiar_archivos(antiguedad: float, directorio: str = METRICAS_DIR) -> int:
+    """Borra los .prom que nadie reescribe hace más de 'antiguedad' segundos (procesos muertos)."""
+    borrados = 0
+    limite = time.time() - antiguedad
+    try:
+        nombres = os.listdir(directorio)
+    except OSError:
+        return 0
+    for nombre in nombres:
+        ruta = os.path.join(directorio, nombre)
+        try:
+            if nombre.startswith("metricas_") and os.path.getmtime(ruta) < limite:
+                os.remove(ruta)
+                borrados += 1
+        except OSError:
+            continue
+    return borrados
+
+
+def juntar_archivos(directorio: str = METRICAS_DIR) -> str:
+    """Los archivos de todos los procesos en un solo texto (cada familia con un solo HELP/TYPE)."""
+    familias = {}  # nombre -> [cabecera, muestras]
+    for nombre in sorted(os.listdir(directorio)):
+        if not (nombre.startswith("metricas_") and nombre.endswith(".prom")):
+            continue
+        try:
+            with open(os.path.join(directorio, nombre), encoding="utf-8") as f:
+                lineas = f.read().splitlines()
+        except OSError:
+            continue
+        actual = None
+        for linea in lineas:
+            if linea.startswith("# HELP "):
+                actual = familias.setdefault(linea.split(" ", 3)[2], [[], []])
+                if not actual[0]:
+                    actual[0].append(linea)
+            elif linea.startswith("# TYPE "):
+                if actual is not None and len(actual[0]) < 2:
+                    actual[0].append(linea)
+            elif linea and actual is not None:
+                actual[1].append(linea)
+    return "".join("\n".join(cabecera + muestras) + "\n" for cabecera, muestras in familias.values())
+
+
+def servir_http(puerto: int, host: str = METRICAS_HOST, fuente=texto_prometheus):
+    """Endpoint /metrics en un hilo propio. Retorna el servidor (server_address tiene el puerto real)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Manejador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            cuerpo = fuente().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((host, puerto), _Manejador)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, name="metricas-http", daemon=True).start()
+    return servidor
+
+
+def _bucle_archivo(intervalo: float) -> None:
+    while True:
+        escribir_archivo()
+        # un proceso vivo reescribe el suyo cada 'intervalo': los viejos son de procesos muertos
+        limpiar_archivos(max(10 * intervalo, 300))
+        time.sleep(intervalo)
+
+
+def iniciar_exportador(intervalo: float = METRICAS_INTERVALO, puerto: int = METRICAS_PUERTO) -> bool:
+    """Lanza el exportador una sola vez por proceso. Retorna True si lo lanzó ahora."""
+    global _HILO
+    if os.getenv("METRICAS", "1") == "0":
+        return False
+    with _LOCK:
+        if _HILO is not None:
+            return False
+        _HILO = threading.Thread(target=_bucle_archivo, args=(intervalo,), name="metricas-archivo", daemon=True)
+        _HILO.start()
+        atexit.register(_borrar_archivo)
+    if puerto:
+        try:
+            servir_http(puerto)
+        except OSError:
+            pass  # puerto ocupado (otra réplica en la misma máquina): queda el archivo
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Muestra o sirve las métricas en formato Prometheus.")
+    parser.add_argument("--directorio", default=METRICAS_DIR, help="donde escriben sus archivos los procesos de la app")
+    parser.add_argument("--servir", type=int, metavar="PUERTO", help="servir esos archivos (juntos) en /metrics")
+    args = parser.parse_args()
+
+    def _leer_archivos() -> str:
+        return juntar_archivos(args.directorio)
+
+    if args.servir:
+        # cuando la app no expone HTTP: se sirve lo último que escribió cada proceso
+        servir_http(args.servir, fuente=_leer_archivos)
+        print(f"Sirviendo {args.directorio} en http://{METRICAS_HOST}:{args.servir}/metrics")
+        while True:
+            time.sleep(3600)
+    else:
+        print(_leer_archivos(), end="")
@@ -0,0 +1,688 @@
+# =====================================================
+# MOTOR PREMIUM: CÁLCULOS NUMEROLÓGICOS (1..60)
+# (sin Streamlit: lo usan app.py y los exportadores)
+# =====================================================
+import re
+import unicodedata
+from collections import Counter
+from datetime import date, datetime
+
+from contenido_diario import al_cambiar_dia, hoy
+
+# =========================
+# CONFIG
+# =========================
+MAESTROS = {11, 22, 33, 44}
+
+# Año actual (para año personal / cuatrimestres / etc.), en la zona de contenido_diario.
+# Se actualizan solos al pasar la medianoche (el proceso de Streamlit vive días).
+HOY = hoy()
+ANO_ACTUAL = HOY.year
+
+def _nuevo_dia(fecha: date) -> None:
+    global HOY, ANO_ACTUAL
+    HOY, ANO_ACTUAL = fecha, fecha.year
+
+al_cambiar_dia(_nuevo_dia)
+
+def personalizar_texto(texto: str, nombre: str) -> str:
+    if not texto:
+        return texto
+
+    nombre = nombre.strip()
+
+    reglas = {
+        # Referencias impersonales → personales
+        "Las personas nacidas en": f"{nombre}, al vibrar en",
+        "Las personas que nacen en": f"{nombre}, al vibrar en",
+        "Estas personas": "Tú",
+        "Estas almas": "Tu alma",
+        "Estos individuos": "Tú",
+        "Ellos": "Tú",
+        "Ellas": "Tú",
+
+        # Vida / camino
+        "Su vida": "Tu vida",
+        "Su camino": "Tu camino",
+        "Su misión": "Tu misión",
+        "Su energía": "Tu energía",
+        "Su vibración": "Tu vibración",
+
+        # Conducta
+        "tienden a": "tiendes a",
+        "suelen": "sueles",
+        "pueden": "puedes",
+        "deben": "debes",
+
+        # Lenguaje distante → cercano
+        "Se observa que": "La vida te muestra que",
+        "Esto indica que": "Esto te indica que",
+        "Esto sugiere que": "Esto te sugiere que",
+        "Es importante que": "Es importante para ti que",
+    }
+
+    for origen, destino in reglas.items():
+        texto = texto.replace(origen, destino)
+
+    return texto
+
+# =========================
+# UTILIDADES TEXTO / NOMBRE
+# =========================
+def _norm_txt(s: str) -> str:
+    s = (s or "").strip()
+    s = unicodedata.normalize("NFD", s)
+    s = "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
+    s = s.replace("ñ", "n").replace("Ñ", "N")
+    s = re.sub(r"\s+", " ", s)
+    return s
+
+def _solo_letras(s: str) -> str:
+    s = _norm_txt(s).upper()
+    s = re.sub(r"[^A-Z ]", "", s)
+    return s
+
+def separar_nombre_apellido(full_name: str):
+    """
+    Heurística:
+    - Si hay 4+ tokens: 2 primeros = nombre(s), resto = apellido(s)
+    - Si hay 3 tokens: 1 primero = nombre, resto = apellidos
+    - Si hay 2 tokens: 1 primero = nombre, 1 segundo = apellido
+    - Si hay 1 token: todo nombre
+    """
+    tokens = _solo_letras(full_name).split()
+    if len(tokens) >= 4:
+        nombre = " ".join(tokens[:2])
+        apellido = " ".join(tokens[2:])
+    elif len(tokens) == 3:
+        nombre = tokens[0]
+        apellido = " ".join(tokens[1:])
+    elif len(tokens) == 2:
+        nombre = tokens[0]
+        apellido = tokens[1]
+    else:
+        nombre = " ".join(tokens) if tokens else ""
+        apellido = ""
+    return nombre, apellido
+
+
+# =========================
+# NUMEROLOGÍA BÁSICA
+# =========================
+def suma_digitos(n: int) -> int:
+    return sum(int(d) for d in str(abs(int(n))))
+
+def reducir_con_maestros(n: int) -> int:
+    """
+    Reduce a 1-9, pero detiene en 11/22/33/44.
+    """
+    n = abs(int(n))
+    while n > 9 and n not in MAESTROS:
+        n = suma_digitos(n)
+    return n
+
+def reducir_estricto_1a9(n: int) -> int:
+    """
+    Reduce SIEMPRE hasta 1-9 (ignora maestros).
+    (Esto aplica a Animal Espiritual, Tarot repetidos, Salud/Espíritu, etc. según tu nota.)
+    """
+    n = abs(int(n))
+    while n > 9:
+        n = suma_digitos(n)
+    return n
+
+def reducir_excepcion_10_11(n: int) -> int:
+    """
+    Para Don Divino: reduce a 1-9 salvo si cae en 10 o 11.
+    """
+    n = abs(int(n))
+    while n > 11 and n not in {10, 11}:
+        n = suma_digitos(n)
+    return n
+
+def reducir_a_dos_digitos(n: int) -> int:
+    """
+    Reduce por suma de dígitos hasta quedar en 1..99.
+    """
+    n = abs(int(n))
+    while n >= 100:
+        n = suma_digitos(n)
+    return n
+
+def reducir_solo_11_22(n: int) -> int:
+    """
+    Reduce a 1-9 salvo si cae en 11 o 22 (sin 33/44).
+    """
+    n = abs(int(n))
+    while n > 9 and n not in {11, 22}:
+        n = suma_digitos(n)
+    return n
+
+def regla_tarot_78(n: int) -> int:
+    """
+    Si el resultado es < 78, se deja (puede ser 2 dígitos).
+    Si no, se reduce a 1-9 (estricto).
+    """
+    n = abs(int(n))
+    if n < 78:
+        return n
+    return reducir_estricto_1a9(n)
+
+def suma_ano_en_digitos(year: int) -> int:
+    return suma_digitos(year)
+
+
+# =========================
+# VALORES LETRAS (PITAGÓRICO)
+# =========================
+# 1: A J S
+# 2: B K T
+# 3: C L U
+# 4: D M V
+# 5: E N W
+# 6: F O X
+# 7: G P Y
+# 8: H Q Z
+# 9: I R
+MAPA_LETRA = {}
+for ch in "AJS": MAPA_LETRA[ch] = 1
+for ch in "BKT": MAPA_LETRA[ch] = 2
+for ch in "CLU": MAPA_LETRA[ch] = 3
+for ch in "DMV": MAPA_LETRA[ch] = 4
+for ch in "ENW": MAPA_LETRA[ch] = 5
+for ch in "FOX": MAPA_LETRA[ch] = 6
+for ch in "GPY": MAPA_LETRA[ch] = 7
+for ch in "HQZ": MAPA_LETRA[ch] = 8
+for ch in "IR":  MAPA_LETRA[ch] = 9
+
+VOCALES = set("AEIOU")
+
+def valor_letra(ch: str) -> int:
+    ch = _solo_letras(ch).replace(" ", "")
+    if not ch:
+        return 0
+    return MAPA_LETRA.get(ch[0], 0)
+
+def suma_nombre(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    return sum(MAPA_LETRA.get(ch, 0) for ch in frase)
+
+def suma_vocales(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    return sum(MAPA_LETRA.get(ch, 0) for ch in frase if ch in VOCALES)
+
+def suma_consonantes(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    return sum(MAPA_LETRA.get(ch, 0) for ch in frase if ch not in VOCALES)
+
+def contar_letras(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    return len(frase)
+
+def primera_vocal_valor(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    for ch in frase:
+        if ch in VOCALES:
+            return MAPA_LETRA.get(ch, 0)
+    return 0
+
+def primera_consonante_valor(frase: str) -> int:
+    frase = _solo_letras(frase).replace(" ", "")
+    for ch in frase:
+        if ch not in VOCALES:
+            return MAPA_LETRA.get(ch, 0)
+    return 0
+
+def moda_numeros(frase: str):
+    frase = _solo_letras(frase).replace(" ", "")
+    vals = [MAPA_LETRA.get(ch, 0) for ch in frase if MAPA_LETRA.get(ch, 0) > 0]
+    if not vals:
+        return None
+    c = Counter(vals)
+    maxf = max(c.values())
+    tops = sorted([k for k,v in c.items() if v == maxf])
+    return tops[0]  # si hay empate, el menor
+
+
+# =========================
+# ESQUEMA DE RESULTADOS
+# =========================
+# (concepto hoja_dicc, etiqueta, nota si el valor es None): igual para todas las
+# personas, así que se guarda una sola vez. Cada persona es solo una tupla de valores.
+ESQUEMA_NATAL = (
+    ("mision", "Misión", None),
+    ("sendero natal", "Sendero Natal", None),
+    ("animal espiritual 1", "Animal Espiritual 1", None),
+    ("animal espiritual 2", "Animal Espiritual 2", "no posee segundo animal espiritual"),
+    ("dia de nacimiento", "Día de Nacimiento", None),
+    ("primer tarot", "Primer Tarot", None),
+    ("segundo tarot", "Segundo Tarot", "no posee segundo tarot"),
+    ("salud y espiritu 1", "Salud y Espíritu 1", None),
+    ("salud y espiritu 2", "Salud y Espíritu 2", "No existe una segunda relación entre tu espíritu y tu salud"),
+    ("arquetipo de amante", "Arquetipo de Amante", None),
+    ("vincular", "Vincular", None),
+    ("leccion de vida", "Lección de Vida", None),
+    ("primer desafio", "Primer Desafío", None),
+    ("segundo desafio", "Segundo Desafío", None),
+    ("don divino", "Don Divino", None),
+    ("nro de raiz", "Número de Raíz", "No posees número de raíz"),
+    ("esencia", "Esencia", None),
+    ("imagen", "Imagen", None),
+    ("destino", "Destino", None),
+    ("nro letras nombre", "Nro. Letras (Nombre+Apellido)", None),
+    ("primer año importante de tu vida", "Primer año importante", None),
+    ("segundo año importante de tu vida", "Segundo año importante", None),
+    ("tercer año importante de tu vida", "Tercer año importante", None),
+    ("cuarto año importante de tu vida", "Cuarto año importante", None),
+    ("quinto año importante de tu vida", "Quinto año importante", None),
+    ("caracteristicas vida", "Características de Vida", None),
+    ("nro hereditario", "Número Hereditario", None),
+    ("talento", "Talento", None),
+    ("estado espiritual", "Estado Espiritual", None),
+    ("desafio intimo", "Desafío Íntimo", None),
+    ("desafio de realizacion", "Desafío de Realización", None),
+    ("desafio de expresion", "Desafío de Expresión", None),
+    ("nro de expresion", "Número de Expresión", None),
+    ("potencial", "Potencial", None),
+    ("años de la primera etapa", "Años de la Primera Etapa", None),
+    ("primera etapa", "Primera Etapa", None),
+    ("años de la segunda etapa", "Años de la Segunda Etapa", None),
+    ("segunda etapa", "Segunda Etapa", None),
+    ("años de la tercera etapa", "Años de la Tercera Etapa", None),
+    ("tercera etapa", "Tercera Etapa", None),
+    ("años de la cuarta etapa", "Años de la Cuarta Etapa", None),
+    ("cuarta etapa", "Cuarta Etapa", None),
+)
+ESQUEMA_ANO = (
+    ("año personal", "Año Personal", None),
+    ("digito de la edad", "Dígito de la Edad", None),
+    ("armonico", "Armónico", None),
+    ("tarot 1er cuat", "Tarot 1er Cuatrimestre", None),
+    ("tarot 2do cuat", "Tarot 2do Cuatrimestre", None),
+    ("tarot 3er cuat", "Tarot 3er Cuatrimestre", None),
+    ("enero", "Enero", None),
+    ("febrero", "Febrero", None),
+    ("marzo", "Marzo", None),
+    ("abril", "Abril", None),
+    ("mayo", "Mayo", None),
+    ("junio", "Junio", None),
+    ("julio", "Julio", None),
+    ("agosto", "Agosto", None),
+    ("septiembre", "Septiembre", None),
+    ("octubre", "Octubre", None),
+    ("noviembre", "Noviembre", None),
+    ("diciembre", "Diciembre", None),
+)
+ESQUEMA = ESQUEMA_NATAL + ESQUEMA_ANO
+POSICION = {concepto: i for i, (concepto, _, _) in enumerate(ESQUEMA)}
+
+def items_de(esquema: tuple, valores: tuple) -> list:
+    """Formato 'items' de siempre: [(concepto, etiqueta, valor, nota_si_no_dicc), ...]."""
+    return [(c, e, v, nota if v is None else None) for (c, e, nota), v in zip(esquema, valores)]
+
+
+# =========================
+# CÁLCULOS (1..60) SEGÚN TU ARCHIVO
+# =========================
+def valores_natal(nombre_full: str, fecha_nac: date) -> tuple:
+    """(nombre, apellido, valores de los conceptos 1..42 en el orden de ESQUEMA_NATAL)."""
+    nombre, apellido = separar_nombre_apellido(nombre_full)
+
+    dd = fecha_nac.day
+    mm = fecha_nac.month
+    yy = fecha_nac.year
+
+    dd_red_maestros = reducir_con_maestros(dd)
+    mm_red_maestros = reducir_con_maestros(mm)
+    yy_red_maestros = reducir_con_maestros(suma_ano_en_digitos(yy))  # año en dígitos
+
+    # 1) Misión
+    mision = reducir_con_maestros(dd)
+
+    # 2) Sendero Natal (fecha completa)
+    sendero_natal = reducir_con_maestros(dd + mm + suma_ano_en_digitos(yy))
+
+    # 3) Animal Espiritual 1 (estricto 1-9)
+    animal1 = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 4) Animal Espiritual 2
+    animal2_cand = reducir_estricto_1a9(dd_red_maestros)  # “suma del día reducida a un dígito”
+    animal2 = None if animal2_cand == animal1 else animal2_cand
+
+    # 5) Día de nacimiento sin reducir
+    dia_nac = dd
+
+    # 6) Primer Tarot (estricto 1-9)
+    tarot1 = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 7) Segundo Tarot
+    tarot2_cand = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+    tarot2 = None if tarot2_cand == tarot1 else tarot2_cand
+
+    # 8) Salud y Espíritu 1
+    salud1 = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 9) Salud y Espíritu 2
+    salud2_cand = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+    salud2 = None if salud2_cand == salud1 else salud2_cand
+
+    # 10) Arquetipo de Amante
+    amante = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 11) Vincular
+    vincular = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 12) Lección de Vida
+    leccion_vida = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+
+    # 13) Primer Desafío = |dia reducido - mes reducido|
+    primer_desafio = abs(reducir_con_maestros(dd) - reducir_con_maestros(mm))
+
+    # 14) Segundo Desafío = |dia reducido - año reducido|
+    segundo_desafio = abs(reducir_con_maestros(dd) - reducir_con_maestros(suma_ano_en_digitos(yy)))
+
+    # 15) Don Divino = suma dos últimas cifras del año, reduce salvo 10/11
+    ult2 = yy % 100
+    don_divino = reducir_excepcion_10_11(suma_digitos(ult2))
+
+    # 16) Nro de Raíz = si (dia+mes+año) < 10 => no posee
+    total_raiz = dd + mm + yy
+    nro_raiz = None if total_raiz < 10 else reducir_estricto_1a9(total_raiz)
+
+    # 17) Esencia = vocales(nombre)+vocales(apellido) reduce con maestros
+    esencia = reducir_con_maestros(suma_vocales(nombre) + suma_vocales(apellido))
+
+    # 18) Imagen = consonantes(nombre)+consonantes(apellido) reduce con maestros
+    imagen = reducir_con_maestros(suma_consonantes(nombre) + suma_consonantes(apellido))
+
+    # 19) Destino = suma(nombre)+suma(apellido) reduce con maestros
+    destino = reducir_con_maestros(suma_nombre(nombre) + suma_nombre(apellido))
+
+    # 20) Nro Letras Nombre (sin espacios)
+    nro_letras = contar_letras(nombre + apellido)
+
+    # 21..25 años importantes
+    anio_imp_1 = nro_letras * 1
+    anio_imp_2 = nro_letras * 2
+    anio_imp_3 = nro_letras * 3
+    anio_imp_4 = nro_letras * 4
+    anio_imp_5 = nro_letras * 5
+
+    # 26) Características Vida = nro letras reducido a 1 dígito (estricto)
+    caract_vida = reducir_estricto_1a9(nro_letras) if nro_letras else None
+
+    # 27) Nro Hereditario = suma(apellido) reducido a 1 dígito (estricto)
+    nro_hereditario = reducir_estricto_1a9(suma_nombre(apellido)) if apellido else None
+
+    # 28) Talento = igual destino (según tu lista)
+    talento = reducir_con_maestros(suma_nombre(nombre) + suma_nombre(apellido))
+
+    # 29) Estado Espiritual = moda números del nombre+apellido
+    estado_espiritual = moda_numeros(nombre + " " + apellido)
+
+    # 30) Desafío Íntimo
+    des_intimo = abs(primera_vocal_valor(nombre) - primera_vocal_valor(apellido))
+
+    # 31) Desafío Realización
+    des_real = abs(primera_consonante_valor(nombre) - primera_consonante_valor(apellido))
+
+    # 32) Desafío Expresión = suma(des_intimo + des_real) reducido a 1 dígito (estricto)
+    des_exp = reducir_estricto_1a9(des_intimo + des_real)
+
+    # 33) Nro Expresión = suma(nombre+apellido) reduce con excepción 11/22 (solo)
+    nro_expresion = reducir_solo_11_22(suma_nombre(nombre) + suma_nombre(apellido))
+
+    # 34) Potencial = Sendero Natal + Destino reducido con excepción 11/22
+    potencial = reducir_solo_11_22(sendero_natal + destino)
+
+    # 35) Años 1ra etapa = 1..(36 - suma(dia+mes+año) reducida)
+    suma_fn_reducida = reducir_estricto_1a9(dd + mm + suma_ano_en_digitos(yy))
+    tope_1ra = 36 - suma_fn_reducida
+    if tope_1ra < 1:
+        rango_1ra = "1"
+    else:
+        rango_1ra = f"1 - {tope_1ra}"
+
+    # 36) Primera Etapa = (dia+mes) reducido con excepción 11/22
+    primera_etapa = reducir_solo_11_22(dd + mm)
+
+    # 37) Años 2da etapa
+    ini_2da = tope_1ra + 1 if tope_1ra >= 1 else 2
+    fin_2da = (tope_1ra + 10) if tope_1ra >= 1 else 11
+    rango_2da = f"{ini_2da} - {fin_2da}"
+
+    # 38) Segunda Etapa = (dia + año_dígitos) reducido con excepción 11/22
+    segunda_etapa = reducir_solo_11_22(dd + suma_ano_en_digitos(yy))
+
+    # 39) Años 3ra etapa
+    ini_3ra = fin_2da + 1
+    fin_3ra = fin_2da + 10
+    rango_3ra = f"{ini_3ra} - {fin_3ra}"
+
+    # 40) Tercera Etapa = (1ra + 2da) reducido con excepción 11/22
+    tercera_etapa = reducir_solo_11_22(primera_etapa + segunda_etapa)
+
+    # 41) Años 4ta etapa
+    ini_4ta = fin_3ra + 1
+    fin_4ta = fin_3ra + 10
+    rango_4ta = f"{ini_4ta} - {fin_4ta}"
+
+    # 42) Cuarta Etapa = (mes + año_dígitos) reducido con excepción 11/22
+    cuarta_etapa = reducir_solo_11_22(mm + suma_ano_en_digitos(yy))
+
+    # Valores en el ORDEN EXACTO de ESQUEMA_NATAL
+    valores = (
+        mision,
+        sendero_natal,
+        animal1,
+        animal2,
+        dia_nac,
+        tarot1,
+        tarot2,
+        salud1,
+        salud2,
+        amante,
+        vincular,
+        leccion_vida,
+        primer_desafio,
+        segundo_desafio,
+        don_divino,
+        nro_raiz,
+        esencia,
+        imagen,
+        destino,
+        nro_letras,
+        anio_imp_1,
+        anio_imp_2,
+        anio_imp_3,
+        anio_imp_4,
+        anio_imp_5,
+        caract_vida,
+        nro_hereditario,
+        talento,
+        estado_espiritual,
+        des_intimo,
+        des_real,
+        des_exp,
+        nro_expresion,
+        potencial,
+        rango_1ra,
+        primera_etapa,
+        rango_2da,
+        segunda_etapa,
+        rango_3ra,
+        tercera_etapa,
+        rango_4ta,
+        cuarta_etapa,
+    )
+    return nombre, apellido, valores
+
+def calcular_natal(nombre_full: str, fecha_nac: date) -> dict:
+    """
+    Conceptos 1..42: dependen solo de la fecha de nacimiento y del nombre
+    (no del año en curso). Mismo formato que calcular_todo, sin los del año.
+    """
+    nombre, apellido, valores = valores_natal(nombre_full, fecha_nac)
+    return {
+        "nombre_full": _norm_txt(nombre_full),
+        "nombre": nombre,
+        "apellido": apellido,
+        "fecha_nac": fecha_nac.strftime("%d/%m/%Y"),
+        "items": items_de(ESQUEMA_NATAL, valores),
+    }
+
+def valores_ano(fecha_nac: date, anio: int) -> tuple:
+    """
+    Conceptos 43..60 (año personal, dígito de la edad, armónico, cuatrimestres
+    y los 12 meses) para un año dado. Solo dependen de la fecha y del año.
+    """
+    dd = fecha_nac.day
+    mm = fecha_nac.month
+    yy = fecha_nac.year
+
+    # 43) Año Personal = (dia+mes+year_actual) reducido con excepción 11/22
+    ano_personal = reducir_solo_11_22(dd + mm + suma_ano_en_digitos(anio))
+
+    # 44) Dígito Edad = suma(edad + (edad-1)) reducido con excepción 11/22
+    edad = anio - yy
+    digito_edad = reducir_solo_11_22(edad + (edad - 1))
+
+    # 45) Armónico = (suma año actual + suma año nac) => reduce a 2 dígitos; si <78, dejar; si no, reducir 1-9
+    armonico_raw = suma_ano_en_digitos(anio) + suma_ano_en_digitos(yy)
+    armonico_2d = reducir_a_dos_digitos(armonico_raw)
+    armonico = armonico_2d if armonico_2d < 78 else reducir_estricto_1a9(armonico_2d)
+
+    # 46) Tarot 1er Cuat = (suma año actual + suma año actual) - suma año nac  (regla <78)
+    tarot_1c = regla_tarot_78((suma_ano_en_digitos(anio) + suma_ano_en_digitos(anio)) - suma_ano_en_digitos(yy))
+
+    # 47) Tarot 2do Cuat = (suma año actual + dia + mes + año_nac_dígitos) (regla <78)
+    tarot_2c = regla_tarot_78(suma_ano_en_digitos(anio) + dd + mm + suma_ano_en_digitos(yy))
+
+    # 48) Tarot 3er Cuat = (suma año actual + clave personal del día y mes) (regla <78)
+    # Interpretación: clave día+mes reducida con excepción 11/22
+    clave_dia_mes = reducir_solo_11_22(dd + mm)
+    tarot_3c = regla_tarot_78(suma_ano_en_digitos(anio) + clave_dia_mes)
+
+    # 49..60 Meses = (año personal + k) reducida con excepción 11/22
+    def mes_personal(k: int) -> int:
+        return reducir_solo_11_22(ano_personal + k)
+
+    enero = mes_personal(1)
+    febrero = mes_personal(2)
+    marzo = mes_personal(3)
+    abril = mes_personal(4)
+    mayo = mes_personal(5)
+    junio = mes_personal(6)
+    julio = mes_personal(7)
+    agosto = mes_personal(8)
+    septiembre = mes_personal(9)
+    octubre = mes_personal(1)
+    noviembre = mes_personal(2)
+    diciembre = mes_personal(3)
+
+    return (
+        ano_personal,
+        digito_edad,
+        armonico,
+        tarot_1c,
+        tarot_2c,
+        tarot_3c,
+        enero,
+        febrero,
+        marzo,
+        abril,
+        mayo,
+        junio,
+        julio,
+        agosto,
+        septiembre,
+        octubre,
+        noviembre,
+        diciembre,
+    )
+
+def calcular_ano(fecha_nac: date, anio: int) -> list:
+    """Conceptos 43..60 en formato items (ver valores_ano)."""
+    return items_de(ESQUEMA_ANO, valores_ano(fecha_nac, anio))
+
+
+def calcular_todo(nombre_full: str, fecha_nac: date, anio: int = None):
+    """Los 60 conceptos del informe premium; anio por defecto = el año de hoy."""
+    resultado = calcular_natal(nombre_full, fecha_nac)
+    resultado["items"] = resultado["items"] + calcular_ano(fecha_nac, hoy().year if anio is None else anio)
+    return resultado
+
+
+def calcular_varios_anos(nombre_full: str, fecha_nac: date, anios) -> dict:
+    """
+    Pronóstico multi-año: los conceptos natales y del nombre se calculan una sola vez
+    y solo los del año se recalculan por cada año pedido.
+    Retorna el dict de calcular_natal + "anios": {anio: items_del_año}.
+    """
+    resultado = calcular_natal(nombre_full, fecha_nac)
+    resultado["anios"] = {anio: calcular_ano(fecha_nac, anio) for anio in sorted(set(anios))}
+    return resultado
+
+
+# =========================
+# FORMATO COMPACTO (lotes grandes)
+# =========================
+class Lectura:
+    """
+    calcular_todo de una persona sin repetir etiquetas ni notas: solo los 60 valores
+    (en el orden de ESQUEMA). Para exportes / analítica sobre listas largas de clientes.
+    como_dict() devuelve exactamente lo mismo que calcular_todo (para el PDF).
+    """
+
+    __slots__ = ("nombre_full", "nombre", "apellido", "fecha_nac", "valores")
+    esquema = ESQUEMA
+
+    def __init__(self, nombre_full: str, nombre: str, apellido: str, fecha_nac: date, valores: tuple):
+        self.nombre_full = nombre_full
+        self.nombre = nombre
+        self.apellido = apellido
+        self.fecha_nac = fecha_nac
+        self.valores = valores
+
+    def __getitem__(self, concepto: str):
+        return self.valores[POSICION[concepto]]
+
+    def __eq__(self, otra) -> bool:
+        return isinstance(otra, Lectura) and all(getattr(self, a) == getattr(otra, a) for a in self.__slots__)
+
+    def __hash__(self) -> int:
+        # los mismos campos que __eq__ (valores ya es una tupla): sirve en sets y como clave de dict
+        return hash(tuple(getattr(self, a) for a in self.__slots__))
+
+    def items(self) -> list:
+        return items_de(self.esquema, self.valores)
+
+    def como_dict(self) -> dict:
+        return {
+            "nombre_full": self.nombre_full,
+            "nombre": self.nombre,
+            "apellido": self.apellido,
+            "fecha_nac": self.fecha_nac.strftime("%d/%m/%Y"),
+            "items": self.items(),
+        }
+
+    @classmethod
+    def desde_dict(cls, resultado: dict) -> "Lectura":
+        """Inverso de como_dict (p. ej. para una lectura que volvió de la caché)."""
+        conceptos = tuple(c for (c, _, _, _) in resultado["items"])
+        if conceptos != tuple(c for (c, _, _) in cls.esquema):
+            raise ValueError("Los items no siguen ESQUEMA")
+        return cls(
+            resultado["nombre_full"],
+            resultado["nombre"],
+            resultado["apellido"],
+            datetime.strptime(resultado["fecha_nac"], "%d/%m/%Y").date(),
+            tuple(v for (_, _, v, _) in resultado["items"]),
+        )
+
+
+def calcular_lectura(nombre_full: str, fecha_nac: date, anio: int = None) -> Lectura:
+    """Lo mismo que calcular_todo, en formato compacto."""
+    nombre, apellido, valores = valores_natal(nombre_full, fecha_nac)
+    valores += valores_ano(fecha_nac, hoy().year if anio is None else anio)
+    return Lectura(_norm_txt(nombre_full), nombre, apellido, fecha_nac, valores)
@@ -0,0 +1,229 @@
+# =====================================================
+# PAQUETE ZIP DE INFORMES PREMIUM (pedidos corporativos / talleres)
+# Una lista de compras (nombre, fecha) -> un ZIP con el PDF premium de cada una
+# y un indice.csv (archivo, clave, números principales).
+# - Los PDFs se arman en un pool de trabajadores (hilos, o los procesos
+#   precalentados de trabajadores.py) y entran al ZIP a medida que terminan: se
+#   copian desde cache/pdfs (ver cache_pdf.py), así que ni los PDFs ni el ZIP
+#   completo pasan por memoria.
+# - Como mucho 2 x trabajadores PDFs en vuelo a la vez.
+# - Desde el panel admin no hay pool propio: cada PDF es un pedido aparte en la
+#   fila de admision.py (turno propio "<sesión>:paquete", PDF_POR_SESION en vuelo),
+#   así el paquete se arma en los hilos de PDFs sin acaparar ninguno.
+# - La salida puede no ser buscable (stdout, respuesta HTTP): zipfile escribe
+#   los tamaños después de cada archivo.
+# Uso: python paquete_pdfs.py compras.csv --anio 2026 --salida paquete.zip
+#      python paquete_pdfs.py --historial --salida clientes.zip
+# =====================================================
+import argparse
+import csv
+import io
+import itertools
+import os
+import re
+import sys
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from datetime import date
+
+from cache_pdf import archivo_pdf_premium, clave_pdf, lectura_cacheada
+from motor import _norm_txt
+from trazas import span
+
+TRABAJADORES = int(os.getenv("PAQUETE_TRABAJADORES", str(min(4, os.cpu_count() or 1))))
+CONCEPTOS_INDICE = ("sendero natal", "mision", "esencia", "destino", "nro de expresion", "año personal")
+COLUMNAS_INDICE = ["archivo", "nombre", "fecha_nac", "anio", "clave"] + list(CONCEPTOS_INDICE) + ["error"]
+ESPERA_FILA_LLENA = 1.0  # segundos antes de volver a pedir un lugar en la fila de PDFs
+
+
+def _armar_uno(nombre: str, fecha_nac: date, anio: int) -> dict:
+    """Se ejecuta en el trabajador: arma (o reutiliza) el PDF y junta los datos del índice."""
+    ruta = archivo_pdf_premium(nombre, fecha_nac, anio)
+    valores = {concepto: valor for (concepto, _, valor, _) in lectura_cacheada(nombre, fecha_nac, anio)["items"]}
+    return {"ruta": ruta, "numeros": [valores.get(c) for c in CONCEPTOS_INDICE]}
+
+
+def nombre_en_zip(n: int, nombre: str, anio: int) -> str:
+    # el número adelante evita choques entre homónimos
+    base = re.sub(r"[^A-Za-z0-9]+", "_", _norm_txt(nombre)).strip("_") or "sin_nombre"
+    return f"{n:04d}_{base}_{anio}.pdf"
+
+
+def _texto_indice(filas: list) -> str:
+    tmp = io.StringIO()
+    writer = csv.writer(tmp, lineterminator="\n")
+    writer.writerow(COLUMNAS_INDICE)
+    writer.writerows(["" if v is None else v for v in fila] for fila in filas)
+    return tmp.getvalue()
+
+
+class _FilaPdfs(Executor):
+    """Executor sobre la fila de admision.py: cada submit es un pedido aparte."""
+
+    def __init__(self, sesion: str):
+        self.sesion = f"{sesion}:paquete"  # turno propio: no le gasta el límite a los PDFs de la sesión
+        self._lote = uuid.uuid4().hex
+        self._n = itertools.count()
+
+    def submit(self, fn, *args, **kwargs):
+        from admision import RECHAZADO, pedir
+
+        futuro = Future()
+
+        def _correr():
+            if not futuro.set_running_or_notify_cancel():
+                return None
+            try:
+                resultado = fn(*args, **kwargs)
+            except BaseException as e:
+                futuro.set_exception(e)
+                raise
+            futuro.set_result(resultado)
+            return resultado
+
+        clave = (self._lote, next(self._n))
+        while pedir(self.sesion, clave, _correr).estado == RECHAZADO:
+            time.sleep(ESPERA_FILA_LLENA)  # fila llena: el paquete espera, no se cae
+        return futuro
+
+
+def _ejecutor(trabajadores: int, procesos: bool, sesion: str = None):
+    if sesion is not None:
+        return _FilaPdfs(sesion)
+    if procesos:
+        from trabajadores import PoolCaliente
+
+        return PoolCaliente(trabajadores)
+    from admision import PRIORIDAD_PDF
+    from prioridad import bajar_prioridad
+
+    # dentro de la app: por debajo de la lectura gratis, igual que la fila de PDFs
+    return ThreadPoolExecutor(
+        max_workers=trabajadores,
+        thread_name_prefix="paquete",
+        initializer=bajar_prioridad,
+        initargs=(True, PRIORIDAD_PDF),
+    )
+
+
+def escribir_zip(
+    compras, salida, anio: int, trabajadores: int = TRABAJADORES, procesos: bool = False, progreso=None, sesion: str = None,
+) -> dict:
+    """
+    Escribe en 'salida' (archivo binario abierto) el ZIP con un PDF por compra + indice.csv.
+    progreso(hechos, total), si se pasa, se llama cada vez que termina un PDF. Con 'sesion'
+    los PDFs se piden a la fila de admision.py en vez de a un pool propio. Retorna el resumen.
+    """
+    compras = list(compras)
+    total = len(compras)
+    resumen = {"anio": anio, "compras": total, "en_zip": 0, "errores": 0}
+    indice = [None] * total
+    t = time.perf_counter()
+    if sesion is not None:
+        from admision import PDF_POR_SESION
+
+        maximo = PDF_POR_SESION
+    else:
+        maximo = 2 * trabajadores
+
+    with span("paquete_zip", compras=total, trabajadores=trabajadores), \
+            zipfile.ZipFile(salida, "w", compression=zipfile.ZIP_DEFLATED) as zf, \
+            _ejecutor(trabajadores, procesos, sesion) as pool:
+        pendientes = iter(enumerate(compras))
+        en_vuelo = {}
+
+        def _llenar():
+            for n, (nombre, fecha) in pendientes:
+                en_vuelo[pool.submit(_armar_uno, nombre, fecha, anio)] = n
+                if len(en_vuelo) >= maximo:
+                    break
+
+        _llenar()
+        while en_vuelo:
+            listos, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                n = en_vuelo.pop(futuro)
+                nombre, fecha = compras[n]
+                fila = ["", nombre, fecha.isoformat(), anio, clave_pdf(nombre, fecha, anio)]
+                try:
+                    r = futuro.result()
+                except Exception as e:
+                    indice[n] = fila + [None] * len(CONCEPTOS_INDICE) + [f"{type(e).__name__}: {e}"]
+                    resumen["errores"] += 1
+                else:
+                    fila[0] = nombre_en_zip(n + 1, nombre, anio)
+                    zf.write(r["ruta"], fila[0])  # copia por bloques desde el archivo
+                    indice[n] = fila + r["numeros"] + [None]
+                    resumen["en_zip"] += 1
+                if progreso:
+                    progreso(resumen["en_zip"] + resumen["errores"], total)
+            _llenar()
+
+        zf.writestr("indice.csv", _texto_indice(indice))
+
+    resumen["segundos"] = round(time.perf_counter() - t, 1)
+    return resumen
+
+
+def zip_en_archivo(sesion: str, compras, ruta: str, anio: int, avance: dict) -> dict:
+    """
+    Para el panel admin (correr con admision.coordinar): el ZIP directo a 'ruta', con los PDFs
+    pedidos a la fila de PDFs a nombre de 'sesion'. avance['hechos'/'total'] se va actualizando.
+    """
+    try:
+        with open(ruta, "wb") as f:
+            return escribir_zip(compras, f, anio, progreso=lambda h, t: avance.update(hechos=h, total=t), sesion=sesion)
+    except BaseException:
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+        raise
+
+
+def main(argv=None) -> int:
+    from contenido_diario import hoy
+    from exportar import leer_registros
+
+    parser = argparse.ArgumentParser(description="Arma un ZIP con los informes premium de muchas compras + indice.csv.")
+    parser.add_argument("entrada", nargs="?", default="-", help="CSV con columnas nombre,fecha ('-' = stdin)")
+    parser.add_argument("--historial", action="store_true", help="usar los clientes premium del historial en vez de un CSV")
+    parser.add_argument("--anio", type=int, default=hoy().year)
+    parser.add_argument("--salida", default="-", help="archivo ZIP ('-' = stdout)")
+    parser.add_argument("--trabajadores", type=int, default=TRABAJADORES)
+    parser.add_argument("--hilos", action="store_true", help="hilos en vez de procesos")
+    args = parser.parse_args(argv)
+
+    errores = []
+    if args.historial:
+        from programador import clientes_conocidos
+
+        compras = clientes_conocidos()
+    else:
+        fin = sys.stdin if args.entrada == "-" else open(args.entrada, "r", encoding="utf-8", newline="")
+        try:
+            compras = list(leer_registros(fin, errores))
+        finally:
+            if fin is not sys.stdin:
+                fin.close()
+
+    def _progreso(hechos, total):
+        print(f"\r{hechos}/{total}", end="", file=sys.stderr, flush=True)
+
+    fout = sys.stdout.buffer if args.salida == "-" else open(args.salida, "wb")
+    try:
+        resumen = escribir_zip(compras, fout, args.anio, args.trabajadores, procesos=not args.hilos, progreso=_progreso)
+    finally:
+        if fout is not sys.stdout.buffer:
+            fout.close()
+
+    print(f"\n{resumen}", file=sys.stderr)
+    if errores:
+        print(f"Filas con fecha inválida (saltadas): {len(errores)} · primeras: {errores[:10]}", file=sys.stderr)
+    return 1 if resumen["errores"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+# =====================================================
+# PDFs: VERSIÓN RESUMIDA (canvas) Y PREMIUM (platypus)
+# (ReportLab se importa solo aquí: app.py carga este módulo al generar el primer PDF)
+# =====================================================
+import contextvars
+import os
+import textwrap
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+
+from diccionario import dicc_get, precargar_hojas
+from fuentes import FUENTE_NORMAL, fuente, texto_pdf
+from metricas import BUCKETS_BYTES, TAMANO_CACHE, contador, histograma
+from motor import personalizar_texto
+from numerologia import (
+    ARCANOS_RESUMIDOS, BRAND, FRASES_AMOR, FRASES_DINERO, FRASES_EMOCIONAL, FRASES_PROTECCION,
+    LECTURA_RESUMIDA,
+)
+from pdf_compacto import filtros_streams, opciones_documento, registrar_tamano
+from trazas import span
+
+# Paleta Eugenia Mística
+COLOR_ROJO_MISTICO = "#7A1E3A"
+COLOR_DORADO = "#9C7A3F"
+COLOR_TEXTO = "#2E2E2E"
+COLOR_GRIS = "#666666"
+
+# Modo compacto (mismo aspecto, menos bytes): activo salvo PDF_COMPACTO=0 (ver pdf_compacto.py)
+PDF_COMPACTO = os.getenv("PDF_COMPACTO", "1") != "0"
+
+PDFS_GENERADOS = contador("pdfs_generados_total", "PDFs armados (los servidos desde caché no cuentan)", ("tipo",))
+PDF_SEGUNDOS = histograma("pdf_generacion_segundos", "Tiempo de armado de cada PDF", ("tipo",))
+PDF_BYTES = histograma("pdf_bytes", "Tamaño final de cada PDF", ("tipo",), buckets=BUCKETS_BYTES)
+
+# Los PDFs descartables de precalentar.py no cuentan en las métricas ni en el informe de tamaños
+_REGISTRAR = contextvars.ContextVar("registrar_pdf", default=True)
+
+@contextmanager
+def sin_registro():
+    """Lo que se arme dentro (en este hilo / contexto) no se registra en metricas ni en pdf_compacto."""
+    token = _REGISTRAR.set(False)
+    try:
+        yield
+    finally:
+        _REGISTRAR.reset(token)
+
+def _medir_pdf(tipo: str, t0: float, tamano: int) -> None:
+    if not _REGISTRAR.get():
+        return
+    PDFS_GENERADOS.inc(tipo=tipo)
+    PDF_SEGUNDOS.observar(time.perf_counter() - t0, tipo=tipo)
+    PDF_BYTES.observar(tamano, tipo=tipo)
+
+# =====================================================
+# SALIDA: EN MEMORIA O DIRECTO A ARCHIVO
+# Con destino (ruta) el PDF se escribe en un temporal al lado y se renombra al
+# terminar: el documento no queda entero en memoria y se entrega desde el
+# archivo (cache_pdf.py).
+# =====================================================
+def _salida(destino):
+    if destino is None:
+        return BytesIO()
+    os.makedirs(os.path.dirname(destino) or ".", exist_ok=True)
+    return open(f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp", "w+b")
+
+def _entregar(salida, compacto: bool, documento: str, destino, paginas: int) -> tuple:
+    """(bytes, tamaño) sin destino; (ruta, tamaño) con destino."""
+    if destino is None:
+        data = salida.getvalue()
+        salida.close()
+        if _REGISTRAR.get():
+            registrar_tamano(documento, len(data), paginas, compacto)
+        return data, len(data)
+    try:
+        salida.close()
+        os.replace(salida.name, destino)
+    except BaseException:
+        salida.close()
+        try:
+            os.remove(salida.name)
+        except OSError:
+            pass
+        raise
+    tamano = os.path.getsize(destino)
+    if _REGISTRAR.get():
+        registrar_tamano(documento, tamano, paginas, compacto)
+    return destino, tamano
+
+def precargar_fuentes():
+    # Registra DejaVu (o cae a Helvetica) una vez por proceso
+    fuente()
+    fuente(negrita=True)
+
+def ancho_linea_resumida() -> int:
+    # Caracteres por línea del PDF resumido: DejaVu es más ancha que Helvetica
+    return 84 if fuente() == FUENTE_NORMAL else 95
+
+# =====================================================
+# PDF helper
+# =====================================================
+MAX_PARRAFOS_CACHE = 4096  # párrafos envueltos distintos guardados por proceso
+
+@lru_cache(maxsize=MAX_PARRAFOS_CACHE)
+def _envolver_parrafo(parrafo: str, ancho: int) -> tuple:
+    return tuple(textwrap.wrap(texto_pdf(parrafo).strip(), width=ancho))
+
+TAMANO_CACHE.medir(lambda: _envolver_parrafo.cache_info().currsize, cache="parrafos_envueltos")
+
+def lineas_envueltas(texto: str, ancho: int) -> list:
+    """
+    Líneas listas para dibujar (con una línea vacía después de cada párrafo).
+    Los textos fijos (LECTURA_RESUMIDA, FRASES_*, pinaculo_micro...) se repiten
+    entre usuarios: cada párrafo se envuelve una sola vez por (texto, ancho).
+    """
+    lines = []
+    for para in texto.split("\n"):
+        para = para.strip()
+        if not para:
+            lines.append("")
+            continue
+        if len(para) <= ancho:
+            # línea corta (datos del usuario, "Número 7"): no hace falta envolver ni cachear
+            corta = texto_pdf(para).strip()
+            if corta:
+                lines.append(corta)
+        else:
+            lines.extend(_envolver_parrafo(para, ancho))
+        lines.append("")
+    return lines
+
+def precargar_textos_resumida() -> int:
+    """Envuelve de antemano los textos fijos del PDF resumido. Retorna cuántos párrafos cacheó."""
+    ancho = ancho_linea_resumida()
+    textos = [
+        *LECTURA_RESUMIDA.values(),
+        *FRASES_AMOR.values(),
+        *FRASES_DINERO.values(),
+        *FRASES_EMOCIONAL.values(),
+        *FRASES_PROTECCION.values(),
+        *ARCANOS_RESUMIDOS.values(),
+    ]
+    for texto in textos:
+        lineas_envueltas(texto, ancho)
+    return _envolver_parrafo.cache_info().currsize
+
+def _encabezado_resumida(c, titulo: str, x: float, y: float) -> None:
+    """Título + marca como form XObject: se define una vez por documento y se coloca con doForm."""
+    if not c.hasForm("encabezado"):
+        c.beginForm("encabezado")
+        c.setFont(fuente(negrita=True), 16)
+        c.drawString(x, y, texto_pdf(titulo, negrita=True).strip())
+        c.setFont(fuente(), 10)
+        c.drawString(x, y - 22, f"{BRAND} · Generado automáticamente")
+        c.endForm()
+    c.doForm("encabezado")
+
+def build_pdf_bytes(titulo: str, secciones: list[tuple[str, str]],
+                    compacto: bool = PDF_COMPACTO, metadatos: bool = False, destino: str = None):
+    """PDF resumido: bytes, o la ruta si se pasa destino (ver _salida)."""
+    t0 = time.perf_counter()
+    with filtros_streams(compacto):
+        pdf, tamano = _build_pdf_bytes(titulo, secciones, compacto, metadatos, destino)
+    _medir_pdf("resumida", t0, tamano)
+    return pdf
+
+def _build_pdf_bytes(titulo: str, secciones: list, compacto: bool, metadatos: bool, destino) -> tuple:
+    buffer = _salida(destino)
+    c = canvas.Canvas(buffer, pagesize=LETTER, **opciones_documento(fuente(), compacto, metadatos))
+    if metadatos:
+        c.setTitle(titulo)
+        c.setAuthor(BRAND)
+        c.setCreator(BRAND)
+    _, height = LETTER
+    x = 50
+    y = height - 60
+
+    _encabezado_resumida(c, titulo, x, y)
+    y -= 40
+
+    ancho = ancho_linea_resumida()
+
+    def draw_paragraph(text: str, y: int):
+        # un solo objeto de texto por tramo de página (en vez de un drawString por línea)
+        t = c.beginText(x, y)
+        t.setFont(fuente(), 11, 14)
+        for ln in lineas_envueltas(text, ancho):
+            if y < 90:
+                c.drawText(t)
+                c.showPage()
+                y = height - 60
+                t = c.beginText(x, y)
+                t.setFont(fuente(), 11, 14)
+            t.textLine(ln)
+            y -= 14
+        c.drawText(t)
+        return y
+
+    for head, body in secciones:
+        if y < 120:
+            c.showPage()
+            y = height - 60
+        c.setFont(fuente(negrita=True), 13)
+        c.drawString(x, y, texto_pdf(head, negrita=True))
+        y -= 18
+        y = draw_paragraph(body, y)
+        y -= 6
+
+    paginas = c.getPageNumber()
+    c.save()
+    return _entregar(buffer, compacto, "resumida", destino, paginas)
+
+
+# Hoja de estilos del PDF premium: se arma una vez por proceso y se comparte
+_ESTILOS = None
+
+def estilos_premium():
+    global _ESTILOS
+    if _ESTILOS is not None:
+        return _ESTILOS
+
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name="EM_TituloPortada",
+        fontName=fuente(),
+        fontSize=26,
+        leading=32,
+        alignment=1,
+        textColor=HexColor(COLOR_ROJO_MISTICO),
+        spaceAfter=16
+    ))
+
+    styles.add(ParagraphStyle(
+        name="EM_SubPortada",
+        fontName=fuente(),
+        fontSize=13.5,
+        leading=18,
+        alignment=1,
+        textColor=HexColor(COLOR_DORADO),
+        spaceAfter=10
+    ))
+
+    styles.add(ParagraphStyle(
+        name="EM_Marca",
+        fontName=fuente(),
+        fontSize=10.5,
+        leading=14,
+        alignment=1,
+        textColor=HexColor(COLOR_GRIS),
+        spaceBefore=18
+    ))
+
+    styles.add(ParagraphStyle(
+        name="EM_TituloSeccion",
+        fontName=fuente(),
+        fontSize=15.5,
+        leading=21,
+        textColor=HexColor(COLOR_ROJO_MISTICO),
+        spaceBefore=18,
+        spaceAfter=10
+    ))
+
+    styles.add(ParagraphStyle(
+        name="EM_Texto",
+        fontName=fuente(),
+        fontSize=11.2,
+        leading=17,
+        textColor=HexColor(COLOR_TEXTO),
+        spaceAfter=12
+    ))
+
+    _ESTILOS = styles
+    return _ESTILOS
+
+# =========================
+# PDF BONITO (sin tablas feas, respirable)
+# =========================
+def _documento_premium(buffer, resultado: dict, compacto: bool, metadatos: bool):
+    opciones = opciones_documento(fuente(), compacto, metadatos)
+    if metadatos:
+        opciones.update(
+            title="Lectura Numerológica Premium",
+            author=BRAND,
+            subject=f"Informe personalizado para {resultado['nombre_full']}",
+            creator=BRAND,
+        )
+
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=LETTER,
+        rightMargin=55,
+        leftMargin=55,
+        topMargin=60,
+        bottomMargin=55,
+        **opciones
+    )
+
+def _portada(elementos: list, styles, resultado: dict, subtitulo: str = "") -> None:
+    elementos.append(Spacer(1, 70))
+    elementos.append(
+        Paragraph("Lectura Numerológica Premium", styles["EM_TituloPortada"])
+    )
+    if subtitulo:
+        elementos.append(Paragraph(subtitulo, styles["EM_SubPortada"]))
+    elementos.append(
+        Paragraph(
+            f"Informe personalizado para<br/>{resultado['nombre_full']}",
+            styles["EM_SubPortada"]
+        )
+    )
+    elementos.append(
+        Paragraph(
+            f"Fecha de nacimiento: {resultado['fecha_nac']}",
+            styles["EM_SubPortada"]
+        )
+    )
+    elementos.append(Spacer(1, 34))
+    elementos.append(
+        Paragraph(
+            "Eugenia Mística · Numerología & Conciencia",
+            styles["EM_Marca"]
+        )
+    )
+    elementos.append(PageBreak())
+
+def _secciones(elementos: list, styles, items: list, nombre_full: str) -> None:
+    for (hoja_dicc, etiqueta, valor, nota) in items:
+        with span("seccion", concepto=hoja_dicc) as traza:
+            n_antes = len(elementos)
+            _seccion(elementos, styles, hoja_dicc, etiqueta, valor, nota, nombre_full)
+            traza.set(parrafos=len(elementos) - n_antes)
+
+def _seccion(elementos: list, styles, hoja_dicc, etiqueta, valor, nota, nombre_full: str) -> None:
+
+    # Título de sección
+    elementos.append(
+        Paragraph(etiqueta, styles["EM_TituloSeccion"])
+    )
+
+    # Resultado (misma tipografía que el texto)
+    if valor is None:
+        resultado_txt = "—"
+    else:
+        resultado_txt = str(valor)
+
+    elementos.append(
+        Paragraph(f"Resultado: {resultado_txt}", styles["EM_Texto"])
+    )
+
+    # Nota directa (si existe)
+    if nota:
+        elementos.append(
+            Paragraph(nota, styles["EM_Texto"])
+        )
+        return
+
+    # Texto largo desde diccionario
+    if isinstance(valor, int):
+        with span("dicc_get+personalizar_texto") as traza:
+            info = dicc_get(hoja_dicc, valor)
+            texto = info.get("texto", "").strip()
+            texto = personalizar_texto(texto, nombre_full)
+            traza.set(caracteres=len(texto))
+
+        with span("paragraphs"):
+            if texto:
+                intro = f"{nombre_full}, esta lectura se manifiesta como un espejo de tu proceso interno.\n\n"
+                texto = intro + texto
+                partes = [p.strip() for p in texto.split("\n") if p.strip()]
+                for p in partes:
+                    elementos.append(
+                        Paragraph(texto_pdf(p), styles["EM_Texto"])
+                    )
+            else:
+                elementos.append(
+                    Paragraph(
+                        "No se encontró texto asociado a este resultado.",
+                        styles["EM_Texto"]
+                    )
+                )
+
+def _cerrar(doc, buffer, elementos: list, compacto: bool, documento: str, destino) -> tuple:
+    with span("doc.build", flowables=len(elementos)) as traza:
+        doc.build(elementos)
+        traza.set(paginas=doc.page, bytes=buffer.tell())
+    return _entregar(buffer, compacto, documento, destino, doc.page)
+
+def build_pdf_premium(resultado: dict, compacto: bool = PDF_COMPACTO, metadatos: bool = False, destino: str = None):
+    """Informe premium: bytes, o la ruta si se pasa destino (ver _salida)."""
+    t0 = time.perf_counter()
+    with span("build_pdf_premium", conceptos=len(resultado["items"])) as traza, filtros_streams(compacto):
+        pdf, tamano = _build_pdf_premium(resultado, compacto, metadatos, destino)
+        traza.set(bytes=tamano)
+    _medir_pdf("premium", t0, tamano)
+    return pdf
+
+def _build_pdf_premium(resultado: dict, compacto: bool, metadatos: bool, destino) -> tuple:
+    buffer = _salida(destino)
+    doc = _documento_premium(buffer, resultado, compacto, metadatos)
+    styles = estilos_premium()
+
+    elementos = []
+
+    # -------------------------
+    # PORTADA
+    # -------------------------
+    _portada(elementos, styles, resultado)
+
+    # -------------------------
+    # CONTENIDO
+    # -------------------------
+    # Una sola lectura del Excel para todas las hojas que usa este informe (o nada, con textos compilados)
+    with span("dicc.precargar"):
+        precargar_hojas(hoja for (hoja, _, _, _) in resultado["items"])
+
+    _secciones(elementos, styles, resultado["items"], resultado["nombre_full"])
+
+    return _cerrar(doc, buffer, elementos, compacto, "premium", destino)
+
+def build_pdf_premium_multianual(resultado: dict, compacto: bool = PDF_COMPACTO, metadatos: bool = False, destino: str = None):
+    """
+    Un solo PDF para varios años (resultado de motor.calcular_varios_anos):
+    los conceptos natales y del nombre una vez, y luego una sección por año
+    con año personal, dígito de la edad, armónico, cuatrimestres y meses.
+    """
+    t0 = time.perf_counter()
+    with span("build_pdf_premium_multianual", anios=len(resultado["anios"])) as traza, filtros_streams(compacto):
+        pdf, tamano = _build_pdf_premium_multianual(resultado, compacto, metadatos, destino)
+        traza.set(bytes=tamano)
+    _medir_pdf("premium_multianual", t0, tamano)
+    return pdf
+
+def _build_pdf_premium_multianual(resultado: dict, compacto: bool, metadatos: bool, destino) -> tuple:
+    anios = sorted(resultado["anios"])
+    buffer = _salida(destino)
+    doc = _documento_premium(buffer, resultado, compacto, metadatos)
+    styles = estilos_premium()
+
+    elementos = []
+    rango = f"{anios[0]} – {anios[-1]}" if len(anios) > 1 else str(anios[0])
+    _portada(elementos, styles, resultado, subtitulo=f"Pronóstico {rango}")
+
+    precargar_hojas(
+        hoja
+        for items in [resultado["items"], *resultado["anios"].values()]
+        for (hoja, _, _, _) in items
+    )
+
+    _secciones(elementos, styles, resultado["items"], resultado["nombre_full"])
+
+    for anio in anios:
+        elementos.append(PageBreak())
+        elementos.append(Paragraph(f"Pronóstico {anio}", styles["EM_TituloPortada"]))
+        _secciones(elementos, styles, resultado["anios"][anio], resultado["nombre_full"])
+
+    return _cerrar(doc, buffer, elementos, compacto, f"premium {rango}", destino)
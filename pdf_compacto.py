@@ -0,0 +1,90 @@
+# =====================================================
+# MODO PDF COMPACTO (menos bytes, mismo aspecto)
+# Solo con opciones de ReportLab, sin reescribir el PDF generado:
+# - rl_config.useA85 = 0: los streams quedan solo en Flate (con ASCII85 encima
+#   ocupan ~25% más). Es global de ReportLab, así que se fija solo mientras dura
+#   cada build compacto (filtros_streams) y después vuelve a su valor.
+# - pageCompression=1 en cada documento.
+# - initialFontName = la fuente del informe, para que el canvas no agregue Helvetica.
+# - Las fuentes TrueType (fuentes.py) se incrustan como subset: ReportLab deja en
+#   cada documento solo los glifos que usa.
+# Además guarda un informe de tamaño por documento (panel interno).
+# =====================================================
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+MAX_INFORMES = 50  # últimos informes de tamaño que se guardan en memoria (panel interno)
+
+_LOCK = threading.Lock()
+INFORMES_TAMANO = deque(maxlen=MAX_INFORMES)
+
+_FILTROS = threading.Condition()
+_EN_USO = {"builds": 0, "compacto": None, "original": None}
+
+
+def opciones_documento(fuente_inicial: str, compacto: bool, metadatos: bool = False) -> dict:
+    """
+    kwargs para canvas.Canvas / SimpleDocTemplate.
+    fuente_inicial: la fuente de texto del informe, para que el canvas no agregue Helvetica.
+    metadatos: idioma del documento (título y autor los pone pdf.py). No es PDF/A: ReportLab
+    de código abierto no escribe los metadatos XMP ni el OutputIntent que pide la norma.
+    """
+    opciones = {"pageCompression": 1, "initialFontName": fuente_inicial} if compacto else {}
+    if metadatos:
+        opciones["lang"] = "es"
+    return opciones
+
+
+@contextmanager
+def filtros_streams(compacto: bool):
+    """
+    Durante el build: rl_config.useA85 = 0 si es compacto, el de ReportLab si no. Builds
+    con el mismo modo corren a la vez; uno del otro modo espera a que terminen. Al salir
+    el último, el valor vuelve a ser el que era.
+    """
+    from reportlab import rl_config
+
+    with _FILTROS:
+        while _EN_USO["builds"] and _EN_USO["compacto"] != compacto:
+            _FILTROS.wait()
+        if not _EN_USO["builds"]:
+            _EN_USO["compacto"], _EN_USO["original"] = compacto, rl_config.useA85
+            if compacto:
+                rl_config.useA85 = 0
+        _EN_USO["builds"] += 1
+    try:
+        yield
+    finally:
+        with _FILTROS:
+            _EN_USO["builds"] -= 1
+            if not _EN_USO["builds"]:
+                rl_config.useA85 = _EN_USO["original"]
+                _FILTROS.notify_all()
+
+
+def registrar_tamano(documento: str, tamano: int, paginas: int, compacto: bool) -> dict:
+    """Guarda el informe de tamaño de un PDF recién armado y lo retorna."""
+    informe = {
+        "documento": documento,
+        "bytes": tamano,
+        "paginas": paginas,
+        "bytes_por_pagina": tamano // paginas if paginas else tamano,
+        "compacto": compacto,
+    }
+    with _LOCK:
+        INFORMES_TAMANO.append(informe)
+    return informe
+
+
+def resumen_tamanos() -> str:
+    with _LOCK:
+        informes = list(INFORMES_TAMANO)
+    if not informes:
+        return "📦 Sin PDFs armados en este proceso"
+    ultimo = informes[-1]
+    return (
+        f"📦 Último PDF ({ultimo['documento'] or 'sin nombre'}{'' if ultimo['compacto'] else ', sin compactar'}): "
+        f"{ultimo['bytes'] / 1024:.1f} KB · páginas {ultimo['paginas']} "
+        f"({ultimo['bytes_por_pagina'] / 1024:.1f} KB/página) · {len(informes)} informe(s) en memoria"
+    )
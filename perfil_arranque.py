@@ -0,0 +1,102 @@
+# =====================================================
+# PERFIL DE ARRANQUE (cold start)
+# Verifica que la primera pantalla se dibuje sin cargar ReportLab / openpyxl /
+# numpy / pandas, y que los imports propios entren en el presupuesto de tiempo.
+# La app corre con la configuración de producción: hilos de precalentamiento,
+# programador y métricas incluidos (salvo que el entorno ya los desactive).
+# Uso: python perfil_arranque.py [--presupuesto 0.25] [--sin-app]
+# Sale con código 1 si algo se pasa del presupuesto, carga un módulo pesado o no
+# llega a arrancar (import o app.py con error): para usar en CI / deploy.
+# =====================================================
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos que la primera pantalla NO debe importar
+MODULOS_PESADOS = ("reportlab", "openpyxl", "numpy", "pandas")
+
+# Lo que app.py importa al arrancar (además de Streamlit)
+MODULOS_ARRANQUE = ("almacen", "contenido_diario", "historial", "metricas", "motor", "numerologia", "precalentar", "programador", "trazas")
+
+PRESUPUESTO_IMPORTS = 0.25  # segundos, imports propios en un intérprete limpio
+PRESUPUESTO_PRIMERA_PANTALLA = 3.0  # segundos, primera ejecución completa del script
+
+
+def medir_imports(modulos=MODULOS_ARRANQUE) -> tuple[float, list[str]]:
+    """Importa los módulos en un intérprete nuevo; retorna (segundos, pesados cargados)."""
+    codigo = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {BASE_DIR!r})\n"
+        "t = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modulos)
+        + "print(time.perf_counter() - t)\n"
+        f"print(','.join(m for m in {MODULOS_PESADOS!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"los imports de arranque fallaron: {proc.stderr.strip().splitlines()[-1:]}")
+    out = proc.stdout
+    seg, pesados = out.split("\n")[:2]
+    return float(seg), [m for m in pesados.split(",") if m]
+
+
+def medir_primera_pantalla() -> tuple[float, list[str]]:
+    """Corre app.py una vez (sin clicks) con el runner de pruebas de Streamlit, con los hilos de fondo de producción."""
+    from streamlit.testing.v1 import AppTest
+
+    os.environ.setdefault("APP_SECRET", "perfil-arranque")
+    antes = {m for m in MODULOS_PESADOS if m in sys.modules}
+    at = AppTest.from_file(os.path.join(BASE_DIR, "app.py"), default_timeout=60)
+    t = time.perf_counter()
+    at.run()
+    seg = time.perf_counter() - t
+    if at.exception:
+        raise RuntimeError(f"app.py falló en la primera pantalla: {at.exception}")
+    return seg, [m for m in MODULOS_PESADOS if m in sys.modules and m not in antes]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Presupuesto de arranque de la app.")
+    parser.add_argument("--presupuesto", type=float, default=PRESUPUESTO_IMPORTS, help="segundos para los imports propios")
+    parser.add_argument("--presupuesto-pantalla", type=float, default=PRESUPUESTO_PRIMERA_PANTALLA)
+    parser.add_argument("--sin-app", action="store_true", help="no ejecutar app.py (solo imports)")
+    args = parser.parse_args(argv)
+
+    fallas = []
+
+    try:
+        seg, pesados = medir_imports()
+    except RuntimeError as e:
+        fallas.append(str(e))
+    else:
+        print(f"Imports de arranque: {seg:.3f}s (presupuesto {args.presupuesto:.3f}s)")
+        if seg > args.presupuesto:
+            fallas.append("imports de arranque fuera de presupuesto")
+        if pesados:
+            fallas.append(f"imports de arranque cargan: {', '.join(pesados)}")
+
+    if not args.sin_app:
+        try:
+            seg, pesados = medir_primera_pantalla()
+        except RuntimeError as e:
+            fallas.append(str(e))
+        else:
+            print(f"Primera pantalla: {seg:.3f}s (presupuesto {args.presupuesto_pantalla:.3f}s)")
+            if seg > args.presupuesto_pantalla:
+                fallas.append("primera pantalla fuera de presupuesto")
+            if pesados:
+                fallas.append(f"primera pantalla carga: {', '.join(pesados)}")
+
+    for f in fallas:
+        print(f"❌ {f}")
+    if not fallas:
+        print("✅ Arranque dentro del presupuesto")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
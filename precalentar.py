@@ -0,0 +1,119 @@
+# =====================================================
+# PRECALENTAMIENTO DE CACHÉS AL ARRANCAR EL PROCESO
+# Un hilo en segundo plano deja listo lo que hoy paga el primer cliente:
+# ReportLab, hojas del diccionario, estilos, fuentes, textos envueltos y un informe premium descartable.
+# Para no competir con el primer visitante, cada paso espera a que el proceso lleve
+# ESPERA_INACTIVIDAD segundos sin ejecuciones del script (app.py avisa en cada una).
+# Se desactiva con la variable de entorno PRECALENTAR=0.
+# =====================================================
+import os
+import threading
+import time
+from datetime import date, datetime
+
+ESPERA_INACTIVIDAD = float(os.getenv("PRECALENTAR_ESPERA", "3"))  # segundos sin ejecuciones del script
+
+_LOCK = threading.Lock()
+_HILO = None
+_ACTIVIDAD = {"ultima": time.monotonic()}
+
+ESTADO = {
+    "listo": False,
+    "en_curso": False,
+    "inicio": None,
+    "fin": None,
+    "pasos": [],  # [(nombre, segundos)]
+    "error": None,
+}
+
+
+def marcar_actividad() -> None:
+    """Una ejecución del script empezó: el precalentamiento espera a que el proceso quede libre."""
+    _ACTIVIDAD["ultima"] = time.monotonic()
+
+
+def _esperar_inactividad() -> None:
+    while (falta := ESPERA_INACTIVIDAD - (time.monotonic() - _ACTIVIDAD["ultima"])) > 0:
+        time.sleep(falta)
+
+
+def precalentar(esperar: bool = False) -> None:
+    """
+    Ejecuta todos los pasos en el hilo actual (lo usa el hilo de fondo; también sirve en scripts).
+    esperar: antes de cada paso, esperar a que no haya ejecuciones del script (ver marcar_actividad).
+    """
+
+    def _paso(nombre: str, fn) -> None:
+        if esperar:
+            _esperar_inactividad()
+        t = time.perf_counter()
+        fn()
+        ESTADO["pasos"].append((nombre, time.perf_counter() - t))
+
+    ESTADO["en_curso"] = True
+    ESTADO["inicio"] = datetime.now()
+    try:
+        from diccionario import DICC, precargar_hojas
+        from motor import calcular_todo
+        from numerologia import APP_TITLE, BRAND
+
+        pdf = {}
+
+        def _importar_reportlab():
+            import pdf as modulo_pdf
+            pdf["mod"] = modulo_pdf
+
+        # sin_registro: los informes descartables no suman a pdfs_generados_total ni a los tamaños
+        def _pdf_premium():
+            with pdf["mod"].sin_registro():
+                pdf["mod"].build_pdf_premium(calcular_todo("Eugenia Mystikos", date(1990, 1, 1)))
+
+        def _pdf_resumido():
+            with pdf["mod"].sin_registro():
+                pdf["mod"].build_pdf_bytes(
+                    f"{APP_TITLE} · Versión Resumida · {BRAND}",
+                    [("Datos", "Nombre: Eugenia Mystikos\nFecha de nacimiento: 1990-01-01")],
+                )
+
+        _paso("importar ReportLab", _importar_reportlab)
+        _paso("diccionario (todas las hojas)", lambda: precargar_hojas(DICC.indice))
+        _paso("estilos premium", lambda: pdf["mod"].estilos_premium())
+        _paso("fuentes", lambda: pdf["mod"].precargar_fuentes())
+        _paso("textos del PDF resumido", lambda: pdf["mod"].precargar_textos_resumida())
+        # informe descartable: calienta las cachés internas de ReportLab (métricas, layout, compresión)
+        _paso("PDF premium de prueba", _pdf_premium)
+        _paso("PDF resumido de prueba", _pdf_resumido)
+        ESTADO["listo"] = True
+    except Exception as e:
+        ESTADO["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        ESTADO["en_curso"] = False
+        ESTADO["fin"] = datetime.now()
+
+
+def iniciar_precalentamiento() -> bool:
+    """
+    Se llama en cada ejecución de app.py: marca actividad y lanza el hilo una sola vez
+    por proceso (este módulo se importa una sola vez). Retorna True si lo lanzó ahora.
+    """
+    global _HILO
+    marcar_actividad()
+    if os.getenv("PRECALENTAR", "1") == "0":
+        return False
+    with _LOCK:
+        if _HILO is not None:
+            return False
+        _HILO = threading.Thread(target=precalentar, args=(True,), name="precalentar-cache", daemon=True)
+        _HILO.start()
+        return True
+
+
+def resumen_estado() -> str:
+    if ESTADO["listo"]:
+        total = sum(s for _, s in ESTADO["pasos"])
+        return f"🔥 Instancia precalentada ({total:.2f}s, lista desde {ESTADO['fin']:%H:%M:%S})"
+    if ESTADO["error"]:
+        return f"⚠️ Precalentamiento falló: {ESTADO['error']}"
+    if ESTADO["en_curso"]:
+        return "⏳ Precalentando cachés (en los momentos sin visitas)..."
+    return "💤 Precalentamiento no iniciado"
@@ -0,0 +1,24 @@
+# =====================================================
+# PRIORIDAD (nice) DE HILOS Y PROCESOS DE FONDO
+# La usan los hilos de PDFs (admision.py, paquete_pdfs.py) y el programador.
+# - En Linux cada hilo tiene su propio nice; donde no se puede, no hace nada.
+# - El nice ordena la CPU entre hilos del sistema operativo, no el GIL: dentro del
+#   mismo proceso la lectura gratis sigue esperando el GIL detrás de un PDF de
+#   ReportLab (Python puro). Baja prioridad no es aislamiento; para eso están los
+#   procesos de trabajadores.py.
+# =====================================================
+import os
+import threading
+
+PRIORIDAD_BAJA = 19  # nice
+
+
+def bajar_prioridad(hilo: bool, nivel: int = PRIORIDAD_BAJA) -> None:
+    """Baja la prioridad del hilo actual (hilo=True) o de todo el proceso."""
+    try:
+        if hilo:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nivel)
+        else:
+            os.nice(nivel)
+    except (AttributeError, OSError):
+        pass
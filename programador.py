@@ -0,0 +1,267 @@
+# =====================================================
+# PROGRAMADOR LOCAL (estilo cron, sin servicios externos)
+# En las semanas previas al cambio de año pre-genera, con baja prioridad,
+# el informe premium del año siguiente de cada cliente conocido (desbloqueos
+# premium, en el almacén compartido) y lo deja en la caché de PDFs: en enero se sirve de ahí.
+# - Dentro de la app: hilo de fondo (una vez por proceso; PROGRAMADOR=0 lo desactiva).
+# - Con varias réplicas, cada ejecución del cron la hace una sola: la primera que
+#   toma el turno en el almacén compartido (ver almacen.py).
+# - Como proceso aparte: python programador.py [--ahora] [--anio 2027]
+# =====================================================
+import argparse
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from contenido_diario import ahora, hoy
+from historial import leer_historial
+from motor import _norm_txt
+from prioridad import bajar_prioridad
+
+# minuto hora día-del-mes mes día-de-la-semana (0 = domingo)
+CRON_PREGENERAR = os.getenv("PREGENERAR_CRON", "30 3 * 11,12 *")
+DIAS_ANTES = int(os.getenv("PREGENERAR_DIAS_ANTES", "45"))  # ventana antes del 1 de enero
+PAUSA_ENTRE_PDFS = 0.5  # segundos: deja respirar a la app entre informe e informe
+ESPACIO_CLIENTES = "cliente"
+
+_LOCK = threading.Lock()
+_HILO = None
+
+ESTADO = {
+    "proxima": None,
+    "en_curso": False,
+    "ultima": None,  # dict de pregenerar()
+    "error": None,
+    "otra_replica": None,  # ejecución que tomó otra réplica
+}
+
+
+# -------------------------
+# EXPRESIONES CRON
+# -------------------------
+def _campo(expr: str, minimo: int, maximo: int) -> set:
+    """'*', '5', '1-5', '*/15', '1,15,30', '10-20/2'"""
+    valores = set()
+    for parte in expr.split(","):
+        rango, _, paso = parte.partition("/")
+        paso = int(paso) if paso else 1
+        if rango == "*":
+            ini, fin = minimo, maximo
+        elif "-" in rango:
+            ini, fin = (int(x) for x in rango.split("-"))
+        else:
+            ini = fin = int(rango)
+        if ini < minimo or fin > maximo or ini > fin or paso < 1:
+            raise ValueError(f"Campo cron fuera de rango: {parte!r}")
+        valores.update(range(ini, fin + 1, paso))
+    return valores
+
+
+def parse_cron(expr: str) -> tuple:
+    campos = expr.split()
+    if len(campos) != 5:
+        raise ValueError(f"Expresión cron inválida (se esperan 5 campos): {expr!r}")
+    minutos, horas, dias, meses, dias_semana = campos
+    return (
+        _campo(minutos, 0, 59),
+        _campo(horas, 0, 23),
+        _campo(dias, 1, 31),
+        _campo(meses, 1, 12),
+        {d % 7 for d in _campo(dias_semana, 0, 7)},  # 7 también es domingo
+        dias != "*",
+        dias_semana != "*",
+    )
+
+
+def _dia_coincide(cron: tuple, d: date) -> bool:
+    _, _, dias, meses, dias_semana, dia_fijo, semana_fija = cron
+    if d.month not in meses:
+        return False
+    en_dia = d.day in dias
+    en_semana = (d.weekday() + 1) % 7 in dias_semana
+    if dia_fijo and semana_fija:
+        return en_dia or en_semana  # como en cron: cualquiera de los dos
+    return en_dia and en_semana
+
+
+def proxima_ejecucion(expr: str, desde: datetime) -> datetime:
+    """Primer minuto estrictamente posterior a 'desde' que cumple la expresión."""
+    cron = parse_cron(expr)
+    minutos, horas = sorted(cron[0]), sorted(cron[1])
+    desde = desde.replace(second=0, microsecond=0)
+    for dia in range(366 * 4 + 1):
+        d = desde.date() + timedelta(days=dia)
+        if not _dia_coincide(cron, d):
+            continue
+        for h in horas:
+            for m in minutos:
+                t = datetime(d.year, d.month, d.day, h, m)
+                if t > desde:
+                    return t
+    raise ValueError(f"La expresión cron nunca se cumple: {expr!r}")
+
+
+def en_ventana(fecha: date, dias_antes: int = DIAS_ANTES) -> bool:
+    """True si faltan como mucho 'dias_antes' días para el 1 de enero."""
+    return (date(fecha.year + 1, 1, 1) - fecha).days <= dias_antes
+
+
+# -------------------------
+# TRABAJO: PRE-GENERAR INFORMES DEL AÑO SIGUIENTE
+# -------------------------
+def _clientes_historial() -> dict:
+    """{(nombre normalizado, fecha_nac): (nombre, fecha_nac)} de los desbloqueos premium del historial."""
+    clientes = {}
+    for row in leer_historial():
+        if len(row) < 4 or row[1] != "premium" or not row[2].strip():
+            continue
+        try:
+            fecha = date.fromisoformat(row[3])
+        except ValueError:
+            continue
+        clientes[(_norm_txt(row[2]), fecha)] = (row[2], fecha)
+    return clientes
+
+
+def registrar_cliente(nombre: str, fecha_nac: date) -> None:
+    """Alta (idempotente) en la lista de clientes del almacén compartido, la que ven todas las réplicas."""
+    from almacen import almacen
+
+    almacen().put_json(ESPACIO_CLIENTES, f"{_norm_txt(nombre)}|{fecha_nac.isoformat()}", [nombre.strip(), fecha_nac.isoformat()])
+
+
+def clientes_conocidos() -> list:
+    """
+    (nombre, fecha_nac) de cada cliente premium, sin repetidos: la lista de clientes del
+    almacén más los desbloqueos del historial (p. ej. importado de un CSV viejo) que le faltaban.
+    """
+    from almacen import almacen
+
+    clientes = {}
+    for nombre, fecha in almacen().valores_json(ESPACIO_CLIENTES):
+        fecha = date.fromisoformat(fecha)
+        clientes[(_norm_txt(nombre), fecha)] = (nombre, fecha)
+    for clave, (nombre, fecha) in _clientes_historial().items():
+        if clave not in clientes:
+            registrar_cliente(nombre, fecha)
+            clientes[clave] = (nombre, fecha)
+    return list(clientes.values())
+
+
+def tomar_turno(ejecucion: datetime) -> bool:
+    """True solo en la primera réplica que lo pide para esa ejecución del cron (contador atómico compartido)."""
+    from almacen import almacen
+
+    # si el almacén no puede escribir devuelve el valor actual (0): mejor repetir que no correr
+    return almacen().incrementar(f"programador:{ejecucion:%Y-%m-%dT%H:%M}") <= 1
+
+
+def _ahora() -> datetime:
+    """Hora de pared en ZONA_HORARIA (la misma de hoy()): el cron corre en esa zona."""
+    return ahora().replace(tzinfo=None)
+
+
+def pregenerar(anio: int, clientes=None, pausa: float = PAUSA_ENTRE_PDFS) -> dict:
+    """Deja en la caché el informe premium de 'anio' de cada cliente. Retorna el resumen."""
+    from cache_pdf import archivo_pdf, archivo_pdf_premium, clave_pdf
+
+    if clientes is None:
+        clientes = clientes_conocidos()
+    resumen = {"anio": anio, "clientes": len(clientes), "generados": 0, "ya_en_cache": 0, "errores": 0}
+    t = time.perf_counter()
+    for nombre, fecha in clientes:
+        # en este disco o en el almacén (con almacén en memoria, solo el disco)
+        if archivo_pdf(clave_pdf(nombre, fecha, anio)) is not None:
+            resumen["ya_en_cache"] += 1
+            continue
+        try:
+            archivo_pdf_premium(nombre, fecha, anio)
+            resumen["generados"] += 1
+        except Exception:
+            resumen["errores"] += 1
+        if pausa:
+            time.sleep(pausa)
+    resumen["segundos"] = round(time.perf_counter() - t, 1)
+    resumen["fin"] = _ahora()
+    return resumen
+
+
+def _bucle(expr: str, dias_antes: int, hilo: bool) -> None:
+    bajar_prioridad(hilo)
+    while True:
+        prox = proxima_ejecucion(expr, _ahora())
+        ESTADO["proxima"] = prox
+        while (falta := (prox - _ahora()).total_seconds()) > 0:
+            time.sleep(min(falta, 60))
+        dia = hoy()
+        if not en_ventana(dia, dias_antes):
+            continue
+        if not tomar_turno(prox):
+            ESTADO["otra_replica"] = prox
+            continue
+        ESTADO["en_curso"] = True
+        try:
+            ESTADO["ultima"] = pregenerar(dia.year + 1)
+            ESTADO["error"] = None
+        except Exception as e:
+            ESTADO["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            ESTADO["en_curso"] = False
+
+
+def iniciar_programador(expr: str = CRON_PREGENERAR, dias_antes: int = DIAS_ANTES) -> bool:
+    """Lanza el hilo una sola vez por proceso. Retorna True si lo lanzó ahora."""
+    global _HILO
+    if os.getenv("PROGRAMADOR", "1") == "0":
+        return False
+    with _LOCK:
+        if _HILO is not None:
+            return False
+        parse_cron(expr)  # una expresión mal escrita falla aquí, no dentro del hilo
+        _HILO = threading.Thread(target=_bucle, args=(expr, dias_antes, True), name="programador-pdfs", daemon=True)
+        _HILO.start()
+        return True
+
+
+def resumen_programador() -> str:
+    if ESTADO["en_curso"]:
+        return "🗓️ Pre-generando informes del año próximo..."
+    partes = []
+    if ESTADO["ultima"]:
+        u = ESTADO["ultima"]
+        partes.append(
+            f"🗓️ Última pre-generación {u['anio']}: {u['generados']} nuevos, "
+            f"{u['ya_en_cache']} ya en caché, {u['errores']} errores ({u['segundos']}s, {u['fin']:%d/%m %H:%M})"
+        )
+    if ESTADO["otra_replica"]:
+        partes.append(f"La ejecución del {ESTADO['otra_replica']:%d/%m %H:%M} la hizo otra réplica")
+    if ESTADO["error"]:
+        partes.append(f"⚠️ Programador: {ESTADO['error']}")
+    if ESTADO["proxima"]:
+        partes.append(f"Próxima ejecución: {ESTADO['proxima']:%d/%m/%Y %H:%M}")
+    return " · ".join(partes) or "🗓️ Programador no iniciado"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-genera los informes premium del año siguiente.")
+    parser.add_argument("--ahora", action="store_true", help="ejecutar una vez ya (sin esperar al cron ni a la ventana)")
+    parser.add_argument("--anio", type=int, default=hoy().year + 1)
+    parser.add_argument("--cron", default=CRON_PREGENERAR)
+    parser.add_argument("--dias-antes", type=int, default=DIAS_ANTES)
+    parser.add_argument("--pausa", type=float, default=PAUSA_ENTRE_PDFS)
+    args = parser.parse_args(argv)
+
+    if args.ahora:
+        bajar_prioridad(hilo=False)
+        print(pregenerar(args.anio, pausa=args.pausa))
+        return 0
+
+    print(f"Programador: '{args.cron}', próxima ejecución {proxima_ejecucion(args.cron, _ahora()):%d/%m/%Y %H:%M}")
+    _bucle(args.cron, args.dias_antes, hilo=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
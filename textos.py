@@ -0,0 +1,282 @@
+# =====================================================
+# TEXTOS COMPILADOS (solo lectura, compartidos por mmap)
+# Los textos del Diccionario.xlsx y las tablas fijas de numerologia.py
+# (LECTURA_RESUMIDA, FRASES_*, ENERGIA_DIA_365, COMPATIBILIDAD_EXPRES,
+# ARCANOS_RESUMIDOS) en un único archivo binario, cache/textos_<versión>.bin.
+# Cada proceso lo abre con mmap: el sistema operativo comparte esas páginas entre
+# todos los trabajadores, y ninguno importa openpyxl ni arma un dict por hoja.
+# - Índice por (concepto, número): cada concepto es un rango de entradas ordenadas
+#   por número; la búsqueda binaria corre sobre arrays que viven en el mismo mmap.
+# - La versión es un hash del contenido del Excel (el mismo que usa la clave de los
+#   PDFs en caché, cache_pdf.clave_pdf) más un hash de las tablas: textos() la revisa
+#   en cada llamada y, si algo cambió, recompila (una vez, con escritura atómica) y
+#   vuelve a mapear.
+# Uso: python textos.py [--compilar] [--verificar] [--concepto mision --numero 7]
+#      python textos.py --concepto tabla:frases_amor --numero 7
+# =====================================================
+import array
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from bisect import bisect_left
+
+from diccionario import version_diccionario
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEXTOS_DIR = os.getenv("TEXTOS_DIR", os.path.join(BASE_DIR, "cache"))
+MAGIC = b"NUMTXT01"
+PREFIJO_TABLA = "tabla:"  # conceptos de numerologia.py (las hojas del Excel van tal cual)
+_CABECERA = struct.Struct("<8sII")  # magic, entradas, largo del JSON de metadatos
+
+_TEXTOS = None
+_HASH_TABLAS = None
+_LOCK = threading.Lock()
+
+
+def _tablas() -> dict:
+    import numerologia as n
+
+    return {
+        "lectura_resumida": n.LECTURA_RESUMIDA,
+        "frases_amor": n.FRASES_AMOR,
+        "frases_dinero": n.FRASES_DINERO,
+        "frases_emocional": n.FRASES_EMOCIONAL,
+        "frases_proteccion": n.FRASES_PROTECCION,
+        "energia_dia_365": n.ENERGIA_DIA_365,
+        "compatibilidad_expres": n.COMPATIBILIDAD_EXPRES,
+        "arcanos_resumidos": n.ARCANOS_RESUMIDOS,
+    }
+
+
+def version_textos(excel: str = None) -> str:
+    """Versión del Excel (version_diccionario) + hash de las tablas (fijo mientras vive el proceso)."""
+    global _HASH_TABLAS
+    if _HASH_TABLAS is None:
+        crudo = repr(sorted((k, sorted(v.items())) for k, v in _tablas().items()))
+        _HASH_TABLAS = hashlib.sha256(crudo.encode("utf-8")).hexdigest()[:12]
+    return f"{excel or version_diccionario()}-{_HASH_TABLAS}"
+
+
+def ruta_textos(version: str, directorio: str = TEXTOS_DIR) -> str:
+    return os.path.join(directorio, f"textos_{version}.bin")
+
+
+# -------------------------
+# COMPILAR
+# -------------------------
+def _entradas() -> dict:
+    """{concepto: {número: (título, texto)}} desde el Excel (leído de cero: puede haber cambiado) y las tablas."""
+    from diccionario import DICC_PATH, DiccionarioExcel
+
+    dicc = DiccionarioExcel(DICC_PATH)
+    dicc.precargar(dicc.indice)
+    conceptos = {hoja: {n: (f["titulo"], f["texto"]) for n, f in dicc.hoja(hoja).items()} for hoja in dicc.indice}
+    for nombre, tabla in _tablas().items():
+        conceptos[PREFIJO_TABLA + nombre] = {int(n): ("", texto) for n, texto in tabla.items()}
+    return conceptos
+
+
+def compilar(path: str, excel: str) -> dict:
+    """
+    Escribe el archivo: cabecera + JSON (versiones, rango de cada concepto) + 5 arrays
+    (número, offset/largo del título, offset/largo del texto) + los textos en UTF-8
+    (cada texto distinto una sola vez). Retorna los metadatos.
+    """
+    numeros, off_t, len_t, off_x, len_x = (array.array(t) for t in "iIIII")
+    datos = bytearray()
+    ubicados = {}  # texto -> (offset relativo, largo)
+    rangos = {}
+
+    def _ubicar(texto: str) -> tuple:
+        if texto not in ubicados:
+            b = texto.encode("utf-8")
+            ubicados[texto] = (len(datos), len(b))
+            datos.extend(b)
+        return ubicados[texto]
+
+    for concepto, filas in sorted(_entradas().items()):
+        inicio = len(numeros)
+        for numero, (titulo, texto) in sorted(filas.items()):
+            numeros.append(numero)
+            for (o, n), offs, largos in ((_ubicar(titulo), off_t, len_t), (_ubicar(texto), off_x, len_x)):
+                offs.append(o)
+                largos.append(n)
+        rangos[concepto] = [inicio, len(numeros)]
+
+    meta = {"version": version_textos(excel), "excel": excel, "conceptos": rangos}
+    # los offsets absolutos dependen del largo del JSON, que a su vez los contiene
+    meta["inicio_arrays"] = meta["inicio_datos"] = 0
+    while True:
+        crudo = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        inicio_arrays = _alinear(_CABECERA.size + len(crudo))
+        inicio_datos = inicio_arrays + 5 * 4 * len(numeros)
+        if (meta["inicio_arrays"], meta["inicio_datos"]) == (inicio_arrays, inicio_datos):
+            break
+        meta["inicio_arrays"], meta["inicio_datos"] = inicio_arrays, inicio_datos
+
+    for offs in (off_t, off_x):
+        for i in range(len(offs)):
+            offs[i] += inicio_datos
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_CABECERA.pack(MAGIC, len(numeros), len(crudo)))
+        f.write(crudo)
+        f.write(b"\0" * (inicio_arrays - _CABECERA.size - len(crudo)))
+        for a in (numeros, off_t, len_t, off_x, len_x):
+            a.tofile(f)
+        f.write(datos)
+    os.replace(tmp, path)  # quien ya lo tenía abierto sigue leyendo su versión
+    return meta
+
+
+def _alinear(n: int, a: int = 8) -> int:
+    return (n + a - 1) // a * a
+
+
+# -------------------------
+# LEER
+# -------------------------
+class TextosCompilados:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, largo_meta = _CABECERA.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: no es un archivo de textos compilados")
+        meta = json.loads(self._mm[_CABECERA.size:_CABECERA.size + largo_meta])
+        self.version = meta["version"]
+        self.excel = meta["excel"]  # versión del Excel (diccionario.textos_compilados la compara)
+        self.conceptos = {c: tuple(r) for c, r in meta["conceptos"].items()}
+        self.entradas = n
+        # vistas sobre el mmap (sin copiar): índice i -> número / offsets / largos
+        vista = memoryview(self._mm)
+        ini = meta["inicio_arrays"]
+        self._numeros, self._off_t, self._len_t, self._off_x, self._len_x = (
+            vista[ini + k * 4 * n:ini + (k + 1) * 4 * n].cast("i" if k == 0 else "I") for k in range(5)
+        )
+        self._vista = vista
+
+    def _buscar(self, concepto: str, numero: int) -> int:
+        rango = self.conceptos.get(concepto)
+        if rango is None:
+            return -1
+        i = bisect_left(self._numeros, numero, *rango)
+        return i if i < rango[1] and self._numeros[i] == numero else -1
+
+    def _leer(self, offset: int, largo: int) -> str:
+        return str(self._vista[offset:offset + largo], "utf-8")
+
+    def dicc(self, concepto: str, numero: int) -> dict:
+        """Igual que diccionario.dicc_get: {titulo, texto}, vacíos si no existe."""
+        i = self._buscar((concepto or "").strip().lower(), int(numero))
+        if i < 0:
+            return {"titulo": "", "texto": ""}
+        return {
+            "titulo": self._leer(self._off_t[i], self._len_t[i]),
+            "texto": self._leer(self._off_x[i], self._len_x[i]),
+        }
+
+    def tabla(self, nombre: str, numero: int, defecto: str = None) -> str:
+        """Texto de una tabla de numerologia.py (p. ej. tabla('frases_amor', 7))."""
+        i = self._buscar(PREFIJO_TABLA + nombre, int(numero))
+        return defecto if i < 0 else self._leer(self._off_x[i], self._len_x[i])
+
+    def tiene(self, concepto: str) -> bool:
+        return (concepto or "").strip().lower() in self.conceptos
+
+    def tamano(self) -> int:
+        return len(self._mm)
+
+
+def _directorio() -> str:
+    # En Streamlit Cloud a veces el FS es de solo lectura: se compila en el temporal
+    for d in (TEXTOS_DIR, os.path.join(tempfile.gettempdir(), "numerologia_textos")):
+        try:
+            os.makedirs(d, exist_ok=True)
+            if os.access(d, os.W_OK):
+                return d
+        except OSError:
+            continue
+    raise OSError("No hay directorio con permiso de escritura para los textos compilados")
+
+
+def _borrar_viejos(directorio: str, actual: str) -> None:
+    for nombre in os.listdir(directorio):
+        ruta = os.path.join(directorio, nombre)
+        if nombre.startswith("textos_") and nombre.endswith(".bin") and ruta != actual:
+            try:
+                os.remove(ruta)  # quien lo tenga mapeado lo sigue leyendo hasta cerrarlo
+            except OSError:
+                pass
+
+
+def textos() -> TextosCompilados:
+    """
+    El almacén de textos del proceso, de la versión actual del Excel (lo compila si
+    hace falta y lo vuelve a mapear si cambió). Tras un fork se comparte tal cual.
+    """
+    global _TEXTOS
+    excel = version_diccionario()
+    version = version_textos(excel)
+    if _TEXTOS is None or _TEXTOS.version != version:
+        with _LOCK:
+            if _TEXTOS is None or _TEXTOS.version != version:
+                path = ruta_textos(version)
+                if not os.path.exists(path):
+                    path = ruta_textos(version, _directorio())
+                    if not os.path.exists(path):
+                        compilar(path, excel)
+                        _borrar_viejos(os.path.dirname(path), path)
+                _TEXTOS = TextosCompilados(path)  # el anterior se cierra cuando nadie lo usa
+    return _TEXTOS
+
+
+def verificar(t: TextosCompilados) -> list:
+    """Diferencias entre el archivo y las fuentes (lista vacía = idéntico)."""
+    diferencias = []
+    for concepto, filas in _entradas().items():
+        for numero, (titulo, texto) in filas.items():
+            if concepto.startswith(PREFIJO_TABLA):
+                ok = t.tabla(concepto[len(PREFIJO_TABLA):], numero) == texto
+            else:
+                ok = t.dicc(concepto, numero) == {"titulo": titulo, "texto": texto}
+            if not ok:
+                diferencias.append((concepto, numero))
+    return diferencias
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Compila / consulta el archivo de textos compartido por mmap.")
+    parser.add_argument("--compilar", action="store_true", help="recompilar aunque ya exista")
+    parser.add_argument("--verificar", action="store_true", help="comparar cada texto con el Excel y las tablas")
+    parser.add_argument("--concepto")
+    parser.add_argument("--numero", type=int)
+    args = parser.parse_args()
+
+    if args.compilar:
+        t0 = time.perf_counter()
+        excel = version_diccionario()
+        path = ruta_textos(version_textos(excel), _directorio())
+        meta = compilar(path, excel)
+        print(f"Compilado {path} ({len(meta['conceptos'])} conceptos) en {time.perf_counter() - t0:.2f}s")
+    t = textos()
+    print(f"{t.path}: {t.entradas} entradas, {len(t.conceptos)} conceptos, {t.tamano() / 1024:.0f} KB")
+    if args.concepto:
+        if args.concepto.startswith(PREFIJO_TABLA):
+            print(t.tabla(args.concepto[len(PREFIJO_TABLA):], args.numero, "(sin texto)"))
+        else:
+            print(t.dicc(args.concepto, args.numero))
+    if args.verificar:
+        diferencias = verificar(t)
+        print("✅ Idéntico a las fuentes" if not diferencias else f"❌ {len(diferencias)} diferencias: {diferencias[:10]}")
+        raise SystemExit(1 if diferencias else 0)
@@ -0,0 +1,438 @@
+# =====================================================
+# POOL DE TRABAJADORES PRECALENTADOS (fork)
+# Para lotes grandes de PDFs (paquete_pdfs.py, scripts): el proceso padre carga
+# una sola vez todo el estado del motor (ReportLab, textos compilados, estilos,
+# fuentes, tablas de reducción, un PDF de prueba; ver precalentar.py), congela el
+# GC (gc.freeze es de todo el proceso: se cuenta cuántos pools lo usan y se
+# descongela al cerrar el último) y recién entonces hace fork de los trabajadores. Cada hijo arranca caliente
+# y comparte esas páginas con el padre (copy-on-write): nada de re-importar ni
+# recargar por lote, y el costo por PDF se acerca al del render puro.
+# - Reciclado: cada trabajador sale después de RECICLAR_CADA trabajos (o si pasa
+#   de LIMITE_MB de memoria) y se reemplaza por uno nuevo desde el padre.
+# - Salud: a los trabajadores libres se les manda un ping cada INTERVALO_SALUD s;
+#   el que no responde, o el que pasa TIEMPO_MAXIMO con un trabajo, se mata y se
+#   reemplaza (su trabajo falla con ErrorTrabajador / TimeoutError).
+# - Drenado: shutdown() (o Ctrl+C / SIGTERM en el CLI) deja de aceptar trabajos,
+#   termina los que ya están en la fila y cierra los trabajadores de a uno.
+# Es un concurrent.futures.Executor: pool.submit(funcion, *args) -> Future.
+# Las funciones tienen que ser de nivel de módulo (viajan por referencia).
+# Prueba de rendimiento: python trabajadores.py --pdfs 40 --trabajadores 2
+# Prueba de reciclado bajo carga: python trabajadores.py --probar-reciclado
+# =====================================================
+import gc
+import itertools
+import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+
+from metricas import PROFUNDIDAD_COLA, contador
+from trazas import span
+
+TRABAJADORES = int(os.getenv("POOL_TRABAJADORES", str(os.cpu_count() or 1)))
+RECICLAR_CADA = int(os.getenv("POOL_RECICLAR_CADA", "200"))  # trabajos por trabajador antes de reemplazarlo
+LIMITE_MB = int(os.getenv("POOL_LIMITE_MB", "400"))  # memoria residente de un trabajador antes de reciclarlo
+TIEMPO_MAXIMO = float(os.getenv("POOL_TIEMPO_MAXIMO", "120"))  # segundos por trabajo (0 = sin límite)
+INTERVALO_SALUD = 10.0  # segundos sin noticias de un trabajador libre antes de mandarle un ping
+ESPERA_PING = 5.0  # segundos para responder el ping
+
+_CTX = get_context("fork")
+_NUMERO_POOL = itertools.count(1)
+_GC = {"pools": 0}  # pools abiertos que cuentan con el GC congelado
+_GC_LOCK = threading.Lock()
+REEMPLAZOS = contador("pool_reemplazos_total", "Trabajadores del pool reemplazados", ("motivo",))
+
+
+class ErrorTrabajador(RuntimeError):
+    """El trabajador murió (o no pudo devolver el resultado) en medio de un trabajo."""
+
+
+def _congelar_gc() -> None:
+    # cada pool vuelve a congelar: lo creado desde el pool anterior también queda fuera del GC
+    with _GC_LOCK:
+        _GC["pools"] += 1
+        gc.freeze()
+
+
+def _descongelar_gc() -> None:
+    with _GC_LOCK:
+        _GC["pools"] -= 1
+        if not _GC["pools"]:
+            gc.unfreeze()
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def precargar_estado() -> dict:
+    """Todo lo que los trabajadores heredan ya cargado. Retorna {paso: segundos} (o el error)."""
+    from precalentar import ESTADO, precalentar
+
+    if not ESTADO["listo"]:
+        precalentar()
+    if ESTADO["error"]:
+        raise RuntimeError(f"No se pudo precargar el motor: {ESTADO['error']}")
+    return dict(ESTADO["pasos"])
+
+
+# -------------------------
+# HIJO
+# -------------------------
+def _bucle_trabajador(conn, max_trabajos: int, heredados: list) -> None:
+    # extremos del padre que vinieron con el fork: sin cerrarlos, nadie ve EOF si el padre muere
+    for c in heredados:
+        c.close()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C lo maneja el padre (drena)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    gc.enable()
+    hechos = 0
+    while True:
+        try:
+            mensaje = conn.recv()
+        except (EOFError, OSError):
+            return  # el padre se fue
+        if mensaje[0] == "fin":
+            return
+        if mensaje[0] == "ping":
+            conn.send(("pong", _rss_mb()))
+            continue
+        _, funcion, args, kwargs = mensaje
+        try:
+            respuesta = ("hecho", True, funcion(*args, **kwargs))
+        except Exception as e:
+            respuesta = ("hecho", False, e)
+        hechos += 1
+        ultimo = hechos >= max_trabajos
+        try:
+            conn.send(respuesta + (_rss_mb(), ultimo))
+        except Exception as e:
+            # resultado o excepción que no se puede serializar
+            conn.send(("hecho", False, ErrorTrabajador(f"{type(e).__name__}: {e}"), _rss_mb(), ultimo))
+        if ultimo:
+            return
+
+
+# -------------------------
+# PADRE
+# -------------------------
+class _Trabajador:
+    __slots__ = ("proceso", "conn", "futuro", "inicio", "hechos", "ultimo_contacto", "ping", "rss")
+
+    def __init__(self, max_trabajos: int, heredados: list):
+        self.conn, hijo = _CTX.Pipe()
+        self.proceso = _CTX.Process(
+            target=_bucle_trabajador, args=(hijo, max_trabajos, heredados + [self.conn]), name="pool-pdf", daemon=True,
+        )
+        self.proceso.start()
+        hijo.close()
+        self.futuro = None
+        self.inicio = None
+        self.hechos = 0
+        self.ultimo_contacto = time.monotonic()
+        self.ping = None  # momento del ping sin responder
+        self.rss = 0.0
+
+    def cerrar(self, matar: bool = False) -> None:
+        try:
+            if matar:
+                self.proceso.kill()
+            else:
+                self.conn.send(("fin",))
+        except (OSError, ValueError):
+            pass
+        self.proceso.join(5)
+        if self.proceso.is_alive():
+            self.proceso.kill()
+            self.proceso.join(5)
+        self.conn.close()
+
+
+class PoolCaliente(Executor):
+    def __init__(self, trabajadores: int = TRABAJADORES, reciclar_cada: int = RECICLAR_CADA,
+                 limite_mb: int = LIMITE_MB, tiempo_maximo: float = TIEMPO_MAXIMO, precargar: bool = True):
+        self.n = max(1, trabajadores)
+        self.reciclar_cada = reciclar_cada
+        self.limite_mb = limite_mb
+        self.tiempo_maximo = tiempo_maximo
+        self.precarga = precargar_estado() if precargar else {}
+        # congelar el GC antes del primer fork: los hijos no tocan (ni copian) las páginas
+        # de los objetos del padre. Se descongela cuando cierra el último pool abierto.
+        _congelar_gc()
+        self._cola = deque()  # (futuro, funcion, args, kwargs)
+        self._lock = threading.Lock()
+        self._cerrando = False
+        self._despertar_r, self._despertar_w = _CTX.Pipe(duplex=False)
+        self._trabajadores = []
+        for _ in range(self.n):
+            self._trabajadores.append(self._nuevo())
+        self.stats = {"hechos": 0, "errores": 0, "reciclados": 0, "reemplazados": 0}
+        self.nombre = f"pool-{next(_NUMERO_POOL)}"
+        PROFUNDIDAD_COLA.medir(lambda: len(self._cola), cola=self.nombre)  # se olvida al cerrar
+        self._hilo = threading.Thread(target=self._despachar, name="pool-despachador", daemon=True)
+        self._hilo.start()
+
+    # API de Executor
+    def submit(self, funcion, /, *args, **kwargs) -> Future:
+        futuro = Future()
+        with self._lock:
+            if self._cerrando:
+                raise RuntimeError("El pool se está cerrando: no acepta trabajos nuevos")
+            self._cola.append((futuro, funcion, args, kwargs))
+        self._despertar()
+        return futuro
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Drenado: termina lo que ya está en la fila (o lo cancela) y cierra los trabajadores."""
+        with self._lock:
+            self._cerrando = True
+            if cancel_futures:
+                while self._cola:
+                    self._cola.popleft()[0].cancel()
+        self._despertar()
+        if wait:
+            self._hilo.join()
+
+    drenar = shutdown
+
+    def estado(self) -> dict:
+        with self._lock:
+            ocupados = sum(1 for t in self._trabajadores if t.futuro is not None)
+            return {
+                "trabajadores": len(self._trabajadores),
+                "ocupados": ocupados,
+                "en_cola": len(self._cola),
+                "rss_mb": [round(t.rss, 1) for t in self._trabajadores],
+                **self.stats,
+            }
+
+    def _nuevo(self) -> _Trabajador:
+        return _Trabajador(self.reciclar_cada, [t.conn for t in self._trabajadores] + [self._despertar_r, self._despertar_w])
+
+    # despachador (hilo propio)
+    def _despertar(self) -> None:
+        try:
+            self._despertar_w.send_bytes(b"")
+        except OSError:
+            pass  # ya cerrado
+
+    def _despachar(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if self._cerrando and not self._cola and all(t.futuro is None for t in self._trabajadores):
+                        break
+                self._asignar()
+                conns = {t.conn: t for t in self._trabajadores}
+                for listo in wait(list(conns) + [self._despertar_r], timeout=1.0):
+                    if listo is self._despertar_r:
+                        while self._despertar_r.poll():
+                            self._despertar_r.recv_bytes()
+                    else:
+                        self._recibir(conns[listo])
+                self._revisar_salud()
+        except BaseException as e:
+            # el despachador no debería caerse; si pasa, nadie queda esperando para siempre
+            with self._lock:
+                self._cerrando = True
+                pendientes = [f for f, _, _, _ in self._cola] + [t.futuro for t in self._trabajadores if t.futuro]
+                self._cola.clear()
+            for futuro in pendientes:
+                if not futuro.done():
+                    futuro.set_exception(ErrorTrabajador(f"Pool caído: {type(e).__name__}: {e}"))
+            raise
+        finally:
+            for t in self._trabajadores:
+                t.cerrar()
+            self._despertar_r.close()
+            self._despertar_w.close()
+            PROFUNDIDAD_COLA.olvidar(cola=self.nombre)
+            _descongelar_gc()
+
+    def _asignar(self) -> None:
+        for t in self._trabajadores:
+            if t.futuro is not None or t.ping is not None:
+                continue
+            with self._lock:
+                if not self._cola:
+                    return
+                futuro, funcion, args, kwargs = self._cola.popleft()
+            if not futuro.set_running_or_notify_cancel():
+                continue
+            try:
+                t.conn.send(("trabajo", funcion, args, kwargs))
+            except Exception as e:  # p. ej. argumentos que no se pueden serializar
+                futuro.set_exception(e)
+                continue
+            t.futuro, t.inicio = futuro, time.monotonic()
+
+    def _recibir(self, t: _Trabajador) -> None:
+        try:
+            mensaje = t.conn.recv()
+        except (EOFError, OSError):
+            self._reemplazar(t, "murio", ErrorTrabajador(f"El trabajador terminó inesperadamente (código {t.proceso.exitcode})"))
+            return
+        t.ultimo_contacto = time.monotonic()
+        if mensaje[0] == "pong":
+            t.ping, t.rss = None, mensaje[1]
+        else:
+            _, ok, valor, t.rss, ultimo = mensaje
+            futuro, t.futuro, t.inicio = t.futuro, None, None
+            t.hechos += 1
+            if ok:
+                self.stats["hechos"] += 1
+                futuro.set_result(valor)
+            else:
+                self.stats["errores"] += 1
+                futuro.set_exception(valor)
+            if ultimo:
+                self._reemplazar(t, "trabajos")
+                return
+        if self.limite_mb and t.rss > self.limite_mb and t.futuro is None:
+            self._reemplazar(t, "memoria")
+
+    def _revisar_salud(self) -> None:
+        ahora = time.monotonic()
+        for t in list(self._trabajadores):
+            if t.futuro is not None:
+                if self.tiempo_maximo and ahora - t.inicio > self.tiempo_maximo:
+                    self._reemplazar(t, "colgado", TimeoutError(f"El trabajo pasó {self.tiempo_maximo:.0f}s"))
+                elif not t.proceso.is_alive():
+                    if t.conn.poll():
+                        self._recibir(t)  # salió por reciclado con el último resultado todavía en el pipe
+                    if t in self._trabajadores:
+                        self._reemplazar(t, "murio", ErrorTrabajador(f"El trabajador terminó inesperadamente (código {t.proceso.exitcode})"))
+            elif t.ping is not None:
+                if ahora - t.ping > ESPERA_PING:
+                    self._reemplazar(t, "sin_respuesta")
+            elif ahora - t.ultimo_contacto > INTERVALO_SALUD:
+                try:
+                    t.conn.send(("ping",))
+                    t.ping = ahora
+                except OSError:
+                    self._reemplazar(t, "murio")
+
+    def _reemplazar(self, t: _Trabajador, motivo: str, error: Exception = None) -> None:
+        if t.futuro is not None:
+            t.futuro.set_exception(error or ErrorTrabajador(motivo))
+            t.futuro = None
+            self.stats["errores"] += 1
+        t.cerrar(matar=motivo != "trabajos" and motivo != "memoria")
+        REEMPLAZOS.inc(motivo=motivo)
+        self.stats["reciclados" if motivo in ("trabajos", "memoria") else "reemplazados"] += 1
+        i = self._trabajadores.index(t)
+        with self._lock:
+            hace_falta = not self._cerrando or bool(self._cola)
+        if hace_falta:
+            del self._trabajadores[i]
+            self._trabajadores.insert(i, self._nuevo())
+        else:
+            del self._trabajadores[i]
+
+
+# -------------------------
+# PRUEBA DE RENDIMIENTO
+# -------------------------
+def _pdf_de_prueba(n: int) -> int:
+    """Un PDF premium en memoria (sin caché) para una persona distinta por n. Retorna los bytes."""
+    from datetime import date, timedelta
+
+    from motor import calcular_todo
+    from pdf import build_pdf_premium
+
+    fecha = date(1950, 1, 1) + timedelta(days=n * 97)
+    return len(build_pdf_premium(calcular_todo(f"Persona Prueba {n}", fecha)))
+
+
+def _rendimiento(pdfs: int, trabajadores: int, reciclar_cada: int) -> None:
+    t0 = time.perf_counter()
+    with span("pool_precarga"):
+        pool = PoolCaliente(trabajadores, reciclar_cada)
+    print(f"Precarga en el padre: {time.perf_counter() - t0:.2f}s · " + " · ".join(f"{k}: {v:.2f}s" for k, v in pool.precarga.items()))
+
+    # render puro: mismo trabajo, en el padre ya caliente y sin pool
+    muestra = min(pdfs, 5)
+    t = time.perf_counter()
+    for n in range(muestra):
+        _pdf_de_prueba(10_000 + n)
+    puro = (time.perf_counter() - t) / muestra
+
+    def _drenar_por_senal(signum, frame):
+        print("\nDrenando (los trabajos en la fila terminan)...")
+        pool.shutdown(wait=False)
+
+    signal.signal(signal.SIGTERM, _drenar_por_senal)
+    signal.signal(signal.SIGINT, _drenar_por_senal)
+
+    t = time.perf_counter()
+    futuros = [pool.submit(_pdf_de_prueba, n) for n in range(pdfs)]
+    errores = 0
+    for f in futuros:
+        try:
+            f.result()
+        except Exception:
+            errores += 1
+    total = time.perf_counter() - t
+    estado = pool.estado()
+    pool.shutdown()
+
+    por_trabajador = total * min(trabajadores, os.cpu_count() or 1) / pdfs
+    print(f"{pdfs} PDFs en {total:.2f}s con {trabajadores} trabajadores ({pdfs / total:.1f} PDFs/s) · {errores} errores")
+    print(f"Por PDF y por núcleo: {por_trabajador * 1000:.0f} ms · render puro: {puro * 1000:.0f} ms "
+          f"({puro / por_trabajador:.0%} del ideal)")
+    print(f"Reciclados: {estado['reciclados']} · reemplazados: {estado['reemplazados']} · RSS hijos (MB): {estado['rss_mb']}")
+
+
+def _eco(n: int) -> int:
+    return n
+
+
+def _probar_reciclado(trabajos: int = 400, trabajadores: int = 3, rondas: int = 5) -> int:
+    """
+    Reciclado bajo carga: trabajadores que salen cada 1-3 trabajos mientras la fila
+    está llena. Ningún resultado se puede perder ni volver como error. Retorna los fallos.
+    """
+    fallos = 0
+    for ronda in range(rondas):
+        reciclar_cada = 1 + ronda % 3
+        pool = PoolCaliente(trabajadores, reciclar_cada, precargar=False)
+        futuros = [pool.submit(_eco, n) for n in range(trabajos)]
+        malos = []
+        for n, f in enumerate(futuros):
+            try:
+                if f.result(timeout=60) != n:
+                    malos.append(f"{n}: resultado cambiado")
+            except Exception as e:
+                malos.append(f"{n}: {type(e).__name__}: {e}")
+        estado = pool.estado()
+        pool.shutdown()
+        print(f"Reciclar cada {reciclar_cada}: {trabajos - len(malos)}/{trabajos} bien · "
+              f"reciclados {estado['reciclados']} · reemplazados {estado['reemplazados']}")
+        for m in malos[:5]:
+            print(f"  ❌ {m}")
+        fallos += len(malos) + estado["reemplazados"]
+    return fallos
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prueba de rendimiento del pool de trabajadores precalentados.")
+    parser.add_argument("--pdfs", type=int, default=40)
+    parser.add_argument("--trabajadores", type=int, default=TRABAJADORES)
+    parser.add_argument("--reciclar", type=int, default=RECICLAR_CADA, help="trabajos por trabajador antes de reciclarlo")
+    parser.add_argument("--probar-reciclado", action="store_true", help="verificar que reciclar bajo carga no pierde resultados")
+    args = parser.parse_args()
+    if args.probar_reciclado:
+        raise SystemExit(1 if _probar_reciclado() else 0)
+    _rendimiento(args.pdfs, args.trabajadores, args.reciclar)
@@ -0,0 +1,236 @@
+# =====================================================
+# TRAZAS (spans anidados) -> archivo JSONL rotativo
+# with span("nombre", atributo=valor) as s: ... s.set(bytes=len(pdf))
+# - El span padre se toma del contexto (contextvars): cada ejecución del script
+#   de Streamlit y cada hilo tienen su propia traza.
+# - Un hilo de fondo escribe los spans (la petición no espera al disco).
+# - TRAZAS=0 las desactiva (span() no hace nada).
+# Visor: python trazas.py [--lentas 10] [--arbol 3]
+# =====================================================
+import atexit
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from metricas import PROFUNDIDAD_COLA
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TRAZAS_FILE = os.getenv("TRAZAS_FILE", os.path.join(BASE_DIR, "cache", "trazas.jsonl"))
+TRAZAS_ACTIVAS = os.getenv("TRAZAS", "1") != "0"
+MAX_BYTES = 5 * 1024 * 1024  # se rota al pasar este tamaño
+ARCHIVOS_ROTADOS = 3  # trazas.jsonl.1 .. .3
+
+_ACTUAL = contextvars.ContextVar("span_actual", default=None)
+_COLA = queue.SimpleQueue()
+_LOCK = threading.Lock()
+_ESCRITOR = None
+PROFUNDIDAD_COLA.medir(_COLA.qsize, cola="trazas")
+
+
+class Span:
+    __slots__ = ("traza", "id", "padre", "nombre", "inicio", "_t0", "attrs")
+
+    def __init__(self, nombre: str, padre, attrs: dict):
+        self.traza = padre.traza if padre is not None else uuid.uuid4().hex[:16]
+        self.id = uuid.uuid4().hex[:8]
+        self.padre = padre.id if padre is not None else None
+        self.nombre = nombre
+        self.inicio = time.time()
+        self._t0 = time.perf_counter()
+        self.attrs = attrs
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+
+class _SpanNulo:
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NULO = _SpanNulo()
+
+
+@contextmanager
+def span(nombre: str, **attrs):
+    if not TRAZAS_ACTIVAS:
+        yield _NULO
+        return
+    s = Span(nombre, _ACTUAL.get(), attrs)
+    token = _ACTUAL.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        _ACTUAL.reset(token)
+        dur_ms = (time.perf_counter() - s._t0) * 1000
+        _encolar({
+            "traza": s.traza,
+            "id": s.id,
+            "padre": s.padre,
+            "nombre": s.nombre,
+            "inicio": round(s.inicio, 6),
+            "ms": round(dur_ms, 3),
+            "attrs": s.attrs,
+        })
+
+
+# -------------------------
+# ESCRITURA ASÍNCRONA + ROTACIÓN
+# -------------------------
+def _encolar(registro: dict) -> None:
+    global _ESCRITOR
+    _COLA.put(registro)
+    if _ESCRITOR is None:
+        with _LOCK:
+            if _ESCRITOR is None:
+                _ESCRITOR = threading.Thread(target=_escribir_siempre, name="trazas-jsonl", daemon=True)
+                _ESCRITOR.start()
+                atexit.register(vaciar)
+
+
+def _tras_fork() -> None:
+    # el hilo escritor no sobrevive al fork: el hijo empieza con su cola y su hilo propios
+    global _COLA, _LOCK, _ESCRITOR
+    _COLA, _LOCK, _ESCRITOR = queue.SimpleQueue(), threading.Lock(), None
+
+
+os.register_at_fork(after_in_child=_tras_fork)
+
+
+def _rotar(path: str) -> None:
+    for i in range(ARCHIVOS_ROTADOS - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def _escribir_lote(lote: list, path: str = TRAZAS_FILE) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for r in lote:
+                f.write(json.dumps(r, ensure_ascii=False, default=str))
+                f.write("\n")
+            tam = f.tell()
+        if tam > MAX_BYTES:
+            _rotar(path)
+    except:
+        # En Streamlit Cloud a veces el FS es de solo lectura
+        pass
+
+
+def _drenar(bloquear: bool) -> list:
+    lote = []
+    try:
+        lote.append(_COLA.get(block=bloquear))
+        while len(lote) < 1000:
+            lote.append(_COLA.get_nowait())
+    except queue.Empty:
+        pass
+    return lote
+
+
+def _escribir_siempre() -> None:
+    while True:
+        _escribir_lote(_drenar(bloquear=True))
+
+
+def vaciar() -> None:
+    """Escribe lo que quede en la cola (al salir del proceso, o en scripts/pruebas)."""
+    while True:
+        lote = _drenar(bloquear=False)
+        if not lote:
+            return
+        _escribir_lote(lote)
+
+
+# -------------------------
+# VISOR
+# -------------------------
+def leer_spans(path: str = TRAZAS_FILE) -> list:
+    spans = []
+    for ruta in [f"{path}.{i}" for i in range(ARCHIVOS_ROTADOS, 0, -1)] + [path]:
+        try:
+            with open(ruta, encoding="utf-8") as f:
+                for linea in f:
+                    try:
+                        spans.append(json.loads(linea))
+                    except ValueError:
+                        continue  # línea cortada por una rotación o un corte
+        except OSError:
+            continue
+    return spans
+
+
+def trazas_lentas(n: int = 10, path: str = TRAZAS_FILE) -> list:
+    """[(ms, span raíz, spans de la traza)] de las n trazas más lentas (por su span raíz)."""
+    por_traza = {}
+    for s in leer_spans(path):
+        por_traza.setdefault(s["traza"], []).append(s)
+    filas = []
+    for spans in por_traza.values():
+        raices = [s for s in spans if s["padre"] is None]
+        if raices:
+            raiz = max(raices, key=lambda s: s["ms"])
+            filas.append((raiz["ms"], raiz, spans))
+    filas.sort(key=lambda f: f[0], reverse=True)
+    return filas[:n]
+
+
+def arbol_traza(spans: list, max_hijos: int = 12) -> list:
+    """Líneas de texto con la traza en forma de árbol (hijos por orden de inicio)."""
+    hijos = {}
+    for s in spans:
+        hijos.setdefault(s["padre"], []).append(s)
+    lineas = []
+
+    def _rec(s, nivel):
+        attrs = " ".join(f"{k}={v}" for k, v in s["attrs"].items())
+        lineas.append(f"{'  ' * nivel}{s['nombre']:<{max(1, 32 - 2 * nivel)}} {s['ms']:>9.2f} ms  {attrs}")
+        ordenados = sorted(hijos.get(s["id"], []), key=lambda h: h["inicio"])
+        if len(ordenados) > max_hijos:
+            # muchos hermanos (p. ej. 60 secciones): se muestran los más lentos
+            lentos = sorted(ordenados, key=lambda h: h["ms"], reverse=True)[:max_hijos]
+            resto = len(ordenados) - max_hijos
+            ordenados = sorted(lentos, key=lambda h: h["inicio"])
+        else:
+            resto = 0
+        for h in ordenados:
+            _rec(h, nivel + 1)
+        if resto:
+            lineas.append(f"{'  ' * (nivel + 1)}... {resto} más")
+
+    for raiz in sorted(hijos.get(None, []), key=lambda s: s["inicio"]):
+        _rec(raiz, 0)
+    return lineas
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Trazas más lentas del archivo JSONL.")
+    parser.add_argument("--archivo", default=TRAZAS_FILE)
+    parser.add_argument("--lentas", type=int, default=10, help="cuántas trazas listar")
+    parser.add_argument("--arbol", type=int, default=3, help="a cuántas de ellas mostrarles el árbol")
+    parser.add_argument("--nombre", help="solo trazas cuyo span raíz se llame así")
+    args = parser.parse_args()
+
+    filas = trazas_lentas(10 ** 9, args.archivo)
+    if args.nombre:
+        filas = [f for f in filas if f[1]["nombre"] == args.nombre]
+    filas = filas[:args.lentas]
+    if not filas:
+        print("Sin trazas.")
+    for i, (ms, raiz, spans) in enumerate(filas):
+        print(f"{ms:>10.2f} ms  {raiz['nombre']:<24} {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(raiz['inicio']))}  traza={raiz['traza']}  spans={len(spans)}")
+        if i < args.arbol:
+            for linea in arbol_traza(spans):
+                print("    " + linea)